@@ -0,0 +1,72 @@
+"""
+Benchmark for the block ID generators.
+
+Reports the time each generator takes to generate a block ID, and to construct a section block without a
+``block_id``, against the default ``uuid4`` generator. The best of several rounds is reported.
+
+Usage:
+    python benchmarks/block_id.py [blocks] [rounds]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from slack_blockkit.block_id import (  # noqa: E402
+    BatchedRandomGenerator,
+    ContentHashGenerator,
+    CounterGenerator,
+    UUIDGenerator,
+    block_id_generator,
+)
+from slack_blockkit.composition_object import MarkdownTextObject  # noqa: E402
+from slack_blockkit.layout_block import SectionBlock  # noqa: E402
+
+
+def time_best(function, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    blocks = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    texts = [MarkdownTextObject(text=f"Ticket *BK-{index}*") for index in range(blocks)]
+    section = SectionBlock(text=texts[0])
+    print(f"{blocks} blocks, best of {rounds} rounds")
+
+    baseline = None
+    for generator_class in (
+        UUIDGenerator,
+        CounterGenerator,
+        BatchedRandomGenerator,
+        ContentHashGenerator,
+    ):
+
+        def generate():
+            generator = generator_class()
+            for _ in range(blocks):
+                generator(section)
+
+        def construct():
+            with block_id_generator(generator_class()):
+                for text in texts:
+                    SectionBlock(text=text)
+
+        generate_time = time_best(generate, rounds)
+        construct_time = time_best(construct, rounds)
+        baseline = baseline or (generate_time, construct_time)
+        print(
+            f"{generator_class.__name__:<22} "
+            f"{generate_time / blocks * 1e9:>6.0f} ns/id ({baseline[0] / generate_time:.1f}x uuid4), "
+            f"{construct_time / blocks * 1e9:>6.0f} ns/block ({baseline[1] / construct_time:.2f}x uuid4)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark for the block diff engine.
+
+Reports the time to diff views of increasing size in which a few blocks were changed and moved, to show the
+diff scales with the number of blocks, and the time to skip an update of an unchanged view. The best of
+several rounds is reported.
+
+Usage:
+    python benchmarks/diff.py [rounds]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from slack_blockkit.composition_object import MarkdownTextObject  # noqa: E402
+from slack_blockkit.layout_block import SectionBlock  # noqa: E402
+from slack_blockkit.utils import get_blocks  # noqa: E402
+from slack_blockkit.utils.diff import diff_blocks  # noqa: E402
+
+
+def time_best(function, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def get_view_blocks(count: int, done: int = -1) -> list:
+    return get_blocks(
+        *[
+            SectionBlock(
+                text=MarkdownTextObject(
+                    text=f"Ticket *BK-{index}*" + (" done" if index == done else "")
+                ),
+                block_id=f"ticket-{index}",
+            )
+            for index in range(count)
+        ]
+    )
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print(f"best of {rounds} rounds")
+    for count in (25, 50, 100, 200, 400):
+        old_blocks = get_view_blocks(count)
+        new_blocks = get_view_blocks(count, done=count // 2)
+        # move the first block to the end, and add one
+        new_blocks = new_blocks[1:] + new_blocks[:1] + [{"type": "divider"}]
+        unchanged = get_view_blocks(count)
+
+        diff_time = time_best(lambda: diff_blocks(old_blocks, new_blocks), rounds)
+        skip_time = time_best(lambda: diff_blocks(old_blocks, unchanged), rounds)
+        print(
+            f"{count:>4} blocks: diff {diff_time * 1e6:>7.1f} us "
+            f"({diff_time / count * 1e9:>5.0f} ns/block), "
+            f"unchanged {skip_time * 1e6:>6.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
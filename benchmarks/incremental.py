@@ -0,0 +1,99 @@
+"""
+Benchmark for incremental view rendering.
+
+Changes one section of a 100-block modal, then renders the view as a ``dict`` and as JSON, comparing a
+regular view (whose blocks are rendered with ``get_blocks``) against a memoized view, which only renders
+the changed block. The render stats of the memoized view are reported. The best of several rounds is
+reported.
+
+Usage:
+    python benchmarks/incremental.py [rounds]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from slack_blockkit.block import render_stats  # noqa: E402
+from slack_blockkit.block_element import ButtonElement  # noqa: E402
+from slack_blockkit.composition_object import (  # noqa: E402
+    MarkdownTextObject,
+    PlainTextObject,
+)
+from slack_blockkit.layout_block import SectionBlock  # noqa: E402
+from slack_blockkit.utils import get_blocks  # noqa: E402
+from slack_blockkit.view_payload import ModalViewPayload  # noqa: E402
+
+BLOCKS = 100
+
+
+def time_best(function, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def get_view() -> ModalViewPayload:
+    return ModalViewPayload(
+        title=PlainTextObject(text="Tickets"),
+        blocks=[
+            SectionBlock(
+                text=MarkdownTextObject(text=f"*BK-{index}* Fix the build"),
+                fields=[
+                    PlainTextObject(text="Open"),
+                    PlainTextObject(text=f"Assignee {index}"),
+                ],
+                accessory=ButtonElement(
+                    text=PlainTextObject(text="Close"), action_id=f"close-{index}"
+                ),
+            )
+            for index in range(BLOCKS)
+        ],
+    )
+
+
+def change(view: ModalViewPayload):
+    block = view.blocks[BLOCKS // 2]
+    block.text = MarkdownTextObject(text=block.text.text + "!")
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print(f"{BLOCKS} block modal with one changed block, best of {rounds} rounds")
+
+    view, memoized = get_view(), get_view().memoize()
+    memoized.render_json()
+
+    def render_regular():
+        change(view)
+        rendered = view.render()
+        rendered["blocks"] = get_blocks(*view.blocks)
+
+    timings = {
+        "render": (
+            time_best(render_regular, rounds),
+            time_best(lambda: change(memoized) or memoized.render(), rounds),
+        ),
+        "render_json": (
+            time_best(lambda: change(view) or view.render_json(), rounds),
+            time_best(lambda: change(memoized) or memoized.render_json(), rounds),
+        ),
+    }
+    for name, (regular, incremental) in timings.items():
+        print(
+            f"{name:<12} regular {regular * 1e6:>7.1f} us, memoized {incremental * 1e6:>7.1f} us "
+            f"({regular / incremental:.1f}x)"
+        )
+
+    change(memoized)
+    with render_stats() as stats:
+        memoized.render_json()
+    print(f"render stats: {stats.rendered} rendered, {stats.reused} reused")
+
+
+if __name__ == "__main__":
+    main()
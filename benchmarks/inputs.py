@@ -0,0 +1,115 @@
+"""
+Benchmark for extracting input values from view submissions.
+
+Extracts the values of a 20-input modal from its ``view_submission`` payload by walking the blocks of the
+view for each submission, and with an ``InputExtractor`` compiled once, and reports the time per submission.
+The best of several rounds is reported.
+
+Usage:
+    python benchmarks/inputs.py [rounds]
+"""
+import os
+import sys
+import time
+
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from slack_blockkit.block_element import (  # noqa: E402
+    DatepickerElement,
+    PlainTextInputElement,
+)
+from slack_blockkit.composition_object import PlainTextObject  # noqa: E402
+from slack_blockkit.layout_block import InputBlock  # noqa: E402
+from slack_blockkit.utils.inputs import InputExtractor  # noqa: E402
+from slack_blockkit.view_payload import ModalViewPayload  # noqa: E402
+
+INPUTS = 20
+SUBMISSIONS = 1000
+
+
+def time_best(function, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def get_view() -> ModalViewPayload:
+    blocks = []
+    for index in range(INPUTS):
+        if index % 2:
+            element = DatepickerElement(
+                action_id=f"due-{index}", placeholder=PlainTextObject(text="Due")
+            )
+        else:
+            element = PlainTextInputElement(action_id=f"title-{index}", max_length=80)
+        blocks.append(
+            InputBlock(
+                label=PlainTextObject(text=f"Field {index}"),
+                element=element,
+                block_id=f"field-{index}",
+            )
+        )
+    return ModalViewPayload(title=PlainTextObject(text="Ticket"), blocks=blocks)
+
+
+def get_payload(view: ModalViewPayload) -> dict:
+    values = {}
+    for block in view.blocks:
+        element = block.element
+        if isinstance(element, DatepickerElement):
+            state = {"type": "datepicker", "selected_date": "2020-09-01"}
+        else:
+            state = {"type": "plain_text_input", "value": "Fix the build"}
+        values[block.block_id] = {element.action_id: state}
+    return {"type": "view_submission", "view": {"state": {"values": values}}}
+
+
+def walk(view: ModalViewPayload, payload: dict) -> dict:
+    values = payload["view"]["state"]["values"]
+    extracted = {}
+    for block in view.blocks:
+        if not isinstance(block, InputBlock):
+            continue
+        element = block.element
+        state = values.get(block.block_id, {}).get(element.action_id)
+        if isinstance(element, DatepickerElement):
+            selected = state and state.get("selected_date")
+            value = date.fromisoformat(selected) if selected else None
+        elif isinstance(element, PlainTextInputElement):
+            value = state and state.get("value")
+            if value and element.max_length and len(value) > element.max_length:
+                raise AttributeError(f"{block.block_id} is too long")
+        else:
+            value = state
+        extracted[element.action_id] = value
+    return extracted
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    view = get_view()
+    payload = get_payload(view)
+    extractor = InputExtractor(view)
+    assert walk(view, payload) == extractor.extract(payload)
+    print(f"{INPUTS} input modal, {SUBMISSIONS} submissions, best of {rounds} rounds")
+
+    walked = time_best(
+        lambda: [walk(view, payload) for _ in range(SUBMISSIONS)], rounds
+    )
+    extracted = time_best(
+        lambda: [extractor.extract(payload) for _ in range(SUBMISSIONS)], rounds
+    )
+    print(f"{'walk the view':<16} {walked / SUBMISSIONS * 1e6:>6.2f} us/submission")
+    print(
+        f"{'InputExtractor':<16} {extracted / SUBMISSIONS * 1e6:>6.2f} us/submission "
+        f"({walked / extracted:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark matrix for the JSON backends.
+
+Encodes payloads built from the fixtures in ``tests/conftest.py`` with every installed JSON backend, as
+``str`` and as ``bytes``, against ``json.dumps`` of the rendered payload. The time includes rendering the
+blocks. The best of several rounds is reported.
+
+Usage:
+    python benchmarks/json_backends.py [rounds]
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "tests"))
+
+import conftest  # noqa: E402
+from slack_blockkit.composition_object import PlainTextObject  # noqa: E402
+from slack_blockkit.utils import (  # noqa: E402
+    get_available_json_backends,
+    get_blocks,
+    set_json_backend,
+    to_json,
+)
+from slack_blockkit.view_payload import ModalViewPayload  # noqa: E402
+
+BLOCK_FIXTURES = (
+    "actions_block",
+    "context_block",
+    "divider_block",
+    "file_block",
+    "image_block",
+    "input_block",
+    "section_block",
+)
+
+
+def time_best(function, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def get_fixture(name: str):
+    fixture = getattr(conftest, name)
+    # pytest fixtures cannot be called directly, so the decorated function is called instead
+    return getattr(fixture, "__wrapped__", fixture)()
+
+
+def get_payloads() -> dict:
+    message = [get_fixture(name) for name in BLOCK_FIXTURES]
+    modal = ModalViewPayload(
+        title=PlainTextObject(text="Fixtures"),
+        blocks=[get_fixture(name) for name in BLOCK_FIXTURES * 14][:100],
+    )
+    return {
+        "message (7 blocks)": message,
+        "chat.postMessage": {"channel": "C0123", "text": "Fixtures", "blocks": message},
+        "modal (100 blocks)": modal,
+    }
+
+
+def render(payload):
+    if isinstance(payload, list):
+        return get_blocks(*payload)
+    if isinstance(payload, dict):
+        return {**payload, "blocks": get_blocks(*payload["blocks"])}
+    return payload.render()
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    backends = get_available_json_backends()
+    print(f"best of {rounds} rounds, installed backends: {', '.join(backends)}")
+
+    for name, payload in get_payloads().items():
+        baseline = time_best(lambda: json.dumps(render(payload)), rounds)
+        print(f"\n{name}: json.dumps(render()) {baseline * 1e6:.1f} us")
+        for backend in backends:
+            set_json_backend(backend)
+            for as_bytes in (False, True):
+                timing = time_best(lambda: to_json(payload, as_bytes), rounds)
+                print(
+                    f"  {backend:<7} {'bytes' if as_bytes else 'str':<5} {timing * 1e6:>8.1f} us "
+                    f"({baseline / timing:.2f}x)"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark for loading rendered payloads back into blocks.
+
+Loads a rendered 100-block modal with ``from_dict``, with and without validation, and with ``from_json``,
+and reports the throughput in views and blocks per second. Then compares a handler that reads one block of
+the view and renders it again, loading the view fully and lazily. The best of several rounds is reported.
+
+Usage:
+    python benchmarks/loader.py [rounds]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from slack_blockkit.block_element import ButtonElement  # noqa: E402
+from slack_blockkit.composition_object import (  # noqa: E402
+    MarkdownTextObject,
+    PlainTextObject,
+)
+from slack_blockkit.layout_block import DividerBlock, SectionBlock  # noqa: E402
+from slack_blockkit.loader import from_dict, from_json  # noqa: E402
+from slack_blockkit.utils import get_json_backend  # noqa: E402
+from slack_blockkit.view_payload import ModalViewPayload  # noqa: E402
+
+BLOCKS = 100
+
+
+def time_best(function, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def get_view() -> ModalViewPayload:
+    blocks = []
+    for index in range(BLOCKS // 2):
+        blocks.append(
+            SectionBlock(
+                text=MarkdownTextObject(text=f"*BK-{index}* Fix the build"),
+                block_id=f"ticket-{index}",
+                fields=[
+                    PlainTextObject(text="Open"),
+                    PlainTextObject(text=f"Assignee {index}"),
+                ],
+                accessory=ButtonElement(
+                    text=PlainTextObject(text="Close"), action_id=f"close-{index}"
+                ),
+            )
+        )
+        blocks.append(DividerBlock())
+    return ModalViewPayload(title=PlainTextObject(text="Tickets"), blocks=blocks)
+
+
+def handle_view(rendered: dict, lazy: bool) -> dict:
+    view = from_dict(rendered, lazy=lazy)
+    if lazy:
+        block = view.get_block("ticket-42")
+    else:
+        block = next(block for block in view.blocks if block.block_id == "ticket-42")
+    block.text = MarkdownTextObject(text="*BK-42* Closed")
+    return view.render()
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    view = get_view()
+    rendered, rendered_json = view.render(), view.to_json(as_bytes=True)
+    assert from_dict(rendered).render() == rendered
+    print(f"{BLOCKS} block modal, best of {rounds} rounds")
+
+    for name, load in (
+        ("from_dict", lambda: from_dict(rendered)),
+        ("from_dict, validate=False", lambda: from_dict(rendered, validate=False)),
+        (f"from_json ({get_json_backend().name})", lambda: from_json(rendered_json)),
+        (
+            "from_json, validate=False",
+            lambda: from_json(rendered_json, validate=False),
+        ),
+    ):
+        timing = time_best(load, rounds)
+        print(
+            f"{name:<26} {timing * 1e6:>7.1f} us/view, {1 / timing:>6.0f} views/s, "
+            f"{BLOCKS / timing:>7.0f} blocks/s"
+        )
+
+    print("read one block and render the view again")
+    eager = time_best(lambda: handle_view(rendered, lazy=False), rounds)
+    lazy = time_best(lambda: handle_view(rendered, lazy=True), rounds)
+    print(f"{'from_dict':<26} {eager * 1e6:>7.1f} us/view")
+    print(
+        f"{'from_dict, lazy=True':<26} {lazy * 1e6:>7.1f} us/view "
+        f"({eager / lazy:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Memory benchmark for slot-based block storage.
+
+Measures the bytes allocated per instance for each block class, comparing the slot-based classes against
+the same attributes held in a per-instance ``__dict__`` (the storage used before blocks declared
+``__slots__``). Attribute values are shared between instances so only the storage itself is counted.
+
+Usage:
+    python benchmarks/memory.py
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from slack_blockkit.block_element import (  # noqa: E402
+    ButtonElement,
+    DatepickerElement,
+    OverflowElement,
+    PlainTextInputElement,
+)
+from slack_blockkit.composition_object import (  # noqa: E402
+    OptionGroupObject,
+    OptionObject,
+    PlainTextObject,
+)
+from slack_blockkit.layout_block import (  # noqa: E402
+    ActionsBlock,
+    DividerBlock,
+    SectionBlock,
+)
+
+INSTANCES = 10000
+
+
+class DictBacked:
+    """Holds block attributes in a per-instance ``__dict__``."""
+
+
+def get_slots(obj) -> dict:
+    return {name: getattr(obj, name) for name in type(obj).RENDER_FIELDS}
+
+
+def measure(factory) -> float:
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    instances = [factory() for _ in range(INSTANCES)]
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del instances
+    return size / INSTANCES
+
+
+def dict_factory(attributes: dict):
+    def factory():
+        obj = DictBacked()
+        obj.__dict__.update(attributes)
+        return obj
+
+    return factory
+
+
+def slot_factory(template):
+    cls = type(template)
+    attributes = get_slots(template)
+
+    def factory():
+        obj = cls.__new__(cls)
+        for name, value in attributes.items():
+            object.__setattr__(obj, name, value)
+        return obj
+
+    return factory
+
+
+def get_samples() -> list:
+    text = PlainTextObject(text="Option")
+    option = OptionObject(text=text, value="option")
+    return [
+        text,
+        option,
+        OptionGroupObject(label=text, options=[option]),
+        ButtonElement(text=text, action_id="button"),
+        DatepickerElement(action_id="datepicker", placeholder=text),
+        OverflowElement(action_id="overflow", options=[option, option]),
+        PlainTextInputElement(action_id="input"),
+        ActionsBlock(elements=[]),
+        DividerBlock(),
+        SectionBlock(text=text),
+    ]
+
+
+def main():
+    print(f"{'class':<24}{'__dict__':>12}{'__slots__':>12}{'saved':>10}")
+    for sample in get_samples():
+        before = measure(dict_factory(get_slots(sample)))
+        after = measure(slot_factory(sample))
+        print(
+            f"{type(sample).__name__:<24}{before:>10.0f} B{after:>10.0f} B"
+            f"{(before - after) / before:>10.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark for measuring the size of payloads.
+
+Measures the JSON size and block count of a 100-block list by rendering it with ``get_blocks`` and encoding
+the result again with ``json.dumps``, and by passing a ``PayloadSize`` to ``get_blocks`` and to
+``get_blocks_json``, for plain and memoized blocks. Splitting the list into pages by size with
+``paginate_blocks`` is timed as well, measuring the blocks and reusing the sizes recorded while rendering.
+The best of several rounds is reported.
+
+Usage:
+    python benchmarks/pagination.py [rounds]
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from slack_blockkit.block import PayloadSize  # noqa: E402
+from slack_blockkit.composition_object import (  # noqa: E402
+    MarkdownTextObject,
+    PlainTextObject,
+)
+from slack_blockkit.layout_block import (  # noqa: E402
+    ContextBlock,
+    DividerBlock,
+    SectionBlock,
+)
+from slack_blockkit.utils import get_blocks, get_blocks_json  # noqa: E402
+from slack_blockkit.utils.pagination import paginate_blocks  # noqa: E402
+
+RESULTS = 34
+
+
+def time_best(function, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def get_result_blocks() -> list:
+    blocks = []
+    for index in range(RESULTS):
+        blocks.append(
+            SectionBlock(
+                text=MarkdownTextObject(text=f"*Result {index}*\nMatched in ticket"),
+                fields=[PlainTextObject(text=f"Field {field}") for field in range(4)],
+            )
+        )
+        blocks.append(ContextBlock(elements=[PlainTextObject(text=f"#{index}")]))
+        blocks.append(DividerBlock())
+    return blocks[:-2]
+
+
+def measure_dumps(blocks: list):
+    rendered = get_blocks(*blocks)
+    return len(json.dumps(rendered)), len(rendered)
+
+
+def measure_blocks(blocks: list):
+    size = PayloadSize()
+    get_blocks(*blocks, size=size)
+    return size.bytes, size.blocks
+
+
+def measure_json(blocks: list):
+    size = PayloadSize()
+    get_blocks_json(*blocks, size=size)
+    return size.bytes, size.blocks
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    blocks = get_result_blocks()
+    memoized = [block.memoize() for block in get_result_blocks()]
+    assert measure_dumps(blocks) == measure_json(blocks) == measure_json(memoized)
+    assert measure_blocks(blocks) == measure_blocks(memoized) == measure_json(blocks)
+    print(
+        f"{len(blocks)} blocks, {measure_json(blocks)[0]} bytes, "
+        f"best of {rounds} rounds"
+    )
+
+    for name, function in (
+        ("get_blocks + json.dumps", measure_dumps),
+        ("get_blocks(size=)", measure_blocks),
+        ("get_blocks_json(size=)", measure_json),
+    ):
+        for label, values in (("plain", blocks), ("memoized", memoized)):
+            timing = time_best(lambda: function(values), rounds)
+            print(f"{name:<24} {label:<9} {timing * 1e6:>8.0f} us")
+
+    size = PayloadSize()
+    get_blocks_json(*memoized, size=size)
+    max_bytes = size.bytes // 3
+    pages = paginate_blocks(blocks, max_bytes=max_bytes)
+    for label, function in (
+        ("measured", lambda: paginate_blocks(memoized, max_bytes=max_bytes)),
+        ("size=", lambda: paginate_blocks(memoized, max_bytes=max_bytes, size=size)),
+    ):
+        timing = time_best(function, rounds)
+        print(
+            f"paginate_blocks into {len(pages)} pages, {label:<9} {timing * 1e6:>8.0f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
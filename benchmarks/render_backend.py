@@ -0,0 +1,128 @@
+"""
+Benchmark for the render backends.
+
+Renders synthetic trees with the recursive and iterative backends: a wide tree of 100 option groups of 100
+options each, and a deep chain of sections nested as accessories. The recursive backend cannot render
+chains deeper than the recursion limit, so the deep tree is kept below it for the comparison. Also renders
+sections holding large pre-rendered option lists with the recursive and copy free backends. The best of
+several rounds is reported.
+
+Usage:
+    python benchmarks/render_backend.py [rounds]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from slack_blockkit.block import (  # noqa: E402
+    RENDER_COPY_FREE,
+    RENDER_ITERATIVE,
+    RENDER_RECURSIVE,
+    render_backend,
+)
+from slack_blockkit.block_element import RadioButtonGroupElement  # noqa: E402
+from slack_blockkit.composition_object import (  # noqa: E402
+    OptionGroupObject,
+    OptionObject,
+    PlainTextObject,
+)
+from slack_blockkit.layout_block import ContextBlock, SectionBlock  # noqa: E402
+from slack_blockkit.validation import VALIDATION_OFF, validation_mode  # noqa: E402
+
+
+def time_best(function, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def get_wide_tree() -> ContextBlock:
+    # option groups are not valid context elements, so the tree is built without validation
+    with validation_mode(VALIDATION_OFF):
+        return ContextBlock(
+            elements=[
+                OptionGroupObject(
+                    label=PlainTextObject(text=f"Group {group}"),
+                    options=[
+                        OptionObject(
+                            text=PlainTextObject(text=f"Option {option}"),
+                            value=f"{group}-{option}",
+                        )
+                        for option in range(100)
+                    ],
+                )
+                for group in range(100)
+            ]
+        )
+
+
+def get_deep_tree(depth: int) -> SectionBlock:
+    block = SectionBlock(text=PlainTextObject(text="0"))
+    for index in range(1, depth):
+        block = SectionBlock(text=PlainTextObject(text=str(index)), accessory=block)
+    return block
+
+
+def get_pre_rendered_blocks() -> list:
+    options = [
+        OptionObject(text=PlainTextObject(text=f"Option {option}"), value=str(option))
+        for option in range(1000)
+    ]
+    rendered_options = [option.render() for option in options]
+    return [
+        SectionBlock(
+            text=PlainTextObject(text=f"Question {index}"),
+            accessory=RadioButtonGroupElement(
+                action_id=f"answer-{index}", options=rendered_options
+            ),
+        )
+        for index in range(20)
+    ]
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"best of {rounds} rounds")
+    for name, tree, nodes in (
+        ("wide 100x100", get_wide_tree(), 1 + 100 * 2 + 100 * 100 * 2),
+        ("deep 300", get_deep_tree(300), 300 * 2),
+    ):
+        timings = {}
+        for backend in (RENDER_RECURSIVE, RENDER_ITERATIVE):
+            with render_backend(backend):
+                timings[backend] = time_best(tree.render, rounds)
+        recursive, iterative = timings[RENDER_RECURSIVE], timings[RENDER_ITERATIVE]
+        print(
+            f"{name:<13} recursive {recursive * 1e3:>6.2f} ms, iterative {iterative * 1e3:>6.2f} ms "
+            f"({recursive / iterative:.2f}x, {iterative / nodes * 1e9:.0f} ns/block)"
+        )
+
+    deep = get_deep_tree(20000)
+    with render_backend(RENDER_ITERATIVE):
+        iterative = time_best(deep.render, rounds)
+    print(f"deep 20000    iterative {iterative * 1e3:>6.2f} ms (recursive fails)")
+
+    blocks = get_pre_rendered_blocks()
+
+    def render_blocks():
+        for block in blocks:
+            block.render()
+
+    timings = {}
+    for backend in (RENDER_RECURSIVE, RENDER_COPY_FREE):
+        with render_backend(backend):
+            timings[backend] = time_best(render_blocks, rounds)
+    recursive, copy_free = timings[RENDER_RECURSIVE], timings[RENDER_COPY_FREE]
+    print(
+        f"pre-rendered  recursive {recursive * 1e3:>6.2f} ms, copy free {copy_free * 1e3:>6.2f} ms "
+        f"({recursive / copy_free:.0f}x, 20 sections of 1000 options)"
+    )
+
+
+if __name__ == "__main__":
+    main()
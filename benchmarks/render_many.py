@@ -0,0 +1,121 @@
+"""
+Benchmark for rendering a batch of messages from a template.
+
+Compares building and rendering a block tree for every recipient with ``get_blocks`` against filling in a
+template once per recipient with ``render_many``.
+
+Usage:
+    python benchmarks/render_many.py [recipients]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from slack_blockkit.block_element import (  # noqa: E402
+    ImageElement,
+    PrimaryButtonElement,
+)
+from slack_blockkit.composition_object import (  # noqa: E402
+    MarkdownTextObject,
+    PlainTextObject,
+)
+from slack_blockkit.layout_block import (  # noqa: E402
+    ActionsBlock,
+    ContextBlock,
+    DividerBlock,
+    SectionBlock,
+)
+from slack_blockkit.utils import get_blocks  # noqa: E402
+from slack_blockkit.utils.template import BlockTemplate, render_many  # noqa: E402
+
+
+def get_digest_blocks(user: str, tickets: str, url: str) -> list:
+    return [
+        SectionBlock(
+            text=MarkdownTextObject(
+                text=f"Good morning {user}, you have *{tickets}* open tickets"
+            ),
+            accessory=ImageElement(
+                image_url="https://codedevils.org/static/img/logo.png", alt_text="Logo"
+            ),
+        ),
+        DividerBlock(),
+        SectionBlock(
+            text=MarkdownTextObject(
+                text="Tickets are sorted by priority, oldest first."
+            ),
+            fields=[
+                MarkdownTextObject(text="*Priority*"),
+                MarkdownTextObject(text="*Age*"),
+            ],
+        ),
+        ActionsBlock(
+            elements=[
+                PrimaryButtonElement(
+                    text=PlainTextObject(text="Open tickets"),
+                    action_id="open-tickets",
+                    url=url,
+                    value=user,
+                )
+            ]
+        ),
+        DividerBlock(),
+        ContextBlock(
+            elements=[MarkdownTextObject(text="Sent by the CodeDevils ticket bot")]
+        ),
+    ]
+
+
+def get_rows(recipients: int) -> list:
+    return [
+        {
+            "user": f"user{index}",
+            "tickets": str(index % 17),
+            "url": f"https://codedevils.org/tickets?user=user{index}",
+        }
+        for index in range(recipients)
+    ]
+
+
+def naive(rows: list) -> list:
+    return [get_blocks(*get_digest_blocks(**row)) for row in rows]
+
+
+def templated(rows: list) -> list:
+    template = BlockTemplate(*get_digest_blocks("$user", "$tickets", "$url"))
+    return list(render_many(template, rows))
+
+
+def measure(func, rows: list) -> float:
+    start = time.perf_counter()
+    func(rows)
+    return time.perf_counter() - start
+
+
+def main():
+    recipients = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    rows = get_rows(recipients)
+
+    # both approaches produce the same messages, other than the generated block IDs
+    first_naive, first_templated = naive(rows[:1])[0], templated(rows[:1])[0]
+    for block in first_naive + first_templated:
+        block.pop("block_id")
+    assert first_naive == first_templated
+
+    naive_time = measure(naive, rows)
+    templated_time = measure(templated, rows)
+    print(f"{recipients} recipients")
+    print(
+        f"get_blocks loop: {naive_time:.3f} s "
+        f"({naive_time / recipients * 1e6:.1f} us/message)"
+    )
+    print(
+        f"render_many:     {templated_time:.3f} s "
+        f"({templated_time / recipients * 1e6:.1f} us/message, {naive_time / templated_time:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark for routing interaction payloads.
+
+Resolves the action of a ``block_actions`` payload to the element it came from in a 100-block view, by
+scanning the blocks for its ``block_id`` and ``action_id`` and with a ``Router``, and reports the time per
+action. The best of several rounds is reported.
+
+Usage:
+    python benchmarks/router.py [rounds]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from slack_blockkit.block_element import ButtonElement, OverflowElement  # noqa: E402
+from slack_blockkit.composition_object import (  # noqa: E402
+    OptionObject,
+    PlainTextObject,
+)
+from slack_blockkit.layout_block import ActionsBlock  # noqa: E402
+from slack_blockkit.utils.router import Router  # noqa: E402
+from slack_blockkit.view_payload import HomeViewPayload  # noqa: E402
+
+BLOCKS = 100
+ACTIONS = 1000
+
+
+def time_best(function, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def get_view() -> HomeViewPayload:
+    options = [
+        OptionObject(text=PlainTextObject(text=text), value=text)
+        for text in ("Assign", "Snooze")
+    ]
+    blocks = [
+        ActionsBlock(
+            elements=[
+                ButtonElement(
+                    text=PlainTextObject(text="Close"),
+                    action_id="close",
+                    value=str(index),
+                ),
+                OverflowElement(action_id="more", options=options),
+            ],
+            block_id=f"ticket-{index}",
+        )
+        for index in range(BLOCKS)
+    ]
+    return HomeViewPayload(title=None, blocks=blocks)
+
+
+def scan(view: HomeViewPayload, action: dict):
+    for block in view.blocks:
+        if block.block_id == action["block_id"]:
+            for element in block.elements:
+                if element.action_id == action["action_id"]:
+                    return element
+    return None
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    view = get_view()
+    router = Router()
+    router.add_blocks(view)
+    actions = [
+        {"action_id": "more", "block_id": f"ticket-{index % BLOCKS}"}
+        for index in range(ACTIONS)
+    ]
+    for action in actions:
+        assert scan(view, action) is router.resolve(action).element
+    print(f"{BLOCKS} block view, {ACTIONS} actions, best of {rounds} rounds")
+
+    scanned = time_best(lambda: [scan(view, action) for action in actions], rounds)
+    routed = time_best(lambda: [router.resolve(action) for action in actions], rounds)
+    print(f"{'scan':<8} {scanned / ACTIONS * 1e6:>6.2f} us/action")
+    print(
+        f"{'Router':<8} {routed / ACTIONS * 1e6:>6.2f} us/action "
+        f"({scanned / routed:.1f}x)"
+    )
+
+    indexed = time_best(lambda: Router().add_blocks(view), rounds)
+    print(f"indexing the view with add_blocks: {indexed * 1e6:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
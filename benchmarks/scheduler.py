@@ -0,0 +1,87 @@
+"""
+Benchmark for coalescing home tab updates with the send scheduler.
+
+Simulates 20 users whose home tabs change 50 times a second for half a second, publishing every version
+directly with ``AsyncSender`` and through a ``SendScheduler``, against a local fake Slack server with
+``views.publish`` limited to 200 calls a second. Reports the calls made, the updates dropped and how long
+it took for every user to see their latest home tab.
+
+Usage:
+    python benchmarks/scheduler.py
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from slack_blockkit.composition_object import PlainTextObject  # noqa: E402
+from slack_blockkit.layout_block import SectionBlock  # noqa: E402
+from slack_blockkit.utils.scheduler import SendScheduler  # noqa: E402
+from slack_blockkit.utils.sender import VIEWS_PUBLISH, AsyncSender  # noqa: E402
+from slack_blockkit.utils.testing import FakeSlackServer  # noqa: E402
+from slack_blockkit.view_payload import HomeViewPayload  # noqa: E402
+
+USERS = 20
+UPDATES_PER_SECOND = 50
+SECONDS = 0.5
+RATE_LIMIT = (200 * 60, 10)
+
+
+def get_view(user: int, version: int) -> HomeViewPayload:
+    text = PlainTextObject(text=f"User {user}, version {version}")
+    return HomeViewPayload(title=None, blocks=[SectionBlock(text=text)])
+
+
+async def produce(publish):
+    # every user's home tab changes at the same rate
+    for version in range(int(UPDATES_PER_SECOND * SECONDS)):
+        for user in range(USERS):
+            publish(f"U{user}", get_view(user, version))
+        await asyncio.sleep(1 / UPDATES_PER_SECOND)
+
+
+async def send_directly(sender: AsyncSender):
+    tasks = []
+    await produce(
+        lambda user_id, view: tasks.append(
+            asyncio.ensure_future(sender.publish_view(user_id, view))
+        )
+    )
+    await asyncio.gather(*tasks)
+
+
+async def send_scheduled(sender: AsyncSender):
+    async with SendScheduler(sender) as scheduler:
+        await produce(scheduler.publish_view)
+    return scheduler.stats
+
+
+async def run(send) -> None:
+    async with FakeSlackServer() as server:
+        async with AsyncSender(
+            token="xoxb-test", url=server.url, rate_limits={VIEWS_PUBLISH: RATE_LIMIT}
+        ) as sender:
+            start = time.perf_counter()
+            stats = await send(sender)
+            timing = time.perf_counter() - start
+        dropped = stats.coalesced if stats else 0
+        print(
+            f"{send.__name__:<15} {len(server.requests):>5} calls, "
+            f"{dropped:>5} dropped, latest home tabs after {timing:.2f} s"
+        )
+
+
+def main():
+    updates = int(UPDATES_PER_SECOND * SECONDS) * USERS
+    print(
+        f"{USERS} users, {updates} updates over {SECONDS} s, "
+        f"views.publish limited to {RATE_LIMIT[0] // 60} calls/s"
+    )
+    asyncio.run(run(send_directly))
+    asyncio.run(run(send_scheduled))
+
+
+if __name__ == "__main__":
+    main()
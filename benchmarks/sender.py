@@ -0,0 +1,112 @@
+"""
+Benchmark for sending views with the asyncio sender.
+
+Publishes 500 home tabs to a local fake Slack server with ``AsyncSender``, whose pooled connections are
+kept alive, and by opening a new connection for each call, and reports the calls per second. Rate limits
+are lifted so only the HTTP handling is measured. The best of several rounds is reported.
+
+Usage:
+    python benchmarks/sender.py [rounds]
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from slack_blockkit.composition_object import PlainTextObject  # noqa: E402
+from slack_blockkit.layout_block import SectionBlock  # noqa: E402
+from slack_blockkit.utils import to_json  # noqa: E402
+from slack_blockkit.utils.sender import (  # noqa: E402
+    VIEWS_PUBLISH,
+    AsyncSender,
+    ConnectionPool,
+)
+from slack_blockkit.utils.testing import FakeSlackServer  # noqa: E402
+from slack_blockkit.view_payload import HomeViewPayload  # noqa: E402
+
+CALLS = 500
+MAX_CONNECTIONS = 10
+
+
+async def time_best(function, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def get_calls() -> list:
+    return [
+        (
+            VIEWS_PUBLISH,
+            {
+                "user_id": f"U{index}",
+                "view": HomeViewPayload(
+                    title=None,
+                    blocks=[SectionBlock(text=PlainTextObject(text=f"User {index}"))],
+                ),
+            },
+        )
+        for index in range(CALLS)
+    ]
+
+
+async def send_pooled(url: str, calls: list):
+    rate_limits = {VIEWS_PUBLISH: (1e9, CALLS)}
+    async with AsyncSender(
+        token="xoxb-test",
+        url=url,
+        max_connections=MAX_CONNECTIONS,
+        rate_limits=rate_limits,
+    ) as sender:
+        await sender.send_many(calls)
+
+
+async def send_unpooled(url: str, calls: list):
+    pool = ConnectionPool(url)
+    semaphore = asyncio.Semaphore(MAX_CONNECTIONS)
+
+    async def send(method: str, payload: dict):
+        body = to_json(payload, as_bytes=True)
+        head = (
+            f"POST {pool.path}{method} HTTP/1.1\r\nHost: {pool.host}\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n"
+        ).encode()
+        async with semaphore:
+            connection = await pool.connect()
+            try:
+                await connection.request(head, body)
+            finally:
+                connection.close()
+
+    await asyncio.gather(*(send(method, payload) for method, payload in calls))
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    calls = get_calls()
+    print(
+        f"{CALLS} views.publish calls, {MAX_CONNECTIONS} connections, "
+        f"best of {rounds} rounds"
+    )
+
+    async def run(send) -> float:
+        async with FakeSlackServer() as server:
+            timing = await time_best(lambda: send(server.url, calls), rounds)
+            print(
+                f"{send.__name__:<14} {CALLS / timing:>7.0f} calls/s, "
+                f"{server.connections:>5} connections"
+            )
+            return timing
+
+    unpooled = asyncio.run(run(send_unpooled))
+    pooled = asyncio.run(run(send_pooled))
+    print(f"pooled is {unpooled / pooled:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
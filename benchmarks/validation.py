@@ -0,0 +1,135 @@
+"""
+Benchmark for constructing blocks in each validation mode.
+
+Builds the same messages with validation ``eager``, ``deferred`` and ``off``, and reports the constructor
+throughput of each. Messages are built in rounds and discarded after each round, so the timings are not
+skewed by garbage collection of an ever-growing heap; the best round is reported. For ``deferred``, the
+time to validate the messages when they are rendered is reported separately, since that is where the
+checks are moved to. Finally, the time to validate whole messages in one pass with ``validate_blocks`` is
+reported, both for the blocks and for their rendered dicts.
+
+Usage:
+    python benchmarks/validation.py [messages] [rounds]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from slack_blockkit.block import validate_pending  # noqa: E402
+from slack_blockkit.block_element import (  # noqa: E402
+    ImageElement,
+    OverflowElement,
+    PrimaryButtonElement,
+)
+from slack_blockkit.composition_object import (  # noqa: E402
+    MarkdownTextObject,
+    OptionObject,
+    PlainTextObject,
+)
+from slack_blockkit.layout_block import (  # noqa: E402
+    ActionsBlock,
+    ContextBlock,
+    DividerBlock,
+    SectionBlock,
+)
+from slack_blockkit.utils import get_blocks, validate_blocks  # noqa: E402
+from slack_blockkit.validation import (  # noqa: E402
+    VALIDATION_DEFERRED,
+    VALIDATION_MODES,
+    VALIDATION_OFF,
+    validation_mode,
+)
+
+# blocks and composition objects constructed for each message
+OBJECTS_PER_MESSAGE = 18
+
+
+def get_message_blocks(index: int) -> list:
+    return [
+        SectionBlock(
+            text=MarkdownTextObject(text=f"Ticket *BK-{index}* was assigned to you"),
+            accessory=ImageElement(
+                image_url="https://codedevils.org/static/img/logo.png", alt_text="Logo"
+            ),
+        ),
+        DividerBlock(block_id=f"divider-{index}"),
+        SectionBlock(
+            text=PlainTextObject(text="Choose what to do next"),
+            accessory=OverflowElement(
+                action_id=f"overflow-{index}",
+                options=[
+                    OptionObject(text=PlainTextObject(text=label), value=label)
+                    for label in ("snooze", "reassign", "close")
+                ],
+            ),
+        ),
+        ActionsBlock(
+            elements=[
+                PrimaryButtonElement(
+                    text=PlainTextObject(text="Open ticket"),
+                    action_id=f"open-{index}",
+                    url=f"https://codedevils.org/tickets/BK-{index}",
+                    value=str(index),
+                )
+            ],
+            block_id=f"actions-{index}",
+        ),
+        ContextBlock(
+            elements=[MarkdownTextObject(text="Sent by the CodeDevils ticket bot")],
+            block_id=f"context-{index}",
+        ),
+    ]
+
+
+def build_round(messages: int) -> tuple:
+    start = time.perf_counter()
+    built = [get_message_blocks(index) for index in range(messages)]
+    construct_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    validate_pending(built)
+    return construct_time, time.perf_counter() - start
+
+
+def main():
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+    objects = messages * OBJECTS_PER_MESSAGE
+    print(f"{messages} messages, {objects} objects per round, best of {rounds} rounds")
+
+    baseline = None
+    for mode in VALIDATION_MODES:
+        with validation_mode(mode):
+            timings = [build_round(messages) for _ in range(rounds)]
+        construct_time = min(construct for construct, _ in timings)
+        validate_time = min(validate for _, validate in timings)
+
+        baseline = baseline or construct_time
+        print(
+            f"{mode:<9} {objects / construct_time / 1e6:.2f}M objects/s "
+            f"({construct_time * 1e3:.1f} ms, {baseline / construct_time:.2f}x eager)"
+        )
+        if mode == VALIDATION_DEFERRED:
+            print(f"{'':<9} + {validate_time * 1e3:.1f} ms to validate when rendered")
+
+    with validation_mode(VALIDATION_OFF):
+        built = [get_message_blocks(index) for index in range(messages)]
+    payloads = {"blocks": built, "dicts": [get_blocks(*blocks) for blocks in built]}
+    for name, payload in payloads.items():
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for blocks in payload:
+                validate_blocks(*blocks)
+            timings.append(time.perf_counter() - start)
+        validate_time = min(timings)
+        print(
+            f"validate_blocks on {name:<6} {objects / validate_time / 1e6:.2f}M objects/s "
+            f"({validate_time * 1e3:.1f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    main()
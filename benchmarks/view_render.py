@@ -0,0 +1,77 @@
+"""
+Benchmark for rendering large views.
+
+Compares rendering a 100-block modal in two passes, rendering its blocks with ``get_blocks`` before building
+and rendering the view, against building the view from the blocks and rendering it in one pass. The best
+of several rounds is reported.
+
+Usage:
+    python benchmarks/view_render.py [rounds]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from slack_blockkit.block_element import ButtonElement  # noqa: E402
+from slack_blockkit.composition_object import (  # noqa: E402
+    MarkdownTextObject,
+    PlainTextObject,
+)
+from slack_blockkit.layout_block import DividerBlock, SectionBlock  # noqa: E402
+from slack_blockkit.utils import get_blocks  # noqa: E402
+from slack_blockkit.view_payload import ModalViewPayload  # noqa: E402
+
+BLOCKS = 100
+
+
+def time_best(function, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def get_blocks_list() -> list:
+    blocks = []
+    for index in range(BLOCKS // 2):
+        blocks.append(
+            SectionBlock(
+                text=MarkdownTextObject(text=f"*BK-{index}* Fix the build"),
+                fields=[
+                    PlainTextObject(text="Open"),
+                    PlainTextObject(text=f"Assignee {index}"),
+                ],
+                accessory=ButtonElement(
+                    text=PlainTextObject(text="Close"), action_id=f"close-{index}"
+                ),
+            )
+        )
+        blocks.append(DividerBlock())
+    return blocks
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    blocks = get_blocks_list()
+    title = PlainTextObject(text="Tickets")
+    print(f"{BLOCKS} block modal, best of {rounds} rounds")
+
+    def two_pass():
+        return ModalViewPayload(title=title, blocks=get_blocks(*blocks)).render()
+
+    def fused():
+        return ModalViewPayload(title=title, blocks=blocks).render()
+
+    assert two_pass() == fused()
+    two_pass_time = time_best(two_pass, rounds)
+    fused_time = time_best(fused, rounds)
+    print(f"two pass {two_pass_time * 1e6:>7.1f} us")
+    print(f"fused    {fused_time * 1e6:>7.1f} us ({two_pass_time / fused_time:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
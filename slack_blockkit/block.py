@@ -1,5 +1,108 @@
+import io
+import json
+import threading
+import weakref
+
+from contextlib import contextmanager
+from functools import partial
+from types import MemberDescriptorType
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    overload,
+)
+
+from .schema import FIELD_CHECKERS, Constraint
+from .validation import ValidationError, pending_validation, validate_on_init
+
+# the C encoder json.dumps uses for ASCII strings, which the type stubs of the json module do not declare
+encode_basestring_ascii: Callable[[str], str] = getattr(
+    json.encoder, "encode_basestring_ascii"
+)
+
+# attribute types that are copied into the rendered dict as-is
+SCALAR_TYPES = (str, bool, int, float)
+# annotations of scalar attributes, which may also be None when the attribute is not used
+SCALAR_HINTS = SCALAR_TYPES + tuple(Optional[scalar] for scalar in SCALAR_TYPES)
+
+RenderPlan = Tuple[Tuple[str, str, bool], ...]
+
+# compiled render plans, keyed by class
+_render_plans: Dict[type, RenderPlan] = {}
+
+# whether a class overrides render(), keyed by class
+_custom_renders: Dict[type, bool] = {}
+
+# JSON fragments for rendered keys, keyed by the key name
+_json_keys: Dict[str, str] = {}
+
+# generated memoized and frozen block classes, keyed by block class and variant
+_variant_classes: Dict[Tuple[type, type], type] = {}
+
+# the render stats being collected and the render backend set by render_backend() in each thread
+_local = threading.local()
+
+# whether render stats were ever collected, so memoized renders can skip recording them
+render_stats_used = False
+
+RENDER_RECURSIVE = "recursive"
+RENDER_ITERATIVE = "iterative"
+RENDER_COPY_FREE = "copy_free"
+RENDER_BACKENDS = (RENDER_RECURSIVE, RENDER_ITERATIVE, RENDER_COPY_FREE)
+
+_default_backend = RENDER_RECURSIVE
+
+# whether a render backend was ever selected, so render() can skip looking it up
+render_backend_used = False
+
+
 class RenderMixin:
-    """Provides a render method for blocks and similar payload structures."""
+    """
+    Provides a render method for blocks and similar payload structures.
+
+    Classes using this mixin list the attributes to render in ``RENDER_FIELDS``, in the order in which they
+    appear in the rendered ``dict``. Subclasses that declare neither ``RENDER_FIELDS`` nor ``__slots__``, such
+    as blocks defined by users of this package, render every attribute they have instead (see
+    :class:`VarsRenderPlan`).
+    """
+
+    __slots__ = ()
+
+    RENDER_FIELDS: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "RENDER_FIELDS" not in cls.__dict__ and "__slots__" not in cls.__dict__:
+            cls.get_render_plan = VarsRenderPlan()  # type: ignore
+            # attributes the package's classes keep in slots are kept in the __dict__ of these classes
+            # instead, so every attribute is rendered in the order in which it was set
+            for name in cls.RENDER_FIELDS:
+                if isinstance(getattr(cls, name, None), MemberDescriptorType):
+                    setattr(cls, name, None)
+
+    @classmethod
+    def get_render_plan(cls) -> RenderPlan:
+        """
+        Returns the render plan for this class, compiling it on first use. The plan is a tuple of
+        ``(attribute, key, nested)`` entries, where ``key`` is the name used in the rendered ``dict`` and
+        ``nested`` is whether the attribute may hold blocks that need rendering.
+
+        Returns:
+            RenderPlan: The compiled render plan for the class.
+        """
+        plan = _render_plans.get(cls)
+        if plan is None:
+            plan = _render_plans[cls] = compile_render_plan(cls)
+        return plan
 
     def render(self) -> dict:
         """
@@ -7,56 +110,716 @@ class RenderMixin:
 
         Returns:
             dict: The block as a dict.
+        Raises:
+            ValidationError: If the block was constructed in ``deferred`` validation mode and it, or any block
+                within it, is not valid.
+        """
+        if pending_validation and id(self) in pending_validation:
+            validate_pending(self)
+        if render_backend_used:
+            backend = get_render_backend()
+            if backend == RENDER_ITERATIVE:
+                return render_iterative(self)
+            if backend == RENDER_COPY_FREE:
+                return render_copy_free(self)
+
+        rendered = {}
+        for name, key, nested in self.get_render_plan():
+            value = getattr(self, name, None)
+            if value is None:
+                continue
+            if nested or value.__class__ not in SCALAR_TYPES:
+                value = render_value(value)
+            rendered[key] = value
+        return rendered
+
+    def write_json(self, write: Callable[[str], None]):
+        """
+        Writes the block as JSON using ``write``, without rendering it into a ``dict`` first. The output is
+        the same as ``json.dumps(self.render())``. Blocks of classes that override ``render()`` are encoded
+        from its output instead.
+
+        Args:
+            write (Callable[[str], None]): Called with each fragment of JSON text, in order.
+        """
+        if has_custom_render(self.__class__):
+            write(json_encoder.encode(self.render()))
+            return
+
+        separator = "{"
+        for name, key, _ in self.get_render_plan():
+            value = getattr(self, name, None)
+            if value is None:
+                continue
+            json_key = _json_keys.get(key)
+            if json_key is None:
+                json_key = _json_keys[key] = encode_basestring_ascii(key) + ": "
+
+            # strings and booleans are by far the most common values, so they are encoded inline
+            if value.__class__ is str:
+                write(separator + json_key + encode_basestring_ascii(value))
+            elif value.__class__ is bool:
+                write(separator + json_key + ("true" if value else "false"))
+            else:
+                write(separator + json_key)
+                if isinstance(value, RenderMixin):
+                    value.write_json(write)
+                else:
+                    write_json(value, write)
+            separator = ", "
+        write("{}" if separator == "{" else "}")
+
+    @overload
+    def render_json(self, fp: None = None) -> str:
+        ...
+
+    @overload
+    def render_json(self, fp: IO) -> None:
+        ...
+
+    def render_json(self, fp=None) -> Optional[str]:
+        """
+        Renders the block as a JSON string. See :func:`dump_json`.
+
+        Args:
+            fp: Optional; A text or binary file-like object to write the JSON to.
+        Returns:
+            str: The block as JSON, or ``None`` if it was written to ``fp``.
+        """
+        return dump_json(self, fp)
+
+    def to_json(self, as_bytes: bool = False) -> Union[str, bytes]:
+        """
+        Renders the block as compact JSON with the fastest JSON library installed. See
+        :func:`slack_blockkit.utils.to_json`.
+
+        Args:
+            as_bytes (bool): If ``True``, return UTF-8 ``bytes`` instead of a ``str``. Defaults to ``False``.
+        Returns:
+            Union[str, bytes]: The block as JSON.
+        """
+        from slack_blockkit.utils.serialization import to_json
+
+        return to_json(self, as_bytes)
+
+
+def has_custom_render(cls) -> bool:
+    """
+    Returns whether a block class, or the class a memoized or frozen variant was generated from, overrides
+    :meth:`RenderMixin.render`. Such blocks cannot be rendered from their render plan alone.
+
+    Args:
+        cls: The block class.
+    Returns:
+        bool: Whether the class overrides ``render()``.
+    """
+    custom = _custom_renders.get(cls)
+    if custom is None:
+        block_class = getattr(cls, "BLOCK_CLASS", cls)
+        custom = _custom_renders[cls] = block_class.render is not RenderMixin.render
+    return custom
+
+
+class VarsRenderPlan:
+    """
+    The ``get_render_plan`` of classes that declare neither ``RENDER_FIELDS`` nor ``__slots__``. Their
+    attributes are only known once they are set, so the plan of an instance has every attribute of the
+    instance, in the order in which they were set, with ``type`` last. The plan of the class itself has only
+    the ``RENDER_FIELDS`` it inherits. Neither is cached.
+    """
+
+    def __get__(self, block, cls) -> Callable[[], RenderPlan]:
+        if block is None:
+            return partial(compile_render_plan, cls)
+        return partial(get_vars_render_plan, block)
+
+
+def get_vars_render_plan(block) -> RenderPlan:
+    """
+    Returns the render plan of a block with the attributes in its ``__dict__``, in the order in which they
+    were set. The attributes of the package's classes it inherits from are set together by their
+    ``__init__``, so they are rendered together in the order of their ``RENDER_FIELDS``, where the first of
+    them was set. Every attribute is treated as nested, since their types are not declared.
+
+    Args:
+        block: The block.
+    Returns:
+        RenderPlan: The render plan.
+    """
+    inherited = type(block).RENDER_FIELDS
+    names = list(vars(block))
+    position = next(
+        (index for index, name in enumerate(names) if name in inherited), len(names)
+    )
+    own = [name for name in names if name not in inherited]
+    # type is a reserved keyword, so btype is rendered as type at the end of the dict
+    names = own[:position] + [name for name in inherited if name != "btype"]
+    names += own[position:] + ["btype"]
+    return tuple((name, "type" if name == "btype" else name, True) for name in names)
+
+
+def compile_render_plan(cls) -> RenderPlan:
+    """
+    Builds the render plan for a class from its ``RENDER_FIELDS`` and the annotations on the ``__init__``
+    methods of the class hierarchy. Attributes annotated as plain ``str``, ``bool``, ``int`` or ``float``, or as
+    ``Optional`` of one of them, are marked as scalars; everything else is considered nested.
+
+    Args:
+        cls: The class to build the render plan for.
+    Returns:
+        RenderPlan: The render plan.
+    """
+    annotations: Dict[str, object] = {}
+    for klass in cls.__mro__:
+        for name, hint in getattr(klass.__init__, "__annotations__", {}).items():
+            annotations.setdefault(name, hint)
+
+    # type is a reserved keyword, so btype is rendered as type at the end of the dict
+    fields = [name for name in cls.RENDER_FIELDS if name != "btype"]
+    if "btype" in cls.RENDER_FIELDS:
+        fields.append("btype")
+
+    return tuple(
+        (
+            name,
+            "type" if name == "btype" else name,
+            annotations.get(name) not in SCALAR_HINTS,
+        )
+        for name in fields
+    )
+
+
+def render_nested(value):
+    """
+    Renders blocks found while encoding values that are not streamed, such as blocks nested in a ``dict``.
+    """
+    if isinstance(value, RenderMixin):
+        return value.render()
+    raise TypeError(
+        f"Object of type {value.__class__.__name__} is not JSON serializable"
+    )
+
+
+# encodes everything other than blocks the same way as json.dumps
+json_encoder = json.JSONEncoder(default=render_nested)
+
+
+def write_json(value, write: Callable[[str], None]):
+    """
+    Writes a value as JSON using ``write``. Blocks, and blocks in a ``list`` or ``tuple``, are streamed
+    directly from their attributes; all other values are encoded as by ``json.dumps``.
+
+    Args:
+        value: The value to write.
+        write (Callable[[str], None]): Called with each fragment of JSON text, in order.
+    """
+    if isinstance(value, RenderMixin):
+        value.write_json(write)
+    elif isinstance(value, (list, tuple)) and any(
+        isinstance(item, RenderMixin) for item in value
+    ):
+        separator = "["
+        for item in value:
+            write(separator)
+            separator = ", "
+            write_json(item, write)
+        write("]")
+    elif hasattr(value, "get_fields"):
+        # view payloads are not blocks, but stream their fields the same way
+        value.write_json(write)
+    else:
+        write(json_encoder.encode(value))
+
+
+def get_json_size(value) -> int:
+    """
+    Returns the size in bytes of a value's JSON as written by :func:`write_json`, without encoding it: only
+    its strings are escaped to be measured. Blocks are measured from their attributes, as they are streamed,
+    and memoized blocks by their memoized JSON.
+
+    Args:
+        value: A block, a rendered block, or any other JSON-serializable value.
+    Returns:
+        int: The size of the JSON in bytes.
+    """
+    cls = value.__class__
+    if cls is str:
+        return len(encode_basestring_ascii(value))
+    if value is None or value is True:
+        return 4
+    if value is False:
+        return 5
+    if isinstance(value, MemoizedBlock):
+        return len(value.get_json())
+    if isinstance(value, RenderMixin):
+        if has_custom_render(cls):
+            return get_json_size(value.render())
+        fields = (
+            (key, getattr(value, name, None))
+            for name, key, _ in value.get_render_plan()
+        )
+        # unset attributes are left out, as they are when the block is rendered
+        return get_object_size(field for field in fields if field[1] is not None)
+    if isinstance(value, dict) and all(key.__class__ is str for key in value):
+        return get_object_size(value.items())
+    if isinstance(value, (list, tuple)):
+        return get_list_size([get_json_size(item) for item in value])
+    if hasattr(value, "get_fields"):
+        return get_object_size(value.get_render_fields().items())
+    return len(json_encoder.encode(value))
+
+
+def get_object_size(items: Iterable[Tuple[str, Any]]) -> int:
+    # the "{}" around the items, each key and its ": ", and the ", " between the items
+    size = 2
+    for key, item in items:
+        json_key = _json_keys.get(key)
+        if json_key is None:
+            json_key = _json_keys[key] = encode_basestring_ascii(key) + ": "
+        # strings are by far the most common values, so they are measured inline
+        if item.__class__ is str:
+            size += len(json_key) + len(encode_basestring_ascii(item)) + 2
+        else:
+            size += len(json_key) + get_json_size(item) + 2
+    return size - 2 if size > 2 else size
+
+
+def get_list_size(item_bytes: List[int]) -> int:
+    """
+    Returns the size of a JSON list from the sizes of its items: the items, the ", " between them, and the
+    "[]" around them.
+    """
+    return sum(item_bytes) + 2 + 2 * max(len(item_bytes) - 1, 0)
+
+
+@overload
+def dump_json(value, fp: None = None) -> str:
+    ...
+
+
+@overload
+def dump_json(value, fp: IO) -> None:
+    ...
+
+
+def dump_json(value, fp=None) -> Optional[str]:
+    """
+    Encodes a value containing blocks as JSON without building the rendered ``dict`` tree. The result
+    parses identically to ``json.dumps`` of the rendered value.
+
+    Args:
+        value: A block, a list of blocks and dicts, or any other JSON-serializable value.
+        fp: Optional; A text or binary file-like object, such as ``io.StringIO`` or ``io.BytesIO``, to
+            write the JSON to. If not specified, the JSON is returned as a string.
+    Returns:
+        str: The JSON string, or ``None`` if it was written to ``fp``.
+    Raises:
+        ValidationError: If a block within the value was constructed in ``deferred`` validation mode and is
+            not valid.
+    """
+    if pending_validation:
+        validate_pending(value)
+    return encode_json(value, fp)
+
+
+def encode_json(
+    value, fp=None, write_value: Callable[..., None] = None
+) -> Optional[str]:
+    """
+    Encodes a value as JSON like :func:`dump_json`, without validating any blocks within it first. The
+    value is written with ``write_value(value, write)``, which defaults to :func:`write_json`.
+    """
+    write_value = write_value or write_json
+    if fp is None:
+        parts: List[str] = []
+        write_value(value, parts.append)
+        return "".join(parts)
+
+    # the output is always ASCII, so it can be written to binary files as-is
+    if isinstance(fp, (io.RawIOBase, io.BufferedIOBase)):
+        write_value(value, lambda text: fp.write(text.encode("ascii")))
+    else:
+        write_value(value, fp.write)
+    return None
+
+
+class PayloadSize:
+    """
+    The size of a payload's JSON and of each of its blocks, measured as the JSON is written by
+    :func:`write_blocks_json`, or by :meth:`add_blocks` for blocks rendered into dicts, so the size is known
+    without encoding the payload again. The JSON written by
+    this package is ASCII, so its length is its size in bytes; compact encoders such as the ones used by
+    ``to_json`` give smaller payloads, so the size is an upper bound for them.
+
+    Args:
+        bytes (int): The size of the JSON in bytes.
+        block_bytes (List[int]): The size of the JSON of each block, in order.
+    """
+
+    __slots__ = ("bytes", "block_bytes")
+
+    def __init__(self):
+        self.bytes = 0
+        self.block_bytes: List[int] = []
+
+    @property
+    def blocks(self) -> int:
         """
-        # extract the values and their keys who are not None
-        vars_dict = {
-            key: value for key, value in vars(self).items() if value is not None
+        The number of blocks.
+        """
+        return len(self.block_bytes)
+
+    def add_blocks(self, blocks: Iterable):
+        """
+        Adds the size of a list of blocks and of each block, measured as by :func:`get_json_size`. Use it for
+        blocks that are rendered into dicts rather than written as JSON.
+
+        Args:
+            blocks (Iterable): The blocks, as :class:`Block` objects or dicts.
+        """
+        block_bytes = [get_json_size(block) for block in blocks]
+        self.block_bytes.extend(block_bytes)
+        self.bytes += get_list_size(block_bytes)
+
+    def add_payload(self, payload: dict):
+        """
+        Adds the size of a payload, such as the fields of a view, and of each of the blocks in its ``blocks``.
+
+        Args:
+            payload (dict): The fields of the payload, rendered or not.
+        """
+        for key, value in payload.items():
+            self.bytes += len(encode_basestring_ascii(key)) + 2
+            if key == "blocks":
+                self.add_blocks(value)
+            else:
+                self.bytes += get_json_size(value)
+        self.bytes += 2 + 2 * max(len(payload) - 1, 0)
+
+    def counting(self, write: Callable[[str], None]) -> Callable[[str], None]:
+        """
+        Returns a function that calls ``write`` with each fragment of JSON, adding its size to ``bytes``.
+        """
+
+        def write_counted(text: str):
+            self.bytes += len(text)
+            write(text)
+
+        return write_counted
+
+    def __repr__(self) -> str:
+        return f"PayloadSize(bytes={self.bytes}, blocks={self.blocks})"
+
+
+def write_blocks_json(blocks, write: Callable[[str], None], size: PayloadSize = None):
+    """
+    Writes a list of blocks and dicts as a JSON list, like :func:`write_json`. If a ``size`` is given, the
+    size of the list and of each block is added to it as the blocks are written; memoized blocks write
+    their memoized JSON, so measuring them again costs next to nothing.
+
+    Args:
+        blocks: The blocks and dicts.
+        write (Callable[[str], None]): Called with each fragment of JSON text, in order.
+        size (PayloadSize): Optional; The size to add to.
+    """
+    if size is None:
+        write_json(list(blocks), write)
+        return
+
+    write = size.counting(write)
+    separator = "["
+    for block in blocks:
+        write(separator)
+        separator = ", "
+        start = size.bytes
+        write_json(block, write)
+        size.block_bytes.append(size.bytes - start)
+    write("[]" if separator == "[" else "]")
+
+
+def render_value(value):
+    """
+    Renders a single attribute value. Blocks are rendered, as are any blocks directly within a ``list`` or
+    ``dict``, which are copied rather than changed. All other values are returned as-is.
+
+    Args:
+        value: The value to render.
+    Returns:
+        The rendered value.
+    """
+    # render individual blocks
+    if isinstance(value, Block):
+        return value.render()
+
+    # loop through list and render all blocks. frozen blocks hold their lists as tuples
+    if isinstance(value, (list, tuple)):
+        return [item.render() if isinstance(item, Block) else item for item in value]
+
+    # render all values in dict using dict comprehension if the value is a Block. the dict may be shared
+    # by other blocks, so the rendered values go into a copy
+    if isinstance(value, dict):
+        rendered_items = {
+            key: pair.render() for key, pair in value.items() if isinstance(pair, Block)
         }
+        if rendered_items:
+            value = {**value, **rendered_items}
 
-        # type is a reserved keyword, so here we change the name of btype to type
-        if "btype" in vars_dict:
-            vars_dict["type"] = vars_dict.pop("btype")
+    return value
 
-        # iterate through dict and render blocks
-        for key, value in vars_dict.items():
 
-            # render individual blocks
-            if isinstance(value, Block):
-                vars_dict[key] = value.render()
+def render_iterative(block: "RenderMixin") -> dict:
+    """
+    Renders a block like :meth:`RenderMixin.render`, with the same output, but using an explicit stack
+    instead of recursion, so trees of any depth can be rendered and no Python frame is needed for each block.
+    The ``dict`` of each nested block is added to its parent when the block is found, and filled in when the
+    block is taken off the stack. Memoized blocks within the tree render from their memoized output, and
+    blocks that override ``render()`` with their own.
+
+    Args:
+        block (RenderMixin): The block to render.
+    Returns:
+        dict: The block as a dict.
+    """
+    rendered: dict = {}
+    stack = [(block, rendered)]
+    push = stack.append
+
+    def defer(child: Block) -> dict:
+        if pending_validation and id(child) in pending_validation:
+            validate_pending(child)
+        if isinstance(child, MemoizedBlock) or has_custom_render(child.__class__):
+            return child.render()
+        child_rendered: dict = {}
+        push((child, child_rendered))
+        return child_rendered
 
-            # loop through list and render all blocks
-            elif isinstance(value, list):
-                updated = []
-                for item in value:
-                    if isinstance(item, Block):
-                        item = item.render()
-                    updated.append(item)
-                vars_dict[key] = updated
+    while stack:
+        block, target = stack.pop()
+        plan = _render_plans.get(block.__class__) or block.get_render_plan()
+        for name, key, nested in plan:
+            value = getattr(block, name, None)
+            if value is None:
+                continue
+            if nested or value.__class__ not in SCALAR_TYPES:
+                # the same as render_value, deferring the blocks within the value
+                if isinstance(value, Block):
+                    value = defer(value)
+                elif isinstance(value, (list, tuple)):
+                    value = [
+                        defer(item) if isinstance(item, Block) else item
+                        for item in value
+                    ]
+                elif isinstance(value, dict):
+                    rendered_items = {
+                        item_key: defer(pair)
+                        for item_key, pair in value.items()
+                        if isinstance(pair, Block)
+                    }
+                    if rendered_items:
+                        value = {**value, **rendered_items}
+            target[key] = value
+    return rendered
 
-            # render all values in dict using dict comprehension if the value is a Block
-            elif isinstance(value, dict):
-                rendered_items = {
-                    key: pair.render()
-                    for key, pair in value.items()
-                    if isinstance(pair, Block)
-                }
-                if rendered_items:
-                    value.update(rendered_items)
-                vars_dict[key] = value
 
-        return vars_dict
+class BlockList(list):
+    """
+    A ``list`` marked as containing blocks, for the ``copy_free`` render backend (see
+    :func:`set_render_backend`), which only renders the blocks within marked lists and tuples.
+    """
+
+
+class BlockDict(dict):
+    """
+    A ``dict`` marked as containing blocks, for the ``copy_free`` render backend (see
+    :func:`set_render_backend`), which only renders the blocks within marked dicts.
+    """
+
+
+def render_copy_free(block: "RenderMixin") -> dict:
+    """
+    Renders a block like :meth:`RenderMixin.render`, but treats plain ``list`` and ``dict`` values as
+    already rendered: they are neither scanned for blocks nor copied, and go into the rendered ``dict`` as
+    they are. Only a :class:`BlockList`, a :class:`BlockDict`, or a tuple (which frozen blocks hold their
+    lists as) has the blocks within it rendered, into a new container. Values are never changed.
+
+    Args:
+        block (RenderMixin): The block to render.
+    Returns:
+        dict: The block as a dict. Plain lists and dicts within it are shared with the block.
+    """
+    rendered = {}
+    plan = _render_plans.get(block.__class__) or block.get_render_plan()
+    for name, key, _ in plan:
+        value = getattr(block, name, None)
+        if value is None:
+            continue
+        value_class = value.__class__
+        if value_class is list or value_class is dict or value_class in SCALAR_TYPES:
+            pass
+        elif isinstance(value, Block):
+            value = value.render()
+        elif isinstance(value, (list, tuple)):
+            value = [
+                item.render() if isinstance(item, Block) else item for item in value
+            ]
+        elif isinstance(value, dict):
+            value = {
+                item_key: item.render() if isinstance(item, Block) else item
+                for item_key, item in value.items()
+            }
+        rendered[key] = value
+    return rendered
+
+
+def check_backend(backend: str):
+    if backend not in RENDER_BACKENDS:
+        raise AttributeError(
+            f"render backend must be one of the following values: {','.join(RENDER_BACKENDS)}"
+        )
+
+
+def get_render_backend() -> str:
+    """
+    Returns the render backend in effect, which is the backend set by :func:`render_backend` if inside one
+    and the global backend otherwise.
+
+    Returns:
+        str: One of ``recursive``, ``iterative`` or ``copy_free``.
+    """
+    return getattr(_local, "backend", None) or _default_backend
+
+
+def set_render_backend(backend: str):
+    """
+    Sets the global render backend used by ``render()``:
+
+    - ``recursive`` (the default) renders each nested block with its own ``render()`` call. It is the
+      fastest for typical messages.
+    - ``iterative`` renders the whole tree with :func:`render_iterative`, which has no recursion limit, for
+      generated payloads that are very deep or very wide. It gives the same output as ``recursive``.
+    - ``copy_free`` renders with :func:`render_copy_free`, which does not scan or copy plain lists and
+      dicts, for blocks holding large pre-rendered values. Lists and dicts of blocks must be marked as a
+      :class:`BlockList` or :class:`BlockDict`.
+
+    Args:
+        backend (str): One of ``recursive``, ``iterative`` or ``copy_free``.
+    Raises:
+        AttributeError: If the backend is not valid.
+    """
+    global _default_backend, render_backend_used
+    check_backend(backend)
+    render_backend_used = True
+    _default_backend = backend
+
+
+@contextmanager
+def render_backend(backend: str):
+    """
+    Sets the render backend within a ``with`` block. The backend only applies to the current thread,
+    which asyncio tasks in the thread share, so do not await within the block. See
+    :func:`set_render_backend` for the backends.
+
+    Example:
+        >>> with render_backend(RENDER_ITERATIVE):
+        ...     blocks = get_blocks(*get_catalog_blocks(catalog))
+
+    Args:
+        backend (str): One of ``recursive``, ``iterative`` or ``copy_free``.
+    Raises:
+        AttributeError: If the backend is not valid.
+    """
+    global render_backend_used
+    check_backend(backend)
+    render_backend_used = True
+    previous = getattr(_local, "backend", None)
+    _local.backend = backend
+    try:
+        yield
+    finally:
+        _local.backend = previous
 
 
 class Block(RenderMixin):
     """
-    Base block class.
+    Base block class. Subclasses set their attributes before calling ``super().__init__``, since the block
+    is validated here once it is complete. Subclasses declare the constraints on their attributes in
+    ``CONSTRAINTS`` (see :mod:`slack_blockkit.schema`), and their Slack ``type`` in ``BTYPE``.
 
     Args:
         btype (str): Synonymous with Slack's ``type`` parameter.
     """
 
-    def __init__(self, btype: str):
+    __slots__ = ("btype", "_memo", "__weakref__")
+
+    RENDER_FIELDS: Tuple[str, ...] = ("btype",)
+    # declared by each subclass, see the class docstring
+    CONSTRAINTS: Dict[str, Constraint]
+    _memo: "RenderMemo"
+
+    def __init__(self, btype: Optional[str]):
         self.btype = btype
+        validate_on_init(self)
+
+    def validate(self):
+        """
+        Validates the attributes of the block against the ``CONSTRAINTS`` of its class. Blocks within the
+        attributes are only checked to be of the right kind, since they are validated when they are
+        constructed. It is called when the block is constructed, or when it is first rendered if the
+        validation mode is ``deferred``.
+
+        Raises:
+            ValidationError: With every invalid attribute of the block.
+        """
+        errors: List[str] = []
+        FIELD_CHECKERS[self.__class__](self, (self.__class__.__name__,), errors)
+        if errors:
+            raise ValidationError(errors)
+
+    def memoize(self, read_only: bool = False) -> "Block":
+        """
+        Memoizes the output of ``render()`` for this block and every block within it. Setting an attribute
+        on the block, or on any block within it, discards the memoized output of that block and of every
+        memoized block containing it. Changes made inside a ``list`` or ``dict`` are not tracked; assign a
+        new value or call :meth:`invalidate` after making them.
+
+        Args:
+            read_only (bool): If ``True``, ``render()`` returns the memoized ``dict`` itself instead of a copy.
+                The returned ``dict`` and everything within it must then not be modified. Defaults to
+                ``False``.
+        Returns:
+            Block: This block.
+        """
+        track_block(self, MemoizedBlock, read_only)
+        return self
+
+    def freeze(self, read_only: bool = False) -> "Block":
+        """
+        Freezes this block and every block within it. Frozen blocks raise an ``AttributeError`` when an
+        attribute is set, hold their lists as tuples, and keep their memoized ``render()`` output
+        permanently. A frozen block can be shared safely between threads, is hashable, and can be copied
+        with changes using ``with_changes()``. Dicts within a frozen block are not copied and must not be
+        modified.
+
+        Args:
+            read_only (bool): If ``True``, ``render()`` returns the memoized ``dict`` itself instead of a copy.
+                Defaults to ``False``.
+        Returns:
+            Block: This block.
+        """
+        track_block(self, FrozenBlock, read_only)
+        return self
+
+    def invalidate(self):
+        """
+        Discards the memoized ``render()`` output of this block and of every memoized block containing it.
+        Does nothing if the block is not memoized.
+        """
+
+    def is_memoized(self) -> bool:
+        return isinstance(self, MemoizedBlock)
+
+    def is_frozen(self) -> bool:
+        return isinstance(self, FrozenBlock)
 
     @staticmethod
     def validate_input(
@@ -77,3 +840,403 @@ class Block(RenderMixin):
                     f"{input_name} needs to be one of the following values: "
                     f'{",".join(equality_fields)}'
                 )
+
+
+class RenderMemo:
+    """
+    The memoized render state of a block.
+
+    Args:
+        read_only (bool): Whether ``render()`` returns the memoized ``dict`` instead of a copy.
+    """
+
+    __slots__ = ("rendered", "json", "read_only", "parents", "hash")
+
+    def __init__(self, read_only: bool):
+        self.rendered: Optional[dict] = None
+        self.json: Optional[str] = None
+        self.read_only = read_only
+        self.hash: Optional[int] = None
+        # memoized blocks containing this one, which are invalidated along with it
+        self.parents: weakref.WeakSet = weakref.WeakSet()
+
+
+class MemoizedBlock(Block):
+    """
+    Base for the memoized variant of each block class, which blocks are switched to by
+    :meth:`Block.memoize`. The variants add no attributes, so regular blocks pay nothing for memoization.
+    """
+
+    __slots__ = ()
+
+    # the block class a variant was generated from
+    BLOCK_CLASS: Type[Block]
+
+    def __setattr__(self, name: str, value):
+        object.__setattr__(self, name, value)
+        for child in iter_blocks(value):
+            track_block(child, MemoizedBlock, self._memo.read_only, parent=self)
+        self.invalidate()
+
+    def __delattr__(self, name: str):
+        object.__delattr__(self, name)
+        self.invalidate()
+
+    def __reduce__(self):
+        # the generated classes cannot be pickled by name, so the block is pickled as its regular class
+        block_class = type(self).BLOCK_CLASS
+        state = {
+            name: getattr(self, name)
+            for name, _, _ in self.get_render_plan()
+            if hasattr(self, name)
+        }
+        args = (block_class, state, self.is_frozen(), self._memo.read_only)
+        return restore_block, args
+
+    def invalidate(self):
+        memo = self._memo
+        memo.rendered = None
+        memo.json = None
+        for parent in list(memo.parents):
+            parent.invalidate()
+
+    def get_rendered(self) -> dict:
+        """
+        Returns the memoized render of the block, rendering it if needed. The returned ``dict`` is shared
+        and must not be modified.
+
+        Returns:
+            dict: The memoized render of the block.
+        """
+        memo = self._memo
+        rendered = memo.rendered
+        if rendered is None:
+            rendered = memo.rendered = super().render()
+        return rendered
+
+    def get_json(self) -> str:
+        """
+        Returns the memoized JSON of the block, encoding its memoized render if needed.
+
+        Returns:
+            str: The block as JSON.
+        """
+        memo = self._memo
+        json_text = memo.json
+        if json_text is None:
+            json_text = memo.json = json_encoder.encode(self.get_rendered())
+        return json_text
+
+    def render(self) -> dict:
+        memo = self._memo
+        if render_stats_used:
+            record_render(memo.rendered is not None)
+        rendered = self.get_rendered()
+        return rendered if memo.read_only else copy_rendered(rendered)
+
+    def write_json(self, write: Callable[[str], None]):
+        if render_stats_used:
+            memo = self._memo
+            record_render(memo.json is not None or memo.rendered is not None)
+        write(self.get_json())
+
+
+class FrozenBlock(MemoizedBlock):
+    """
+    Base for the frozen variant of each block class, which blocks are switched to by :meth:`Block.freeze`.
+    Frozen blocks are hashable and compare equal when they are of the same class and render the same.
+    """
+
+    __slots__ = ()
+
+    def __hash__(self) -> int:
+        memo = self._memo
+        hashed = memo.hash
+        if hashed is None:
+            hashed = memo.hash = hash(self.get_json())
+        return hashed
+
+    def __eq__(self, other) -> bool:
+        if other is self:
+            return True
+        if not isinstance(other, FrozenBlock):
+            return NotImplemented
+        return (
+            type(other) is type(self)
+            and hash(other) == hash(self)
+            and other.get_rendered() == self.get_rendered()
+        )
+
+    def with_changes(self, **fields) -> "Block":
+        """
+        Returns a frozen copy of the block with the given attributes replaced. Attributes that are not
+        replaced, including any blocks within them, are shared with this block rather than copied, so
+        changing a nested block only copies the blocks on the path to it:
+
+            >>> button = actions.elements[0].with_changes(value=user_id)
+            >>> actions = actions.with_changes(elements=(button,) + actions.elements[1:])
+
+        The copy is validated according to the validation mode in effect, like a newly constructed block.
+
+        Args:
+            fields: The attributes to replace and their new values.
+        Returns:
+            Block: The frozen copy of the block.
+        Raises:
+            AttributeError: If one of the fields is not an attribute of the block.
+        """
+        block_class = type(self).BLOCK_CLASS
+        names = [name for name, _, _ in self.get_render_plan()]
+        for name in fields:
+            if name not in names:
+                raise AttributeError(
+                    f"{block_class.__name__} has no attribute {name} to change"
+                )
+
+        block = block_class.__new__(block_class)
+        for name in names:
+            value = fields[name] if name in fields else getattr(self, name, None)
+            setattr(block, name, value)
+        validate_on_init(block)
+        return block.freeze(self._memo.read_only)
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError(f"cannot set {name}, {type(self).__name__} is frozen")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"cannot delete {name}, {type(self).__name__} is frozen")
+
+    def invalidate(self):
+        # frozen blocks never change, so their memoized render is permanent
+        pass
+
+
+class RenderStats:
+    """
+    Counts the memoized blocks rendered while collecting with :func:`render_stats`, to measure how much of a
+    render reuses the output of earlier ones.
+
+    Args:
+        rendered (int): The number of blocks rendered, because they were new or had changed.
+        reused (int): The number of blocks whose memoized ``dict`` or JSON was reused. Blocks within them
+            are not visited, so are not counted.
+    """
+
+    __slots__ = ("rendered", "reused")
+
+    def __init__(self, rendered: int = 0, reused: int = 0):
+        self.rendered = rendered
+        self.reused = reused
+
+    def __repr__(self) -> str:
+        return f"RenderStats(rendered={self.rendered}, reused={self.reused})"
+
+
+@contextmanager
+def render_stats(stats: RenderStats = None):
+    """
+    Collects the render stats of memoized blocks within a ``with`` block. Only blocks that are memoized,
+    including the blocks of a memoized :class:`ViewPayload`, are counted. The stats only apply to the current
+    thread, which asyncio tasks in the thread share.
+
+    Example:
+        >>> with render_stats() as stats:
+        ...     client.views_update(view_id=view_id, view=view.render_json())
+        >>> logger.info("rendered %d blocks, reused %d", stats.rendered, stats.reused)
+
+    Args:
+        stats (RenderStats): Optional; The stats to add to, such as totals kept across requests. Defaults to
+            new stats.
+    Returns:
+        RenderStats: The stats, which are updated as blocks are rendered.
+    """
+    global render_stats_used
+    render_stats_used = True
+    stats = RenderStats() if stats is None else stats
+    previous = getattr(_local, "stats", None)
+    _local.stats = stats
+    try:
+        yield stats
+    finally:
+        _local.stats = previous
+
+
+def record_render(reused: bool):
+    stats = getattr(_local, "stats", None)
+    if stats is not None:
+        if reused:
+            stats.reused += 1
+        else:
+            stats.rendered += 1
+
+
+def get_variant_class(cls, variant) -> type:
+    """
+    Returns the memoized or frozen variant of a block class, creating it on first use.
+
+    Args:
+        cls: The block class, or one of its variants.
+        variant: Either :class:`MemoizedBlock` or :class:`FrozenBlock`.
+    Returns:
+        type: The variant class.
+    """
+    cls = getattr(cls, "BLOCK_CLASS", cls)
+    variant_class = _variant_classes.get((cls, variant))
+    if variant_class is None:
+        variant_class = _variant_classes[(cls, variant)] = type(
+            cls.__name__,
+            (variant, cls),
+            {
+                "__slots__": (),
+                "__module__": cls.__module__,
+                "__qualname__": cls.__qualname__,
+                "BLOCK_CLASS": cls,
+            },
+        )
+    return variant_class
+
+
+def track_block(block: Block, variant, read_only: bool, parent: Block = None):
+    """
+    Switches a block and every block within it to a memoized or frozen variant, linking each block to the
+    memoized block containing it.
+
+    Args:
+        block (Block): The block to track.
+        variant: Either :class:`MemoizedBlock` or :class:`FrozenBlock`.
+        read_only (bool): Whether ``render()`` returns the memoized ``dict`` of newly tracked blocks.
+        parent (Block): The memoized block containing ``block``, if any.
+    """
+    if isinstance(block, FrozenBlock):
+        return
+
+    if not isinstance(block, variant):
+        # lists are held as tuples by frozen blocks, so they cannot be changed either
+        if variant is FrozenBlock:
+            for name, _, nested in block.get_render_plan():
+                value = getattr(block, name, None)
+                if nested and isinstance(value, list):
+                    object.__setattr__(block, name, tuple(value))
+
+        if not isinstance(block, MemoizedBlock):
+            object.__setattr__(block, "_memo", RenderMemo(read_only))
+        else:
+            # a memoized block being frozen keeps its memoized output, but not how it is returned
+            block._memo.read_only = read_only
+        object.__setattr__(block, "__class__", get_variant_class(type(block), variant))
+
+    if parent is not None and not isinstance(parent, FrozenBlock):
+        block._memo.parents.add(parent)
+
+    for name, _, nested in block.get_render_plan():
+        if nested:
+            for child in iter_blocks(getattr(block, name, None)):
+                track_block(child, variant, read_only, parent=block)
+
+
+def iter_blocks(value) -> Iterator[Block]:
+    """
+    Yields the blocks that rendering a value renders: the value itself, or the blocks directly within it if
+    it is a ``list``, ``tuple`` or ``dict``.
+
+    Args:
+        value: An attribute value.
+    Returns:
+        Iterator[Block]: The blocks within the value.
+    """
+    if isinstance(value, Block):
+        yield value
+    elif isinstance(value, (list, tuple)):
+        yield from (item for item in value if isinstance(item, Block))
+    elif isinstance(value, dict):
+        yield from (item for item in value.values() if isinstance(item, Block))
+
+
+def validate_pending(value, path: str = None):
+    """
+    Validates the blocks within a value that were constructed in ``deferred`` validation mode and have not
+    been validated yet. Each valid block is only validated once, so rendering it again does not repeat the
+    checks.
+
+    Args:
+        value: A block, a :class:`ViewPayload`, or a ``list``, ``tuple`` or ``dict`` containing them.
+        path (str): The name of the value used in error messages, defaults to its class name.
+    Raises:
+        ValidationError: With the errors of every invalid block within the value.
+    """
+    errors: List[str] = []
+    collect_errors(value, (path or type(value).__name__,), errors)
+    if errors:
+        raise ValidationError(errors)
+
+
+def collect_errors(value, path: tuple, errors: List[str]):
+    # the path is a chain of (parent path, key) tuples, which is only formatted if there is an error
+    if value is None or value.__class__ in SCALAR_TYPES:
+        return
+
+    ref = pending_validation.get(id(value))
+    if ref is not None:
+        if ref() is not value:
+            # the pending object was never rendered, and its id has been reused
+            del pending_validation[id(value)]
+        else:
+            error_count = len(errors)
+            FIELD_CHECKERS[value.__class__](value, path, errors)
+            # invalid objects stay pending, so rendering them again raises again
+            if len(errors) == error_count:
+                del pending_validation[id(value)]
+
+    if isinstance(value, RenderMixin):
+        for name, key, nested in value.get_render_plan():
+            if nested:
+                item = getattr(value, name, None)
+                if item is not None:
+                    collect_errors(item, (path, key), errors)
+    elif isinstance(value, (list, tuple)):
+        for index, item in enumerate(value):
+            collect_errors(item, (path, index), errors)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            collect_errors(item, (path, key), errors)
+    elif hasattr(value, "get_fields"):
+        # view payloads are not blocks, but hold blocks in their fields
+        collect_errors(value.get_fields(), path, errors)
+
+
+def copy_rendered(value):
+    """
+    Copies the ``dict`` and ``list`` containers of a rendered value, so the copy can be modified without
+    affecting the original. All other values are shared.
+
+    Args:
+        value: The rendered value.
+    Returns:
+        The copied value.
+    """
+    if value.__class__ is dict:
+        copied = value.copy()
+        for key, item in copied.items():
+            if item.__class__ is dict or item.__class__ is list:
+                copied[key] = copy_rendered(item)
+        return copied
+    if value.__class__ is list:
+        return [
+            copy_rendered(item)
+            if item.__class__ is dict or item.__class__ is list
+            else item
+            for item in value
+        ]
+    return value
+
+
+def restore_block(
+    block_class: Type[Block], state: dict, frozen: bool, read_only: bool
+) -> Block:
+    """
+    Recreates a memoized or frozen block from its pickled state.
+    """
+    block = block_class.__new__(block_class)
+    for name, value in state.items():
+        setattr(block, name, value)
+    return block.freeze(read_only) if frozen else block.memoize(read_only)
@@ -7,7 +7,7 @@ from .composition_object import (
     OptionObject,
     TextObject,
 )
-from slack_blockkit.utils import get_validated_input
+from .schema import Bool, Int, Items, Nested, Str, Text
 
 
 class BlockElement(Block):
@@ -19,11 +19,13 @@ class BlockElement(Block):
         action_id (str): The unique action ID.
     """
 
+    __slots__ = ("action_id",)
+
+    RENDER_FIELDS = __slots__ + Block.RENDER_FIELDS
+    CONSTRAINTS = {"action_id": Str(max_length=255)}
+
     def __init__(self, btype: str, action_id: str = None):
-        # validate the action id
-        self.action_id = get_validated_input(
-            action_id, str, min_length=0, max_length=255
-        )
+        self.action_id = action_id
         super().__init__(btype=btype)
 
 
@@ -60,6 +62,19 @@ class ButtonElement(BlockElement):
     STYLE_DANGER = "danger"
     STYLE_DEFAULT = "default"
 
+    BTYPE = "button"
+
+    __slots__ = ("text", "url", "value", "style", "confirm")
+
+    RENDER_FIELDS = __slots__ + BlockElement.RENDER_FIELDS
+    CONSTRAINTS = {
+        "text": Text(max_length=75, plain_text=True, required=True),
+        "url": Str(max_length=3000),
+        "value": Str(max_length=2000),
+        "style": Str(one_of=(STYLE_DANGER, STYLE_DEFAULT, STYLE_PRIMARY)),
+        "confirm": Nested(ConfirmObject),
+    }
+
     def __init__(
         self,
         text: TextObject,
@@ -69,25 +84,13 @@ class ButtonElement(BlockElement):
         style: str = "default",
         confirm: ConfirmObject = None,
     ):
-        # validate input
-        text.validate_text_block(
-            max_length=75, required_type=TextObject.BTYPE_PLAINTEXT
-        )
-        self.validate_input("url", url, max_length=3000)
-        self.validate_input("value", value, max_length=2000)
-        self.validate_input(
-            "style",
-            style,
-            equality_fields=[self.STYLE_DANGER, self.STYLE_DEFAULT, self.STYLE_PRIMARY],
-        )
-
         self.text = text
         self.url = url
         self.value = value
         self.style = style
         self.confirm = confirm
 
-        super().__init__(btype="button", action_id=action_id)
+        super().__init__(btype=self.BTYPE, action_id=action_id)
 
 
 class PrimaryButtonElement(ButtonElement):
@@ -107,6 +110,8 @@ class PrimaryButtonElement(ButtonElement):
             2000 characters.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         text: TextObject,
@@ -142,6 +147,8 @@ class DangerButtonElement(ButtonElement):
             2000 characters.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         text: TextObject,
@@ -177,6 +184,8 @@ class DefaultButtonElement(ButtonElement):
             2000 characters.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         text: TextObject,
@@ -212,6 +221,17 @@ class DatepickerElement(BlockElement):
             after a date is selected.
     """
 
+    BTYPE = "datepicker"
+
+    __slots__ = ("placeholder", "initial_date", "confirm")
+
+    RENDER_FIELDS = BlockElement.RENDER_FIELDS + __slots__
+    CONSTRAINTS = {
+        "placeholder": Text(max_length=150, plain_text=True, required=True),
+        "initial_date": Str(),
+        "confirm": Nested(ConfirmObject),
+    }
+
     def __init__(
         self,
         action_id: str,
@@ -219,21 +239,16 @@ class DatepickerElement(BlockElement):
         initial_date: str = None,
         confirm: ConfirmObject = None,
     ):
-        # validate input
-        placeholder.validate_text_block(
-            max_length=150, required_type=TextObject.BTYPE_PLAINTEXT
-        )
-
         # set date if not already set
         if not initial_date:
             initial_date = str(date.today())
 
-        super().__init__(btype="datepicker", action_id=action_id)
-
         self.placeholder = placeholder
         self.initial_date = initial_date
         self.confirm = confirm
 
+        super().__init__(btype=self.BTYPE, action_id=action_id)
+
 
 class ImageElement(BlockElement):
     """
@@ -246,11 +261,22 @@ class ImageElement(BlockElement):
         alt_text (str): A plain-text summary of the image. This should not contain any markup.
     """
 
+    BTYPE = "image"
+
+    __slots__ = ("image_url", "alt_text")
+
+    RENDER_FIELDS = BlockElement.RENDER_FIELDS + __slots__
+    CONSTRAINTS = {
+        "image_url": Str(max_length=3000, required=True),
+        "alt_text": Str(max_length=2000, required=True),
+    }
+
     def __init__(self, image_url: str, alt_text: str):
-        super().__init__(btype="image")
         self.image_url = image_url
         self.alt_text = alt_text
 
+        super().__init__(btype=self.BTYPE)
+
 
 class OverflowElement(BlockElement):
     """
@@ -269,16 +295,24 @@ class OverflowElement(BlockElement):
             after a menu item is selected.
     """
 
+    BTYPE = "overflow"
+
+    __slots__ = ("options", "confirm")
+
+    RENDER_FIELDS = BlockElement.RENDER_FIELDS + __slots__
+    CONSTRAINTS = {
+        "options": Items(Nested(OptionObject), min_items=2, max_items=5, required=True),
+        "confirm": Nested(ConfirmObject),
+    }
+
     def __init__(
         self, action_id: str, options: List[OptionObject], confirm: ConfirmObject = None
     ):
-        # validate input
-        if options and (len(options) > 5 or len(options) < 2):
-            raise AttributeError("Must have between 2 and 5 options (inclusive)")
-        super().__init__(btype="overflow", action_id=action_id)
         self.options = options
         self.confirm = confirm
 
+        super().__init__(btype=self.BTYPE, action_id=action_id)
+
 
 class PlainTextInputElement(BlockElement):
     """
@@ -301,6 +335,25 @@ class PlainTextInputElement(BlockElement):
             receive an error.
     """
 
+    BTYPE = "plain_text_input"
+
+    __slots__ = (
+        "placeholder",
+        "initial_value",
+        "multiline",
+        "min_length",
+        "max_length",
+    )
+
+    RENDER_FIELDS = BlockElement.RENDER_FIELDS + __slots__
+    CONSTRAINTS = {
+        "placeholder": Text(max_length=150, plain_text=True),
+        "initial_value": Str(),
+        "multiline": Bool(),
+        "min_length": Int(0, 3000, not_greater_than="max_length"),
+        "max_length": Int(0, 3000),
+    }
+
     def __init__(
         self,
         action_id: str,
@@ -310,34 +363,14 @@ class PlainTextInputElement(BlockElement):
         min_length: int = 0,
         max_length: int = 0,
     ):
-        # validate input
-        if placeholder:
-            placeholder.validate_text_block(
-                max_length=150, required_type=TextObject.BTYPE_PLAINTEXT
-            )
-
-        if min_length != 0 or max_length != 0:
-            if min_length > max_length:
-                raise AttributeError(
-                    f"max_length ({max_length}) must be greater than min_length ({min_length})"
-                )
-            if min_length < 0 or min_length > 3000:
-                raise AttributeError(
-                    f"min_length ({min_length}) must be between 0 and 3000 (inclusive)"
-                )
-            if max_length < 0 or max_length > 3000:
-                raise AttributeError(
-                    f"max_length ({max_length}) must be between 0 and 3000 (inclusive)"
-                )
-
-        super().__init__(btype="plain_text_input", action_id=action_id)
-
         self.placeholder = placeholder
         self.initial_value = initial_value
         self.multiline = multiline
         self.min_length = min_length
         self.max_length = max_length
 
+        super().__init__(btype=self.BTYPE, action_id=action_id)
+
 
 class RadioButtonGroupElement(BlockElement):
     """
@@ -355,6 +388,17 @@ class RadioButtonGroupElement(BlockElement):
             after clicking one of the radio buttons in this element.
     """
 
+    BTYPE = "radio_buttons"
+
+    __slots__ = ("options", "initial_option", "confirm")
+
+    RENDER_FIELDS = BlockElement.RENDER_FIELDS + __slots__
+    CONSTRAINTS = {
+        "options": Items(Nested(OptionObject), required=True),
+        "initial_option": Nested(OptionObject, member_of="options"),
+        "confirm": Nested(ConfirmObject),
+    }
+
     def __init__(
         self,
         action_id: str,
@@ -362,11 +406,8 @@ class RadioButtonGroupElement(BlockElement):
         intitial_option: OptionObject = None,
         confirm: ConfirmObject = None,
     ):
-        # validate input
-        if intitial_option and intitial_option not in options:
-            raise AttributeError("initial_option must be an option within options")
-        super().__init__(btype="radio_buttons", action_id=action_id)
-
         self.options = options
         self.initial_option = intitial_option
         self.confirm = confirm
+
+        super().__init__(btype=self.BTYPE, action_id=action_id)
@@ -0,0 +1,273 @@
+import hashlib
+import itertools
+import json
+import os
+import threading
+import uuid
+import weakref
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Sequence
+
+
+class BlockIdGenerator(ABC):
+    """
+    Generates the ``block_id`` of layout blocks constructed without one. Generators are selected globally with
+    :func:`set_block_id_generator`, within a ``with`` block with :func:`block_id_generator`, or for a single
+    block by passing the generator as its ``block_id``.
+
+    Every generator gives unique IDs within a message, so blocks built with one can be combined freely.
+    """
+
+    def __init__(self):
+        _generators.add(self)
+
+    @abstractmethod
+    def __call__(self, block) -> Optional[str]:
+        """
+        Returns the ID for a block. The block's own attributes are set, but it has not been validated yet.
+
+        Args:
+            block (LayoutBlock): The block the ID is for.
+        Returns:
+            Optional[str]: The block ID, or ``None`` if the ID is added when the block is rendered.
+        """
+
+    def reset(self):
+        """
+        Discards any state shared with the parent process. This is called in child processes after a fork,
+        so parent and child never generate the same IDs.
+        """
+
+
+class UUIDGenerator(BlockIdGenerator):
+    """
+    Generates a random UUID (v4) for each block. This is the default, but reads from ``os.urandom`` for
+    every block; the other generators are much faster.
+    """
+
+    def __call__(self, block) -> str:
+        return str(uuid.uuid4())
+
+
+class CounterGenerator(BlockIdGenerator):
+    """
+    Generates IDs from a counter with a random per-process prefix, such as ``3f9c2a71b0e4-17``. IDs are unique
+    within the process, and unlikely to collide with the IDs of other processes or earlier runs.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.reset()
+
+    def __call__(self, block) -> str:
+        return f"{self.prefix}{next(self.counter)}"
+
+    def reset(self):
+        self.prefix = os.urandom(6).hex() + "-"
+        # next() on a count is atomic, so the counter can be shared between threads without a lock
+        self.counter = itertools.count()
+
+
+class BatchedRandomGenerator(BlockIdGenerator):
+    """
+    Generates random 128-bit IDs as 32 hexadecimal characters, like a UUID (v4) but without the dashes. The
+    random bytes are read from ``os.urandom`` in batches, rather than once for every block.
+
+    Args:
+        batch_size (int): The number of IDs read at a time, defaults to 1024.
+    """
+
+    def __init__(self, batch_size: int = 1024):
+        super().__init__()
+        self.batch_size = batch_size
+        self.reset()
+
+    def __call__(self, block) -> str:
+        try:
+            # pop() is atomic, so two threads never get the same ID
+            return self.batch.pop()
+        except IndexError:
+            entropy = os.urandom(16 * self.batch_size).hex()
+            # each ID is 32 hex digits, between consecutive bounds
+            bounds = range(0, len(entropy) + 1, 32)
+            self.batch.extend(
+                entropy[start:end] for start, end in zip(bounds, bounds[1:])
+            )
+            return self.batch.pop()
+
+    def reset(self):
+        self.batch: List[str] = []
+
+
+class ContentHashGenerator(BlockIdGenerator):
+    """
+    Generates IDs from a hash of the block's type and content, so building the same blocks always gives the
+    same IDs. Blocks with the same content get a suffix counting the earlier ones, such as ``-2``, to keep
+    their IDs unique, so use a new generator for each message to keep the IDs stable:
+
+        >>> with block_id_generator(ContentHashGenerator()):
+        ...     blocks = get_blocks(*get_report_blocks(report))
+
+    The ID of a block is derived when it is constructed; it does not change if the block is changed later.
+
+    Args:
+        max_seen (int): The number of hashes remembered for the suffixes, defaults to 65536. Once exceeded,
+            they are forgotten, so a generator shared by every message does not keep growing.
+    """
+
+    def __init__(self, max_seen: int = 65536):
+        super().__init__()
+        self.max_seen = max_seen
+        self.lock = threading.Lock()
+        self.reset()
+
+    def __call__(self, block) -> str:
+        parts = [type(block).__name__, ":"]
+        block.write_json(parts.append)
+        digest = hashlib.blake2b("".join(parts).encode(), digest_size=16).hexdigest()
+
+        with self.lock:
+            count = self.seen.get(digest, 0) + 1
+            if count == 1 and len(self.seen) >= self.max_seen:
+                self.seen.clear()
+            self.seen[digest] = count
+        return digest if count == 1 else f"{digest}-{count}"
+
+    def reset(self):
+        self.seen: Dict[str, int] = {}
+
+
+class ContentAddressedGenerator(BlockIdGenerator):
+    """
+    Derives block IDs from a hash of each block's rendered content and its position in the message or view,
+    so rendering the same blocks always gives byte-identical payloads that can be cached, compared and
+    ETagged (see :func:`slack_blockkit.utils.get_etag`).
+
+    The position of a block is only known once it is part of a message, so blocks are constructed without a
+    ``block_id``, and the ID is added when they are rendered by ``get_blocks``, ``get_blocks_json``,
+    ``iter_blocks_json`` or a :class:`ViewPayload`. A block rendered on its own has no ``block_id``, which
+    Slack then generates. The block itself is never changed, so it can be used at different positions.
+    """
+
+    def __call__(self, block) -> None:
+        global content_ids_used
+        content_ids_used = True
+        return None
+
+
+# every generator, so their state can be reset in child processes after a fork
+_generators: "weakref.WeakSet[BlockIdGenerator]" = weakref.WeakSet()
+
+_default_generator: BlockIdGenerator = UUIDGenerator()
+# the generator set by block_id_generator() in each thread
+_local = threading.local()
+
+
+def get_block_id_generator() -> BlockIdGenerator:
+    """
+    Returns the block ID generator in effect, which is the generator set by :func:`block_id_generator` if
+    inside one and the global generator otherwise.
+
+    Returns:
+        BlockIdGenerator: The generator.
+    """
+    return getattr(_local, "generator", None) or _default_generator
+
+
+def set_block_id_generator(generator: BlockIdGenerator):
+    """
+    Sets the global block ID generator, which defaults to a :class:`UUIDGenerator`.
+
+    Args:
+        generator (BlockIdGenerator): The generator.
+    Raises:
+        AttributeError: If the generator is not a :class:`BlockIdGenerator`.
+    """
+    global _default_generator
+    check_generator(generator)
+    _default_generator = generator
+
+
+@contextmanager
+def block_id_generator(generator: BlockIdGenerator):
+    """
+    Sets the block ID generator within a ``with`` block. The generator only applies to the current thread,
+    which asyncio tasks in the thread share, so do not await within the block.
+
+    Example:
+        >>> with block_id_generator(CounterGenerator()):
+        ...     blocks = [SectionBlock(text=PlainTextObject(text=line)) for line in lines]
+
+    Args:
+        generator (BlockIdGenerator): The generator.
+    Raises:
+        AttributeError: If the generator is not a :class:`BlockIdGenerator`.
+    """
+    check_generator(generator)
+    previous = getattr(_local, "generator", None)
+    _local.generator = generator
+    try:
+        yield
+    finally:
+        _local.generator = previous
+
+
+# whether any block was constructed for content addressed IDs, so rendering can skip looking for them
+content_ids_used = False
+
+
+def get_content_block_id(rendered: dict, position: int) -> str:
+    """
+    Returns the content addressed ID of a rendered block at a position in a message or view.
+
+    Args:
+        rendered (dict): The rendered block, without a ``block_id``.
+        position (int): The index of the block.
+    Returns:
+        str: The block ID.
+    """
+    content = f"{position}:{json.dumps(rendered)}".encode()
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def assign_content_ids(blocks: Sequence) -> Sequence:
+    """
+    Replaces the blocks constructed for content addressed IDs with their rendered ``dict``, with the
+    ``block_id`` derived from their content and position. See :class:`ContentAddressedGenerator`.
+
+    Args:
+        blocks (Sequence): The blocks of a message or view, which can include dicts.
+    Returns:
+        Sequence: The blocks, or ``blocks`` itself if none needed an ID.
+    """
+    if not content_ids_used or not any(
+        getattr(block, "block_id", False) is None for block in blocks
+    ):
+        return blocks
+
+    assigned = []
+    for position, block in enumerate(blocks):
+        if getattr(block, "block_id", False) is None:
+            rendered = block.render()
+            # a new dict, since the rendered dict can be a memoized one; block_id is always rendered first
+            block = {"block_id": get_content_block_id(rendered, position), **rendered}
+        assigned.append(block)
+    return assigned
+
+
+def check_generator(generator):
+    if not isinstance(generator, BlockIdGenerator):
+        raise AttributeError(
+            f"block ID generator must be a BlockIdGenerator, but is {type(generator).__name__}"
+        )
+
+
+def _reset_generators():
+    for generator in list(_generators):
+        generator.reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_generators)
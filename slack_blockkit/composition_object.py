@@ -1,7 +1,7 @@
-from typing import List
+from typing import List, Optional
 
 from .block import Block
-from slack_blockkit.utils import get_validated_input
+from .schema import Bool, Items, Nested, Str, Text
 
 
 class TextObject(Block):
@@ -26,20 +26,28 @@ class TextObject(Block):
     BTYPE_PLAINTEXT = "plain_text"
     BTYPE_MARKDOWN = "mrkdwn"
 
+    __slots__ = ("text", "emoji", "verbatim")
+
+    RENDER_FIELDS = Block.RENDER_FIELDS + __slots__
+    CONSTRAINTS = {
+        "btype": Str(one_of=(BTYPE_PLAINTEXT, BTYPE_MARKDOWN), required=True),
+        "text": Str(required=True),
+        "emoji": Bool(),
+        "verbatim": Bool(),
+    }
+
     def __init__(
         self, btype: str, text: str, emoji: bool = False, verbatim: bool = False
     ):
-        # validate that the type is correct
-        self.btype = get_validated_input(
-            btype, str, equality_fields=[self.BTYPE_PLAINTEXT, self.BTYPE_MARKDOWN]
-        )
         self.text = text
 
         # emoji field is only usable if the type is plain text
         if btype == self.BTYPE_PLAINTEXT:
-            self.emoji = emoji
+            self.emoji: Optional[bool] = emoji
+            self.verbatim: Optional[bool] = None
         # verbatim field is only usable if the type is markdown
         else:
+            self.emoji = None
             self.verbatim = verbatim
         super().__init__(btype=btype)
 
@@ -76,6 +84,10 @@ class PlainTextObject(TextObject):
         emoji (bool): Indicates whether emojis in a text field should be escaped into the colon emoji format.
     """
 
+    BTYPE = TextObject.BTYPE_PLAINTEXT
+
+    __slots__ = ()
+
     def __init__(self, text: str, emoji: bool = False):
         super().__init__(btype=TextObject.BTYPE_PLAINTEXT, text=text, emoji=emoji)
 
@@ -92,6 +104,10 @@ class MarkdownTextObject(TextObject):
             will skip any preprocessing of this nature, although you can still include manual parsing strings.
     """
 
+    BTYPE = TextObject.BTYPE_MARKDOWN
+
+    __slots__ = ()
+
     def __init__(self, text: str, emoji: bool = False, verbatim: bool = False):
         super().__init__(
             btype=TextObject.BTYPE_MARKDOWN, text=text, emoji=emoji, verbatim=verbatim
@@ -119,6 +135,17 @@ class ConfirmObject(Block):
             default value will be ``primary``.
     """
 
+    __slots__ = ("title", "text", "confirm", "deny", "style")
+
+    RENDER_FIELDS = Block.RENDER_FIELDS + __slots__
+    CONSTRAINTS = {
+        "title": Text(max_length=100, plain_text=True, required=True),
+        "text": Text(max_length=300, required=True),
+        "confirm": Text(max_length=30, plain_text=True, required=True),
+        "deny": Text(max_length=30, plain_text=True, required=True),
+        "style": Str(one_of=("danger", "primary")),
+    }
+
     def __init__(
         self,
         title: TextObject,
@@ -127,29 +154,13 @@ class ConfirmObject(Block):
         deny: TextObject,
         style: str = "primary",
     ):
-        super().__init__(btype=None)
-        # validate input
-        title.validate_text_block(
-            max_length=100, required_type=TextObject.BTYPE_PLAINTEXT
-        )
         self.title = title
-
-        text.validate_text_block(max_length=300)
         self.text = text
-
-        confirm.validate_text_block(
-            max_length=30, required_type=TextObject.BTYPE_PLAINTEXT
-        )
         self.confirm = confirm
-
-        deny.validate_text_block(
-            max_length=30, required_type=TextObject.BTYPE_PLAINTEXT
-        )
         self.deny = deny
+        self.style = style
 
-        self.style = get_validated_input(
-            style, str, equality_fields=["danger", "primary"]
-        )
+        super().__init__(btype=None)
 
 
 class OptionObject(Block):
@@ -176,6 +187,16 @@ class OptionObject(Block):
     URL_MAX_LENGTH = 3000
     VALUE_MAX_LENGTH = 75
 
+    __slots__ = ("text", "description", "value", "url")
+
+    RENDER_FIELDS = Block.RENDER_FIELDS + __slots__
+    CONSTRAINTS = {
+        "text": Text(max_length=TEXT_MAX_LENGTH, plain_text=True, required=True),
+        "description": Text(max_length=TEXT_MAX_LENGTH, plain_text=True),
+        "value": Str(max_length=VALUE_MAX_LENGTH, required=True),
+        "url": Str(max_length=URL_MAX_LENGTH),
+    }
+
     def __init__(
         self,
         text: TextObject,
@@ -183,20 +204,12 @@ class OptionObject(Block):
         description: TextObject = None,
         url: str = None,
     ):
-        # validate input
-        text.validate_text_block(
-            max_length=self.TEXT_MAX_LENGTH, required_type=TextObject.BTYPE_PLAINTEXT
-        )
-        super().__init__(btype=None)
         self.text = text
-        if description:
-            description.validate_text_block(
-                max_length=self.TEXT_MAX_LENGTH,
-                required_type=TextObject.BTYPE_PLAINTEXT,
-            )
-            self.description = description
-        self.value = get_validated_input(value, str, max_length=self.VALUE_MAX_LENGTH)
-        self.url = get_validated_input(url, str, max_length=self.URL_MAX_LENGTH)
+        self.description = description
+        self.value = value
+        self.url = url
+
+        super().__init__(btype=None)
 
 
 class OptionGroupObject(Block):
@@ -213,17 +226,16 @@ class OptionGroupObject(Block):
 
     LABEL_MAX_LENGTH = 75
 
-    def __init__(self, label: TextObject, options: List[OptionObject]):
-        # validate input
-        # TODO validate label
-        self.label = label.validate_text_block(
-            max_length=self.LABEL_MAX_LENGTH, required_type=TextObject.BTYPE_PLAINTEXT
-        )
-        if not isinstance(options[0], OptionObject):
-            raise AttributeError(
-                "options list needs to be a list of OptionObject objects"
-            )
-        if len(options) > 100:
-            raise AttributeError("options list cannot exceed 100 options")
+    __slots__ = ("label", "options")
 
+    RENDER_FIELDS = Block.RENDER_FIELDS + __slots__
+    CONSTRAINTS = {
+        "label": Text(max_length=LABEL_MAX_LENGTH, plain_text=True, required=True),
+        "options": Items(Nested(OptionObject), max_items=100, required=True),
+    }
+
+    def __init__(self, label: TextObject, options: List[OptionObject]):
+        self.label = label
         self.options = options
+
+        super().__init__(btype=None)
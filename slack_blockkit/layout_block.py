@@ -3,8 +3,10 @@ import uuid
 from typing import List
 
 from .block import Block
+from .block_id import BlockIdGenerator, get_block_id_generator
 from .composition_object import TextObject
-from .block_element import BlockElement
+from .block_element import BlockElement, ImageElement
+from .schema import Bool, Items, Nested, Str, Text
 
 
 class LayoutBlock(Block):
@@ -17,16 +19,23 @@ class LayoutBlock(Block):
             receive an interaction payload to identify the source of the action. If not specified, a ``block_id``
             will be generated. Maximum length for this field is 255 characters.
 
-            If not ``block_id`` is specified, a ``block_id`` is set to a random UUID v4.
+            If not ``block_id`` is specified, a ``block_id`` is generated by the block ID generator in effect,
+            which gives a random UUID v4 by default (see :mod:`slack_blockkit.block_id`). A
+            :class:`BlockIdGenerator` can also be passed to generate the ID of this block only.
     """
 
+    __slots__ = ("block_id",)
+
+    RENDER_FIELDS = __slots__ + Block.RENDER_FIELDS
+    CONSTRAINTS = {"block_id": Str(max_length=255)}
+
     def __init__(self, btype: str, block_id: str = None):
         # generate a block ID if none is passed
-        if block_id and len(block_id) > 255:
-            raise AttributeError(
-                "block_id cannot be greater than 255 characters, but is {}".format(block_id)
-            )
-        self.block_id = block_id if block_id else self.generate_block_id()
+        if not block_id:
+            block_id = get_block_id_generator()(self)
+        elif isinstance(block_id, BlockIdGenerator):
+            block_id = block_id(self)
+        self.block_id = block_id
         super().__init__(btype=btype)
 
     @staticmethod
@@ -53,14 +62,20 @@ class ActionsBlock(LayoutBlock):
             will be generated. Maximum length for this field is 255 characters.
     """
 
-    def __init__(self, elements: List[BlockElement], block_id: str = None):
-        # validate_input
-        if len(elements) > 5:
-            raise AttributeError("cannot have more than 5 elements in action blocks")
+    BTYPE = "actions"
+
+    __slots__ = ("elements",)
+
+    RENDER_FIELDS = LayoutBlock.RENDER_FIELDS + __slots__
+    CONSTRAINTS = {
+        "elements": Items(Nested(BlockElement), max_items=5, required=True),
+    }
 
-        super().__init__(btype="actions", block_id=block_id)
+    def __init__(self, elements: List[BlockElement], block_id: str = None):
         self.elements = elements
 
+        super().__init__(btype=self.BTYPE, block_id=block_id)
+
 
 class ContextBlock(LayoutBlock):
     """
@@ -75,14 +90,22 @@ class ContextBlock(LayoutBlock):
             will be generated. Maximum length for this field is 255 characters.
     """
 
-    def __init__(self, elements: list, block_id: str = None):
-        # validate input
-        if len(elements) > 10:
-            raise AttributeError("cannot have more than 10 elements in context blocks")
+    BTYPE = "context"
+
+    __slots__ = ("elements",)
 
-        super().__init__(btype="context", block_id=block_id)
+    RENDER_FIELDS = LayoutBlock.RENDER_FIELDS + __slots__
+    CONSTRAINTS = {
+        "elements": Items(
+            Nested(ImageElement, TextObject), max_items=10, required=True
+        ),
+    }
+
+    def __init__(self, elements: list, block_id: str = None):
         self.elements = elements
 
+        super().__init__(btype=self.BTYPE, block_id=block_id)
+
 
 class DividerBlock(LayoutBlock):
     """
@@ -95,8 +118,12 @@ class DividerBlock(LayoutBlock):
             will be generated. Maximum length for this field is 255 characters.
     """
 
+    BTYPE = "divider"
+
+    __slots__ = ()
+
     def __init__(self, block_id: str = None):
-        super().__init__(btype="divider", block_id=block_id)
+        super().__init__(btype=self.BTYPE, block_id=block_id)
 
 
 class FileBlock(LayoutBlock):
@@ -112,11 +139,22 @@ class FileBlock(LayoutBlock):
             will be generated. Maximum length for this field is 255 characters.
     """
 
+    BTYPE = "file"
+
+    __slots__ = ("external_id", "source")
+
+    RENDER_FIELDS = LayoutBlock.RENDER_FIELDS + __slots__
+    CONSTRAINTS = {
+        "external_id": Str(required=True),
+        "source": Str(),
+    }
+
     def __init__(self, external_id: str, source: str = "remote", block_id: str = None):
-        super().__init__(btype="file", block_id=block_id)
         self.external_id = external_id
         self.source = source
 
+        super().__init__(btype=self.BTYPE, block_id=block_id)
+
 
 class ImageBlock(LayoutBlock):
     """
@@ -134,6 +172,17 @@ class ImageBlock(LayoutBlock):
             will be generated. Maximum length for this field is 255 characters.
     """
 
+    BTYPE = "image"
+
+    __slots__ = ("image_url", "alt_text", "title")
+
+    RENDER_FIELDS = LayoutBlock.RENDER_FIELDS + __slots__
+    CONSTRAINTS = {
+        "image_url": Str(max_length=3000, required=True),
+        "alt_text": Str(max_length=2000, required=True),
+        "title": Text(max_length=200, plain_text=True),
+    }
+
     def __init__(
         self,
         image_url: str,
@@ -141,22 +190,12 @@ class ImageBlock(LayoutBlock):
         title: TextObject = None,
         block_id: str = None,
     ):
-        # validate input
-        self.validate_input("image_url", image_url, max_length=3000)
-        self.validate_input("alt_text", alt_text, max_length=2000)
-        if title:
-            title.validate_text_block(
-                max_length=200, required_type=TextObject.BTYPE_PLAINTEXT
-            )
-
-        # initialize the parent
-        super().__init__(btype="image", block_id=block_id)
-
-        # set values once validation has passed
         self.image_url = image_url
         self.alt_text = alt_text
         self.title = title
 
+        super().__init__(btype=self.BTYPE, block_id=block_id)
+
 
 class InputBlock(LayoutBlock):
     """
@@ -179,6 +218,18 @@ class InputBlock(LayoutBlock):
             Defaults to ``False``.
     """
 
+    BTYPE = "input"
+
+    __slots__ = ("label", "element", "hint", "optional")
+
+    RENDER_FIELDS = LayoutBlock.RENDER_FIELDS + __slots__
+    CONSTRAINTS = {
+        "label": Text(max_length=2000, plain_text=True, required=True),
+        "element": Nested(BlockElement, required=True),
+        "hint": Text(max_length=2000, plain_text=True),
+        "optional": Bool(),
+    }
+
     def __init__(
         self,
         label: TextObject,
@@ -187,22 +238,13 @@ class InputBlock(LayoutBlock):
         hint: TextObject = None,
         optional: bool = False,
     ):
-        # validate input
-        label.validate_text_block(
-            max_length=2000, required_type=TextObject.BTYPE_PLAINTEXT
-        )
-        if hint:
-            hint.validate_text_block(
-                max_length=2000, required_type=TextObject.BTYPE_PLAINTEXT
-            )
-
-        super().__init__(btype="input", block_id=block_id)
-
         self.label = label
         self.element = element
         self.hint = hint
         self.optional = optional
 
+        super().__init__(btype=self.BTYPE, block_id=block_id)
+
 
 class SectionBlock(LayoutBlock):
     """
@@ -221,6 +263,17 @@ class SectionBlock(LayoutBlock):
         accessory (BlockElement): One of the available :class:`ElementObject`.
     """
 
+    BTYPE = "section"
+
+    __slots__ = ("text", "fields", "accessory")
+
+    RENDER_FIELDS = LayoutBlock.RENDER_FIELDS + __slots__
+    CONSTRAINTS = {
+        "text": Text(max_length=3000),
+        "fields": Items(Text(max_length=2000), max_items=10),
+        "accessory": Nested(BlockElement),
+    }
+
     def __init__(
         self,
         text: TextObject,
@@ -228,15 +281,8 @@ class SectionBlock(LayoutBlock):
         fields: List[TextObject] = None,
         accessory: BlockElement = None,
     ):
-        super().__init__(btype="section", block_id=block_id)
-
-        # field validation
-        # text can be no longer than 3000 characters
-        if text.get_text_length() > 3000:
-            raise AttributeError(
-                f"text cannot be more than 3000 characters, but got {text.get_text_length()}"
-            )
-
         self.text = text
         self.fields = fields
         self.accessory = accessory
+
+        super().__init__(btype=self.BTYPE, block_id=block_id)
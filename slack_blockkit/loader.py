@@ -0,0 +1,323 @@
+from collections.abc import MutableSequence
+from typing import Any, Dict, List, Optional, Tuple, Type, Union, cast
+
+from .block import Block
+from .composition_object import TextObject
+from .layout_block import LayoutBlock
+from .schema import (
+    Items,
+    Nested,
+    Text,
+    get_constraints,
+    get_dispatch_table,
+    get_type_table,
+)
+from .validation import validate_on_init
+from .view_payload import ViewPayload
+
+# how to load each field of a class: (attribute, key, dispatch table, class of dicts without a type, is list,
+# the list attribute the value is one of)
+LoadField = Tuple[str, str, Optional[dict], Optional[type], bool, Optional[str]]
+LoadPlan = Tuple[LoadField, ...]
+
+# compiled load plans, keyed by class
+_load_plans: Dict[type, LoadPlan] = {}
+
+# the kinds a payload is loaded as when no class is given
+TOP_LEVEL_KINDS = (LayoutBlock, ViewPayload)
+
+VIEW_TYPES = (ViewPayload.BTYPE_HOME, ViewPayload.BTYPE_MODAL)
+
+
+def get_load_plan(cls: type) -> LoadPlan:
+    """
+    Returns the load plan for a block or view class, compiling it on first use. For every field the plan
+    has the key it is read from and, for fields holding blocks, the table of classes to load dicts as, keyed
+    by their ``type``. The tables are the ones validation uses (see :func:`schema.get_dispatch_table`), so
+    a dict is loaded as the class of its ``type`` among the kinds the field is declared to hold.
+
+    Args:
+        cls (type): The class.
+    Returns:
+        LoadPlan: The load plan.
+    """
+    plan = _load_plans.get(cls)
+    if plan is None:
+        plan = _load_plans[cls] = compile_load_plan(cls)
+    return plan
+
+
+def compile_load_plan(cls: type) -> LoadPlan:
+    constraints = get_constraints(cls)
+    if issubclass(cls, Block):
+        fields = [(name, key) for name, key, _ in cls.get_render_plan()]
+    else:
+        # views are not blocks, and render their fields from CONSTRAINTS in the same way
+        fields = [(name, "type" if name == "btype" else name) for name in constraints]
+
+    plan: List[LoadField] = []
+    for name, key in fields:
+        constraint = constraints.get(name)
+        is_list = False
+        if isinstance(constraint, Items):
+            constraint, is_list = constraint.item, True
+
+        if isinstance(constraint, Nested):
+            kinds = constraint.kinds
+        elif isinstance(constraint, Text):
+            kinds = (TextObject,)
+        else:
+            plan.append((name, key, None, None, False, None))
+            continue
+        table = get_dispatch_table(kinds)
+        member_of = None if is_list else getattr(constraint, "member_of", None)
+        plan.append((name, key, table, get_untyped_kind(kinds), is_list, member_of))
+    return tuple(plan)
+
+
+def get_untyped_kind(kinds: tuple) -> Optional[type]:
+    # composition objects such as options are rendered without a type, so a dict without one in a field
+    # holding them is one of them
+    for kind in kinds:
+        if not get_type_table((kind,)):
+            return kind
+    return None
+
+
+def load_object(data: dict, cls: type, validate: bool):
+    obj: Any = object.__new__(cls)
+    for name, key, table, untyped, is_list, member_of in get_load_plan(cls):
+        value = data.get(key)
+        if table is not None and value is not None:
+            if is_list and value.__class__ is list:
+                value = [load_value(item, table, untyped, validate) for item in value]
+            else:
+                member = member_of and get_member(obj, data, member_of, value)
+                value = member or load_value(value, table, untyped, validate)
+        setattr(obj, name, value)
+    if validate:
+        validate_on_init(obj)
+    return obj
+
+
+def get_member(obj, data: dict, member_of: str, value) -> Optional[Block]:
+    # values that must be one of the items of a list, such as an initial option, are loaded as that item.
+    # the list comes before the value in every render plan, so it is already loaded
+    items: Any = data.get(member_of)
+    if items.__class__ is list and value in items:
+        return getattr(obj, member_of)[items.index(value)]
+    return None
+
+
+def load_value(value, table: dict, untyped: Optional[type], validate: bool):
+    if value.__class__ is not dict:
+        return value
+    btype = value.get("type")
+    cls = untyped if btype is None else table.get(btype)
+    # blocks of types this package does not define stay dicts, which can be used anywhere a block can
+    if cls is None:
+        return value
+    return load_object(value, cls, validate)
+
+
+class LazyBlocks(MutableSequence):
+    """
+    The blocks of a :class:`LazyViewPayload`, which are kept as the rendered dicts they were loaded from
+    until they are accessed. Accessing a block by index or by iterating loads it as by :func:`from_dict`,
+    and the loaded block replaces its dict, so later changes to it are rendered. Blocks can be replaced,
+    added and removed like in a ``list``.
+
+    Args:
+        items (list): The rendered blocks.
+        validate (bool): Whether to validate blocks as they are loaded.
+    """
+
+    __slots__ = ("items", "validate", "positions")
+
+    def __init__(self, items: list, validate: bool = True):
+        self.items = items
+        self.validate = validate
+        # block IDs to the position of their block, built on first use
+        self.positions: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        item = self.items[index]
+        if item.__class__ is dict:
+            item = from_dict(item, validate=self.validate)
+            self.items[index] = item
+        return item
+
+    def __setitem__(self, index, value):
+        self.items[index] = value
+        self.positions = None
+
+    def __delitem__(self, index):
+        del self.items[index]
+        self.positions = None
+
+    def insert(self, index: int, value):
+        self.items.insert(index, value)
+        self.positions = None
+
+    def get_raw(self, index: int):
+        """
+        Returns a block without loading it: the rendered ``dict`` if it has not been accessed, and the
+        loaded block otherwise.
+        """
+        return self.items[index]
+
+    def get_position(self, block_id: str) -> Optional[int]:
+        """
+        Returns the position of the block with a ``block_id``, without loading any block.
+
+        Args:
+            block_id (str): The block ID.
+        Returns:
+            int: The position, or ``None`` if no block has the ID.
+        """
+        if self.positions is None:
+            self.positions = {}
+            for position, item in enumerate(self.items):
+                if item.__class__ is dict:
+                    key = item.get("block_id")
+                else:
+                    key = getattr(item, "block_id", None)
+                self.positions.setdefault(key, position)
+        return self.positions.get(block_id)
+
+    def get_render_list(self) -> list:
+        """
+        Returns the blocks as they are rendered: the dicts of the blocks that were never accessed, which are
+        rendered as they are, and the loaded blocks.
+        """
+        return list(self.items)
+
+
+class LazyViewPayload(ViewPayload):
+    """
+    A view loaded from a rendered view, such as the ``view`` of an interaction payload, whose blocks are only
+    loaded when they are accessed. The other fields are loaded right away, and the whole inbound view is kept
+    in ``data``, so handlers reading a single block or value do not pay for loading every block, and blocks
+    that were never accessed are rendered from their dicts without constructing any object.
+
+    Example:
+        >>> view = from_json(request.form["payload"], lazy=True)  # the view of a view_submission
+        >>> block = view.get_block("ticket-42")
+
+    Blocks are validated when they are loaded if ``validate`` is ``True``; the view itself is not validated,
+    since that would load every block.
+
+    :param data: The rendered view.
+    :param validate: Whether to validate the objects as they are loaded. Defaults to ``True``.
+    """
+
+    def __init__(self, data: dict, validate: bool = True):
+        self.data = data
+        view_class = get_dispatch_table((ViewPayload,)).get(
+            data.get("type", ""), ViewPayload
+        )
+        for name, key, table, untyped, _, _ in get_load_plan(view_class):
+            value = data.get(key)
+            if name == "blocks":
+                value = LazyBlocks(list(value or ()), validate)
+            elif table is not None and value is not None:
+                value = load_value(value, table, untyped, validate)
+            setattr(self, name, value)
+
+    def get_position(self, block_id: str) -> Optional[int]:
+        """
+        Returns the position of the block with a ``block_id`` in ``blocks``, without loading any block.
+
+        :param block_id: The block ID.
+        :return: The position, or ``None`` if no block has the ID.
+        """
+        return cast(LazyBlocks, self.blocks).get_position(block_id)
+
+    def get_block(self, block_id: str) -> Union[Block, dict, None]:
+        """
+        Returns the block with a ``block_id``, loading only that block.
+
+        :param block_id: The block ID.
+        :return: The block, or ``None`` if no block has the ID.
+        """
+        position = cast(LazyBlocks, self.blocks).get_position(block_id)
+        return None if position is None else self.blocks[position]
+
+    def get_fields(self) -> dict:
+        fields = super().get_fields()
+        if isinstance(self.blocks, LazyBlocks):
+            fields["blocks"] = self.blocks.get_render_list()
+        return fields
+
+
+def from_dict(
+    data: Union[dict, list], cls: Type = None, validate: bool = True, lazy: bool = False
+) -> Union[Block, ViewPayload, dict, list]:
+    """
+    Loads a rendered block, view or list of blocks, such as the ``view`` of a ``view_submission`` payload,
+    back into :class:`Block` and :class:`ViewPayload` objects that can be changed and rendered again. Each
+    ``dict`` is loaded as the class of its ``type``, looked up in a prebuilt table among the kinds of block
+    its field holds, so a ``type`` of ``image`` is an :class:`ImageBlock` in a view's ``blocks`` and an
+    :class:`ImageElement` in a context block's ``elements``.
+
+    Keys the classes do not have, such as the ``id`` and ``state`` of an inbound view, are dropped. Blocks of
+    types this package does not define stay dicts. Buttons are loaded as :class:`ButtonElement` with their
+    ``style``, which renders the same as the styled button classes.
+
+    Example:
+        >>> view = from_dict(payload["view"])
+        >>> view.blocks[0].text = MarkdownTextObject(text="*Saved*")
+        >>> client.views_update(view_id=payload["view"]["id"], view=view.render())
+
+    Args:
+        data (Union[dict, list]): A rendered block or view, or a list of rendered blocks.
+        cls (Type): Optional; The class to load ``data`` as, or the base class of the classes it can be. Needed
+            for composition objects rendered without a ``type``, such as :class:`OptionObject`. Defaults to
+            any layout block or view.
+        validate (bool): Whether to validate the objects as if they were constructed, according to the
+            validation mode in effect. Pass ``False`` to skip validation for trusted payloads, such as ones
+            rendered by this package. Defaults to ``True``.
+        lazy (bool): If ``True``, load a view as a :class:`LazyViewPayload`, which only loads its blocks
+            when they are accessed. Defaults to ``False``.
+    Returns:
+        Union[Block, ViewPayload, dict, list]: The loaded object, or a list of them.
+    Raises:
+        AttributeError: If ``validate`` is ``True`` and an object is not valid.
+    """
+    if lazy and isinstance(data, dict) and data.get("type") in VIEW_TYPES:
+        return LazyViewPayload(data, validate=validate)
+
+    kinds = TOP_LEVEL_KINDS if cls is None else (cls,)
+    table = get_dispatch_table(kinds)
+    untyped = get_untyped_kind(kinds)
+    if isinstance(data, list):
+        return [load_value(item, table, untyped, validate) for item in data]
+    return load_value(data, table, untyped, validate)
+
+
+def from_json(
+    text: Union[str, bytes], cls: Type = None, validate: bool = True, lazy: bool = False
+) -> Union[Block, ViewPayload, dict, list]:
+    """
+    Loads a block, view or list of blocks from JSON, decoded with the fastest JSON library installed (see
+    :func:`slack_blockkit.utils.set_json_backend`). See :func:`from_dict`.
+
+    Args:
+        text (Union[str, bytes]): The JSON.
+        cls (Type): Optional; The class to load the JSON as, or the base class of the classes it can be.
+        validate (bool): Whether to validate the objects. Defaults to ``True``.
+        lazy (bool): If ``True``, load a view as a :class:`LazyViewPayload`. Defaults to ``False``.
+    Returns:
+        Union[Block, ViewPayload, dict, list]: The loaded object, or a list of them.
+    Raises:
+        AttributeError: If ``validate`` is ``True`` and an object is not valid.
+    """
+    from slack_blockkit.utils.serialization import get_json_backend
+
+    data = get_json_backend().loads(text)
+    return from_dict(data, cls=cls, validate=validate, lazy=lazy)
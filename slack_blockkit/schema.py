@@ -0,0 +1,567 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# checks the fields of an object, or a whole tree, adding errors to a list as (path, message) strings
+Checker = Callable[[object, tuple, List[str]], None]
+
+
+class Constraint:
+    """
+    Base class for the constraints on a field, which are declared in the ``CONSTRAINTS`` table of each class
+    and compiled into checker functions. Subclasses return the conditions that make a value invalid.
+
+    Args:
+        required (bool): Whether the field must be set, defaults to ``False``.
+    """
+
+    __slots__ = ("required",)
+
+    def __init__(self, required: bool = False):
+        self.required = required
+
+    def get_conditions(self, var: str, compiler: "Compiler") -> List[Tuple[str, str]]:
+        """
+        Returns the conditions checked on a value that is not ``None``, in order, each as a pair of Python
+        expressions: one that is true if the value is invalid, and one that builds the error message.
+        """
+        return []
+
+    def get_nested_lines(
+        self, var: str, path: str, compiler: "Compiler"
+    ) -> Optional[List[str]]:
+        """
+        Returns the statements run on a value that passes every condition, such as checks of its items, or
+        ``None`` if there are none.
+        """
+        return None
+
+    def get_max_length(self) -> Optional[int]:
+        """
+        Returns the max length of the string or text of the field, or ``None`` if there is no limit.
+        """
+        return None
+
+
+class Str(Constraint):
+    """
+    A string field.
+
+    Args:
+        max_length (int): The max length of the string, if any.
+        one_of (Sequence[str]): The values the string may take, if limited.
+        required (bool): Whether the field must be set.
+    """
+
+    __slots__ = ("max_length", "one_of")
+
+    def __init__(
+        self,
+        max_length: int = None,
+        one_of: Sequence[str] = None,
+        required: bool = False,
+    ):
+        super().__init__(required=required)
+        self.max_length = max_length
+        self.one_of = tuple(one_of) if one_of else None
+
+    def get_conditions(self, var, compiler):
+        conditions = [
+            (
+                f"not isinstance({var}, str)",
+                f"'must be a string, but is ' + type({var}).__name__",
+            )
+        ]
+        if self.max_length:
+            conditions.append(
+                (
+                    f"len({var}) > {self.max_length}",
+                    f"'cannot be greater than {self.max_length} characters, but is ' + str(len({var}))",
+                )
+            )
+        if self.one_of:
+            values = compiler.add_constant(self.one_of)
+            conditions.append(
+                (
+                    f"{var} not in {values}",
+                    f"'must be one of the following values: {','.join(self.one_of)}, but is ' + repr({var})",
+                )
+            )
+        return conditions
+
+    def get_max_length(self):
+        return self.max_length
+
+
+class Bool(Constraint):
+    """
+    A boolean field.
+    """
+
+    __slots__ = ()
+
+    def get_conditions(self, var, compiler):
+        return [
+            (
+                f"{var}.__class__ is not bool",
+                f"'must be a boolean, but is ' + type({var}).__name__",
+            )
+        ]
+
+
+class Int(Constraint):
+    """
+    An integer field.
+
+    Args:
+        min_value (int): The smallest value allowed.
+        max_value (int): The largest value allowed.
+        not_greater_than (str): The name of another integer field this one cannot exceed when that field is
+            set to a non-zero value.
+        required (bool): Whether the field must be set.
+    """
+
+    __slots__ = ("min_value", "max_value", "not_greater_than")
+
+    def __init__(
+        self,
+        min_value: int,
+        max_value: int,
+        not_greater_than: str = None,
+        required: bool = False,
+    ):
+        super().__init__(required=required)
+        self.min_value = min_value
+        self.max_value = max_value
+        self.not_greater_than = not_greater_than
+
+    def get_conditions(self, var, compiler):
+        conditions = [
+            (
+                f"{var}.__class__ is not int",
+                f"'must be an integer, but is ' + type({var}).__name__",
+            ),
+            (
+                f"{var} < {self.min_value} or {var} > {self.max_value}",
+                f"'must be between {self.min_value} and {self.max_value} (inclusive), but is ' + str({var})",
+            ),
+        ]
+        if self.not_greater_than:
+            other = compiler.get_field(self.not_greater_than)
+            conditions.append(
+                (
+                    f"isinstance({other}, int) and {other} and {var} > {other}",
+                    f"'cannot be greater than {self.not_greater_than} (' + str({other}) + '), but is ' + str({var})",
+                )
+            )
+        return conditions
+
+
+class Text(Constraint):
+    """
+    A text object field.
+
+    Args:
+        max_length (int): The max length of the text, if any.
+        plain_text (bool): Whether the text object must be ``plain_text``, defaults to ``False``.
+        required (bool): Whether the field must be set.
+    """
+
+    __slots__ = ("max_length", "plain_text")
+
+    def __init__(
+        self, max_length: int = None, plain_text: bool = False, required: bool = False
+    ):
+        super().__init__(required=required)
+        self.max_length = max_length
+        self.plain_text = plain_text
+
+    def get_conditions(self, var, compiler):
+        if compiler.dict_mode:
+            btype, text = f"{var}.get('type')", f"{var}.get('text')"
+            is_text = f"isinstance({var}, dict) and {btype} in TEXT_TYPES"
+        else:
+            btype, text = f"{var}.btype", f"{var}.text"
+            is_text = f"isinstance({var}, TextObject)"
+
+        conditions = [(f"not ({is_text})", "'must be a text object'")]
+        if self.plain_text:
+            conditions.append(
+                (
+                    f"{btype} != 'plain_text'",
+                    f"'must be plain_text, but is ' + str({btype})",
+                )
+            )
+        if self.max_length:
+            conditions.append(
+                (
+                    f"isinstance({text}, str) and len({text}) > {self.max_length}",
+                    f"'text cannot be greater than {self.max_length} characters, but is ' + str(len({text}))",
+                )
+            )
+        return conditions
+
+    def get_nested_lines(self, var, path, compiler):
+        if compiler.dict_mode:
+            return [f"DICT_CHECKERS[TEXT_TYPES[{var}['type']]]({var}, {path}, errors)"]
+        if compiler.tree:
+            return [f"TREE_CHECKERS[{var}.__class__]({var}, {path}, errors)"]
+        return None
+
+    def get_max_length(self):
+        return self.max_length
+
+
+class Nested(Constraint):
+    """
+    A field holding a block or composition object, either as an object or as a rendered ``dict``. Objects of
+    any block class are accepted, as blocks are not always nested the way Slack documents them. Dicts are
+    checked as the class of the given kinds matching their ``type``, or as any block class matching it if
+    none does. Dicts of unknown types, such as blocks this package does not support, are not checked.
+
+    Args:
+        kinds: The classes the object is expected to be an instance of.
+        member_of (str): The name of a list field that must contain the object, if any.
+        required (bool): Whether the field must be set.
+    """
+
+    __slots__ = ("kinds", "member_of")
+
+    def __init__(self, *kinds: type, member_of: str = None, required: bool = False):
+        super().__init__(required=required)
+        self.kinds = kinds
+        self.member_of = member_of
+
+    def get_conditions(self, var, compiler):
+        if compiler.dict_mode:
+            conditions = [(f"not isinstance({var}, dict)", "'must be an object'")]
+        else:
+            conditions = [
+                (
+                    f"not isinstance({var}, NESTED_TYPES)",
+                    f"'must be a block, but is ' + type({var}).__name__",
+                )
+            ]
+
+        if self.member_of:
+            items = compiler.get_field(self.member_of)
+            conditions.append(
+                (
+                    f"{var} not in ({items} or ())",
+                    f"'must be one of the items in {self.member_of}'",
+                )
+            )
+        return conditions
+
+    def get_nested_lines(self, var, path, compiler):
+        if not compiler.tree:
+            return None
+
+        if get_type_table(self.kinds):
+            table = compiler.add_constant(get_dispatch_table(self.kinds))
+            cls = compiler.add_variable("cls")
+            check_dict = [
+                f"{cls} = {table}.get({var}.get('type'))",
+                f"if {cls} is not None:",
+                f"    DICT_CHECKERS[{cls}]({var}, {path}, errors)",
+            ]
+        else:
+            # composition objects like options have no type, so there is only one class to check them as
+            kind = compiler.add_constant(self.kinds[0])
+            check_dict = [f"DICT_CHECKERS[{kind}]({var}, {path}, errors)"]
+        if compiler.dict_mode:
+            return check_dict
+        return (
+            [f"if {var}.__class__ is dict:"]
+            + ["    " + line for line in check_dict]
+            + ["else:", f"    TREE_CHECKERS[{var}.__class__]({var}, {path}, errors)"]
+        )
+
+
+class Items(Constraint):
+    """
+    A list field.
+
+    Args:
+        item (Constraint): The constraint on each item of the list.
+        min_items (int): The fewest items allowed, if any.
+        max_items (int): The most items allowed, if any.
+        required (bool): Whether the field must be set.
+    """
+
+    __slots__ = ("item", "min_items", "max_items")
+
+    def __init__(
+        self,
+        item: Constraint,
+        min_items: int = None,
+        max_items: int = None,
+        required: bool = False,
+    ):
+        super().__init__(required=required)
+        self.item = item
+        self.min_items = min_items
+        self.max_items = max_items
+
+    def get_conditions(self, var, compiler):
+        return [
+            (
+                f"not isinstance({var}, (list, tuple))",
+                f"'must be a list, but is ' + type({var}).__name__",
+            )
+        ]
+
+    def get_nested_lines(self, var, path, compiler):
+        # the number of items is checked separately, so the items are checked even if there are too many
+        lines = []
+        if self.max_items:
+            lines += [
+                f"if len({var}) > {self.max_items}:",
+                f"    errors.append(format_error({path}, 'cannot have more than {self.max_items} items, "
+                f"but has ' + str(len({var}))))",
+            ]
+        if self.min_items:
+            lines += [
+                f"if len({var}) < {self.min_items}:",
+                f"    errors.append(format_error({path}, 'cannot have fewer than {self.min_items} items, "
+                f"but has ' + str(len({var}))))",
+            ]
+        index, item = compiler.add_variable("index"), compiler.add_variable("item")
+        lines.append(f"for {index}, {item} in enumerate({var}):")
+        body = compiler.compile_value(self.item, item, f"({path}, {index})")
+        return lines + ["    " + line for line in body]
+
+    def get_max_length(self):
+        return self.item.get_max_length()
+
+
+class Compiler:
+    """
+    Generates the source of a checker function for a class from its constraints.
+
+    Args:
+        cls (type): The class to compile a checker for.
+        dict_mode (bool): Whether the checker validates rendered dicts instead of objects.
+        tree (bool): Whether the checker also checks the objects within the fields.
+    """
+
+    def __init__(self, cls: type, dict_mode: bool, tree: bool):
+        self.cls = cls
+        self.dict_mode = dict_mode
+        self.tree = tree or dict_mode
+        self.namespace: Dict[str, object] = {}
+        self.variables = 0
+
+    def add_constant(self, value) -> str:
+        name = f"CONSTANT_{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def add_variable(self, prefix: str) -> str:
+        self.variables += 1
+        return f"{prefix}_{self.variables}"
+
+    def get_field(self, name: str) -> str:
+        """
+        Returns the expression that reads a field of the object being checked.
+        """
+        if self.dict_mode:
+            return f"value.get({get_key(name)!r})"
+        return f"value.{name}"
+
+    def compile_value(self, constraint: Constraint, var: str, path: str) -> List[str]:
+        """
+        Returns the statements that check a value held in ``var``, whose path is built by ``path``.
+        """
+        lines = [f"if {var} is None:"]
+        if constraint.required:
+            lines.append(f"    errors.append(format_error({path}, 'is required'))")
+        else:
+            lines.append("    pass")
+        for condition, message in constraint.get_conditions(var, self):
+            lines.append(f"elif {condition}:")
+            lines.append(f"    errors.append(format_error({path}, {message}))")
+
+        nested = constraint.get_nested_lines(var, path, self)
+        if nested:
+            lines.append("else:")
+            lines.extend("    " + line for line in nested)
+        return lines
+
+    def compile(self) -> Checker:
+        lines = ["def check(value, path, errors):"]
+        for name, constraint in get_constraints(self.cls).items():
+            var = self.add_variable("field")
+            lines.append(f"    {var} = {self.get_field(name)}")
+            body = self.compile_value(constraint, var, f"(path, {get_key(name)!r})")
+            lines.extend("    " + line for line in body)
+        if len(lines) == 1:
+            lines.append("    pass")
+
+        from slack_blockkit.block import Block
+        from slack_blockkit.composition_object import TextObject
+
+        namespace: Dict[str, Any] = dict(
+            self.namespace,
+            TextObject=TextObject,
+            TEXT_TYPES=get_type_table((TextObject,)),
+            NESTED_TYPES=(Block, dict),
+            DICT_CHECKERS=DICT_CHECKERS,
+            TREE_CHECKERS=TREE_CHECKERS,
+            format_error=format_error,
+        )
+        exec("\n".join(lines), namespace)
+        return namespace["check"]
+
+
+class CheckerCache(dict):
+    """
+    The compiled checkers of one kind, keyed by class and compiled on first use.
+
+    Args:
+        dict_mode (bool): Whether the checkers validate rendered dicts.
+        tree (bool): Whether the checkers also check the objects within the fields.
+    """
+
+    def __init__(self, dict_mode: bool, tree: bool):
+        super().__init__()
+        self.dict_mode = dict_mode
+        self.tree = tree
+
+    def __missing__(self, cls: type) -> Checker:
+        checker = self[cls] = Compiler(cls, self.dict_mode, self.tree).compile()
+        return checker
+
+
+# checkers for the fields of a single object, as used when a block is constructed
+FIELD_CHECKERS = CheckerCache(dict_mode=False, tree=False)
+# checkers for an object and every object within it
+TREE_CHECKERS = CheckerCache(dict_mode=False, tree=True)
+# checkers for a rendered dict and every dict within it
+DICT_CHECKERS = CheckerCache(dict_mode=True, tree=True)
+
+# tables of classes by their type, keyed by the kinds of classes in the table
+_type_tables: Dict[tuple, Dict[str, type]] = {}
+
+
+def get_key(name: str) -> str:
+    # type is a reserved keyword, so btype is rendered as type
+    return "type" if name == "btype" else name
+
+
+def get_constraints(cls: type) -> Dict[str, Constraint]:
+    """
+    Returns the constraints of a class, including those declared by the classes it inherits from.
+
+    Args:
+        cls (type): The class.
+    Returns:
+        Dict[str, Constraint]: The constraints, keyed by attribute name.
+    """
+    constraints = {}
+    for klass in reversed(cls.__mro__):
+        constraints.update(klass.__dict__.get("CONSTRAINTS", {}))
+    return constraints
+
+
+def get_max_length(cls: type, name: str) -> Optional[int]:
+    """
+    Returns the max length of a string or text object attribute of a class.
+
+    Args:
+        cls (type): The class.
+        name (str): The attribute name.
+    Returns:
+        int: The max length, or ``None`` if there is no limit.
+    """
+    constraint = get_constraints(cls).get(name)
+    return constraint.get_max_length() if constraint else None
+
+
+def get_type_table(kinds: Sequence[type]) -> Dict[str, type]:
+    """
+    Returns the classes that rendered dicts of the given kinds are validated as, keyed by their ``type``.
+    Classes declare their type in ``BTYPE``; if two classes have the same type, the first kind listed wins.
+
+    Args:
+        kinds (Sequence[type]): The base classes.
+    Returns:
+        Dict[str, type]: The classes, keyed by type.
+    """
+    kinds = tuple(kinds)
+    table = _type_tables.get(kinds)
+    if table is None:
+        # the dispatch tables need every block class, which may not have been imported yet
+        import slack_blockkit.layout_block  # noqa F401
+        import slack_blockkit.view_payload  # noqa F401
+
+        table = {}
+        pending = list(kinds)
+        while pending:
+            cls = pending.pop(0)
+            btype = cls.__dict__.get("BTYPE")
+            if btype:
+                table.setdefault(btype, cls)
+            pending.extend(cls.__subclasses__())
+        _type_tables[kinds] = table
+    return table
+
+
+def format_error(path: tuple, message: str) -> str:
+    """
+    Formats an error message with the path to the invalid value. The path is a chain of
+    ``(parent path, key)`` tuples, so it is only formatted if there is an error.
+    """
+    parts = []
+    while len(path) == 2:
+        path, key = path
+        parts.append(f"[{key}]" if isinstance(key, int) else f".{key}")
+    parts.append(path[0])
+    return "".join(reversed(parts)) + ": " + message
+
+
+def get_dispatch_table(kinds: Sequence[type]) -> Dict[str, type]:
+    """
+    Returns the classes that rendered dicts expected to be of the given kinds are validated as, keyed by
+    their ``type``. Types that none of the kinds have are matched to any block class instead, since blocks
+    are not always nested the way Slack documents them.
+
+    Args:
+        kinds (Sequence[type]): The base classes.
+    Returns:
+        Dict[str, type]: The classes, keyed by type.
+    """
+    key = ("dispatch",) + tuple(kinds)
+    table = _type_tables.get(key)
+    if table is None:
+        from slack_blockkit.block_element import BlockElement
+        from slack_blockkit.composition_object import TextObject
+        from slack_blockkit.layout_block import LayoutBlock
+        from slack_blockkit.view_payload import ViewPayload
+
+        # layout blocks come first, since they are the most common at the top level of a payload
+        all_kinds = (LayoutBlock, ViewPayload, TextObject, BlockElement)
+        table = _type_tables[key] = dict(
+            get_type_table(all_kinds), **get_type_table(kinds)
+        )
+    return table
+
+
+def check_payload(value, path: tuple, errors: List[str]):
+    """
+    Checks a payload value in one pass, adding an error for every invalid object within it to ``errors``.
+    Objects are checked against the constraints of their class, and rendered dicts against those of the
+    class matching their ``type``.
+
+    Args:
+        value: A block, a :class:`ViewPayload`, a rendered block or view ``dict``, or a list of them.
+        path (tuple): The path of the value, such as ``("blocks",)``.
+        errors (List[str]): The list to add errors to.
+    """
+    if isinstance(value, (list, tuple)):
+        for index, item in enumerate(value):
+            check_payload(item, (path, index), errors)
+    elif isinstance(value, dict):
+        cls = get_dispatch_table(()).get(value.get("type", ""))
+        if cls is not None:
+            DICT_CHECKERS[cls](value, path, errors)
+    elif value is not None:
+        TREE_CHECKERS[value.__class__](value, path, errors)
@@ -1 +1,16 @@
-from .utils import get_blocks, get_validated_input, test_blocks_online  # noqa F401
+from .utils import (  # noqa F401
+    get_blocks,
+    get_blocks_json,
+    get_etag,
+    get_validated_input,
+    iter_blocks_json,
+    test_blocks_online,
+    validate_blocks,
+)
+from .serialization import (  # noqa F401
+    get_available_json_backends,
+    get_json_backend,
+    set_json_backend,
+    to_json,
+)
+from .template import render_many  # noqa F401
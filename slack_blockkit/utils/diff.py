@@ -0,0 +1,265 @@
+import hashlib
+import json
+
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from slack_blockkit.utils import get_blocks
+from slack_blockkit.utils.utils import Blocks
+from slack_blockkit.view_payload import ViewPayload
+
+
+class BlockChange:
+    """
+    A block that was added, removed, moved or changed between two lists of blocks.
+
+    Args:
+        key (str): The ``block_id`` of the block, or a hash of its content if it has none.
+        old_index (int): The index of the block in the old blocks, or ``None`` if it was added.
+        new_index (int): The index of the block in the new blocks, or ``None`` if it was removed.
+        old (dict): The block in the old blocks, or ``None`` if it was added.
+        new (dict): The block in the new blocks, or ``None`` if it was removed.
+    """
+
+    __slots__ = ("key", "old_index", "new_index", "old", "new")
+
+    def __init__(
+        self,
+        key: str,
+        old_index: Optional[int],
+        new_index: Optional[int],
+        old: Optional[dict],
+        new: Optional[dict],
+    ):
+        self.key = key
+        self.old_index = old_index
+        self.new_index = new_index
+        self.old = old
+        self.new = new
+
+    def __repr__(self) -> str:
+        return f"BlockChange({self.key!r}, {self.old_index}, {self.new_index})"
+
+
+class BlockDiff:
+    """
+    The differences between two lists of blocks, as returned by :func:`diff_blocks`. A block that was both
+    moved and changed is in both ``moved`` and ``changed``.
+
+    Args:
+        added (List[BlockChange]): The blocks only in the new blocks.
+        removed (List[BlockChange]): The blocks only in the old blocks.
+        moved (List[BlockChange]): The blocks whose position changed relative to the other blocks. This is
+            the fewest blocks that need to move to turn the old order into the new one.
+        changed (List[BlockChange]): The blocks in both whose content changed.
+        order (List[str]): The keys of the new blocks, in order, or ``None`` if nothing changed.
+    """
+
+    __slots__ = ("added", "removed", "moved", "changed", "order")
+
+    def __init__(
+        self,
+        added: List[BlockChange],
+        removed: List[BlockChange],
+        moved: List[BlockChange],
+        changed: List[BlockChange],
+        order: Optional[List[str]],
+    ):
+        self.added = added
+        self.removed = removed
+        self.moved = moved
+        self.changed = changed
+        self.order = order
+
+    def has_changes(self) -> bool:
+        """
+        Returns whether anything changed, so updates can be skipped when nothing did.
+        """
+        return bool(self.added or self.removed or self.moved or self.changed)
+
+    def __bool__(self) -> bool:
+        return self.has_changes()
+
+    def apply(self, old_blocks: Blocks) -> Blocks:
+        """
+        Applies the differences to the old blocks, which gives the new blocks. Blocks that did not change are
+        shared with ``old_blocks``.
+
+        Args:
+            old_blocks (Blocks): The old blocks the differences were found from.
+        Returns:
+            Blocks: The new blocks.
+        """
+        if self.order is None:
+            return list(old_blocks)
+
+        blocks: Dict[str, Any] = dict(zip(get_block_keys(old_blocks), old_blocks))
+        blocks.update((change.key, change.new) for change in self.added)
+        blocks.update((change.key, change.new) for change in self.changed)
+        return [blocks[key] for key in self.order]
+
+
+class ViewDiff(BlockDiff):
+    """
+    The differences between two views, as returned by :func:`diff_views`.
+
+    Args:
+        fields (Dict[str, Tuple]): The fields of the view other than ``blocks`` that changed, as a tuple of
+            the old and new value. Fields that were added or removed have a value of ``None``.
+    """
+
+    __slots__ = ("fields",)
+
+    def __init__(self, fields: Dict[str, Tuple], diff: BlockDiff):
+        super().__init__(
+            added=diff.added,
+            removed=diff.removed,
+            moved=diff.moved,
+            changed=diff.changed,
+            order=diff.order,
+        )
+        self.fields = fields
+
+    def has_changes(self) -> bool:
+        return bool(self.fields) or super().has_changes()
+
+
+def get_block_key(block: dict) -> str:
+    """
+    Returns the key a rendered block is matched by: its ``block_id``, or a hash of its content if it has none.
+    """
+    block_id = block.get("block_id")
+    if block_id is not None:
+        return block_id
+    content = json.dumps(block, sort_keys=True).encode()
+    return "#" + hashlib.blake2b(content, digest_size=12).hexdigest()
+
+
+def get_block_keys(blocks: Blocks) -> List[str]:
+    """
+    Returns the keys of rendered blocks. Blocks with the same key, such as identical blocks without a
+    ``block_id``, get a suffix counting the earlier ones, so every key is unique.
+    """
+    keys = []
+    seen: Dict[str, int] = {}
+    for block in blocks:
+        key = get_block_key(block)
+        count = seen.get(key, 0) + 1
+        seen[key] = count
+        keys.append(key if count == 1 else f"{key}#{count}")
+    return keys
+
+
+def get_stable_positions(indices: Sequence[int]) -> Set[int]:
+    """
+    Returns the positions of a longest increasing subsequence of ``indices`` in O(n log n) time. For the old
+    indices of the blocks kept, in their new order, these are the blocks that keep their relative order;
+    all other kept blocks were moved.
+    """
+    # tails[length - 1] is the smallest last index of an increasing subsequence of that length so far
+    tails: List[int] = []
+    tail_positions: List[int] = []
+    previous = [-1] * len(indices)
+    for position, index in enumerate(indices):
+        length = bisect_left(tails, index)
+        if length == len(tails):
+            tails.append(index)
+            tail_positions.append(position)
+        else:
+            tails[length] = index
+            tail_positions[length] = position
+        previous[position] = tail_positions[length - 1] if length else -1
+
+    stable = set()
+    position = tail_positions[-1] if tail_positions else -1
+    while position != -1:
+        stable.add(position)
+        position = previous[position]
+    return stable
+
+
+def render_blocks(blocks: list) -> Blocks:
+    if any(not isinstance(block, dict) for block in blocks):
+        return get_blocks(*blocks)
+    return blocks
+
+
+def diff_blocks(old_blocks: list, new_blocks: list) -> BlockDiff:
+    """
+    Finds the blocks that were added, removed, moved or changed between two lists of blocks, matching blocks
+    by their ``block_id``. Blocks without a ``block_id`` are matched by a hash of their content, so they are
+    never changed, only added or removed. Runs in O(n log n) time.
+
+    Example:
+        >>> blocks = get_blocks(*get_home_blocks(user))
+        >>> if diff_blocks(sent_blocks, blocks):
+        ...     client.chat_update(channel=channel, ts=ts, blocks=blocks)
+
+    Args:
+        old_blocks (list): The old blocks, as returned by ``get_blocks`` or as a list of blocks and dicts.
+        new_blocks (list): The new blocks, in the same form.
+    Returns:
+        BlockDiff: The differences, which is falsy if nothing changed.
+    """
+    old_blocks, new_blocks = render_blocks(old_blocks), render_blocks(new_blocks)
+    if old_blocks == new_blocks:
+        return BlockDiff(added=[], removed=[], moved=[], changed=[], order=None)
+
+    old_keys, new_keys = get_block_keys(old_blocks), get_block_keys(new_blocks)
+    old_indices = {key: index for index, key in enumerate(old_keys)}
+    new_key_set = set(new_keys)
+
+    added, changed = [], []
+    kept: List[BlockChange] = []
+    for new_index, (key, block) in enumerate(zip(new_keys, new_blocks)):
+        old_index = old_indices.get(key)
+        if old_index is None:
+            added.append(BlockChange(key, None, new_index, None, block))
+            continue
+        change = BlockChange(key, old_index, new_index, old_blocks[old_index], block)
+        kept.append(change)
+        if change.old != block:
+            changed.append(change)
+
+    stable = get_stable_positions([old_indices[change.key] for change in kept])
+    moved = [change for position, change in enumerate(kept) if position not in stable]
+    removed = [
+        BlockChange(key, old_index, None, old_blocks[old_index], None)
+        for old_index, key in enumerate(old_keys)
+        if key not in new_key_set
+    ]
+    return BlockDiff(
+        added=added, removed=removed, moved=moved, changed=changed, order=new_keys
+    )
+
+
+def diff_views(
+    old_view: Union[ViewPayload, dict], new_view: Union[ViewPayload, dict]
+) -> ViewDiff:
+    """
+    Finds the differences between two views: the fields other than ``blocks`` that changed, and the blocks
+    that were added, removed, moved or changed as found by :func:`diff_blocks`.
+
+    Example:
+        >>> view = get_home_view(user)
+        >>> if diff_views(published_views[user.id], view):
+        ...     client.views_publish(user_id=user.id, view=view.render_json())
+
+    Args:
+        old_view: The old view, as a :class:`ViewPayload` or its rendered ``dict``.
+        new_view: The new view, in the same form.
+    Returns:
+        ViewDiff: The differences, which is falsy if nothing changed.
+    """
+    if isinstance(old_view, ViewPayload):
+        old_view = old_view.render()
+    if isinstance(new_view, ViewPayload):
+        new_view = new_view.render()
+
+    fields: Dict[str, Tuple] = {
+        key: (old_view.get(key), new_view.get(key))
+        for key in dict.fromkeys([*old_view, *new_view])
+        if key != "blocks" and old_view.get(key) != new_view.get(key)
+    }
+    diff = diff_blocks(old_view.get("blocks", []), new_view.get("blocks", []))
+    return ViewDiff(fields, diff)
@@ -0,0 +1,192 @@
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from slack_blockkit.block_element import (
+    DatepickerElement,
+    PlainTextInputElement,
+    RadioButtonGroupElement,
+)
+from slack_blockkit.layout_block import InputBlock
+from slack_blockkit.validation import ValidationError
+
+# how to extract each input: (block_id, action_id, convert, min length, max length, required)
+InputPlan = Tuple[Tuple[str, str, Callable[[dict], Any], int, int, bool], ...]
+
+
+class InputValidationError(ValidationError):
+    """
+    Raised by :class:`InputExtractor` when submitted values do not meet the constraints of their inputs.
+
+    Args:
+        block_errors (Dict[str, str]): An error message for each invalid input, keyed by its ``block_id``.
+    """
+
+    def __init__(self, block_errors: Dict[str, str]):
+        super().__init__(
+            [f"{block_id}: {error}" for block_id, error in block_errors.items()]
+        )
+        self.block_errors = block_errors
+
+    def get_response(self) -> dict:
+        """
+        Returns the response to a ``view_submission`` that shows the errors next to their inputs in the modal.
+
+        Returns:
+            dict: The response payload.
+        """
+        return {"response_action": "errors", "errors": self.block_errors}
+
+
+def get_plain_text_value(state: dict) -> Optional[str]:
+    return state.get("value")
+
+
+def get_date_value(state: dict) -> Optional[date]:
+    selected = state.get("selected_date")
+    return datetime.strptime(selected, "%Y-%m-%d").date() if selected else None
+
+
+def get_option_value(state: dict) -> Optional[str]:
+    selected = state.get("selected_option")
+    return selected.get("value") if selected else None
+
+
+def get_state(state: dict) -> dict:
+    # elements without a converter give their state as it is
+    return state
+
+
+# converts the state of each kind of element to its value
+CONVERTERS: Dict[type, Callable[[dict], Any]] = {
+    PlainTextInputElement: get_plain_text_value,
+    DatepickerElement: get_date_value,
+    RadioButtonGroupElement: get_option_value,
+}
+
+
+class InputExtractor:
+    """
+    Extracts the values of the input blocks of a modal from its ``view_submission`` payloads. The input blocks
+    are compiled once into a plan with the ``block_id`` and ``action_id`` each value is found at in
+    ``view.state.values`` and how to convert it, so each submission is handled in a single pass over the plan
+    without walking the blocks. The ``min_length`` and ``max_length`` of plain-text inputs, and whether inputs
+    are optional, are checked in the same pass.
+
+    Values are keyed by the ``action_id`` of their element, and are:
+
+    - a ``str`` for a :class:`PlainTextInputElement`,
+    - a ``datetime.date`` for a :class:`DatepickerElement`,
+    - the ``value`` of the selected option for a :class:`RadioButtonGroupElement`,
+    - the state ``dict`` as it is for other elements,
+
+    or ``None`` if the input is empty.
+
+    Example:
+        >>> extractor = InputExtractor(get_ticket_modal())
+        >>> ...
+        >>> try:
+        ...     values = extractor.extract(payload)
+        ... except InputValidationError as e:
+        ...     return e.get_response()
+        >>> tickets.create(title=values["title"], due=values["due-date"])
+
+    Args:
+        view: The modal, as a :class:`ViewPayload` or its list of blocks. Blocks other than an
+            :class:`InputBlock` are skipped.
+    Raises:
+        AttributeError: If two input elements have the same ``action_id``, or an input block has no
+            ``block_id`` or its element no ``action_id``.
+    """
+
+    __slots__ = ("plan",)
+
+    def __init__(self, view):
+        self.plan = compile_input_plan(getattr(view, "blocks", view))
+
+    def get_names(self) -> List[str]:
+        """
+        Returns the names values are extracted as, which are the ``action_id`` of each input element.
+        """
+        return [entry[1] for entry in self.plan]
+
+    def extract(self, payload: dict) -> dict:
+        """
+        Extracts the values of the inputs from a submission.
+
+        Args:
+            payload (dict): The ``view_submission`` payload, its ``view``, or the ``view.state.values``.
+        Returns:
+            dict: The value of each input, keyed by the ``action_id`` of its element.
+        Raises:
+            InputValidationError: If a value is missing from a required input, or does not meet the length
+                constraints of its input.
+        """
+        values = get_state_values(payload)
+        extracted = {}
+        errors = {}
+        for entry in self.plan:
+            block_id, action_id, convert, min_length, max_length, required = entry
+            state = values.get(block_id)
+            state = state.get(action_id) if state else None
+            value = convert(state) if state else None
+            extracted[action_id] = value
+
+            if value is None or value == "":
+                if required:
+                    errors[block_id] = "This field is required"
+            elif min_length and len(value) < min_length:
+                errors[block_id] = f"Must be at least {min_length} characters"
+            elif max_length and len(value) > max_length:
+                errors[block_id] = f"Must be at most {max_length} characters"
+
+        if errors:
+            raise InputValidationError(errors)
+        return extracted
+
+
+def get_state_values(payload: dict) -> dict:
+    view = payload.get("view", payload)
+    state = view.get("state")
+    return state.get("values", {}) if state is not None else view
+
+
+def get_converter(cls: type) -> Callable[[dict], Any]:
+    # memoized and frozen blocks are subclasses of their block class
+    for klass in cls.__mro__:
+        convert = CONVERTERS.get(klass)
+        if convert is not None:
+            return convert
+    return get_state
+
+
+def compile_input_plan(blocks: list) -> InputPlan:
+    plan = []
+    names = set()
+    for block in blocks:
+        if not isinstance(block, InputBlock):
+            continue
+        element = block.element
+        if block.block_id is None or element.action_id is None:
+            raise AttributeError(
+                "input blocks need a block_id, and their element an action_id"
+            )
+        if element.action_id in names:
+            raise AttributeError(
+                f"action_id {element.action_id} is used by more than one input"
+            )
+        names.add(element.action_id)
+
+        min_length = max_length = 0
+        if isinstance(element, PlainTextInputElement):
+            min_length, max_length = element.min_length, element.max_length
+        plan.append(
+            (
+                block.block_id,
+                element.action_id,
+                get_converter(element.__class__),
+                min_length or 0,
+                max_length or 0,
+                not block.optional,
+            )
+        )
+    return tuple(plan)
@@ -0,0 +1,164 @@
+import copy
+
+from typing import List, Optional, Tuple
+
+from slack_blockkit.block import PayloadSize, get_list_size
+from slack_blockkit.layout_block import DividerBlock, SectionBlock
+from slack_blockkit.view_payload import ViewPayload
+
+# the most blocks Slack accepts in a message, and in a modal or home tab
+MAX_MESSAGE_BLOCKS = 50
+MAX_VIEW_BLOCKS = 100
+
+
+def get_block_type(block) -> Optional[str]:
+    if isinstance(block, dict):
+        return block.get("type")
+    return getattr(block, "btype", None)
+
+
+def is_divider(block) -> bool:
+    return get_block_type(block) == DividerBlock.BTYPE
+
+
+def is_page_boundary(block) -> bool:
+    """
+    Returns whether a page can start at a block: at a section, or at a divider, which is then dropped.
+    """
+    return get_block_type(block) in (SectionBlock.BTYPE, DividerBlock.BTYPE)
+
+
+def get_page_bytes(page: List[Tuple[object, int]], base_bytes: int) -> int:
+    return base_bytes + get_list_size([size for _, size in page])
+
+
+def get_last_boundary(page: List[Tuple[object, int]]) -> int:
+    for index in range(len(page) - 1, 0, -1):
+        if is_page_boundary(page[index][0]):
+            return index
+    return 0
+
+
+def paginate_blocks(
+    blocks: list,
+    max_blocks: int = MAX_MESSAGE_BLOCKS,
+    max_bytes: int = None,
+    base_bytes: int = 0,
+    size: PayloadSize = None,
+) -> List[list]:
+    """
+    Splits a list of blocks into pages that each fit in a message, such as the results of a search that
+    would not fit in one. Pages end before a :class:`SectionBlock` or at a :class:`DividerBlock` where they
+    can, so related blocks, such as a section and the context below it, stay together; dividers at the start
+    or end of a page are dropped. A page is only split elsewhere if it has no such boundary. Blocks that fit
+    in one page are returned as they are.
+
+    Pages are only measured with a ``max_bytes``. The sizes recorded in ``size`` when the blocks were
+    rendered are used if it is given; otherwise each block is measured as by
+    :meth:`PayloadSize.add_blocks`, so memoized blocks are measured by their memoized JSON.
+
+    Example:
+        >>> for page in paginate_blocks(get_result_blocks(results)):
+        ...     client.chat_postMessage(channel=channel, blocks=get_blocks(*page), text="Search results")
+
+    Args:
+        blocks (list): The blocks, as :class:`Block` objects or dicts.
+        max_blocks (int): The most blocks in a page. Defaults to 50, the most Slack accepts in a message.
+        max_bytes (int): Optional; The largest size of a page's JSON list of blocks, in bytes. A single block
+            larger than this gets a page of its own.
+        base_bytes (int): The size of the rest of the payload the blocks are sent in, which is added to
+            the size of each page. Defaults to 0.
+        size (PayloadSize): Optional; The size recorded when the blocks were rendered, such as by
+            ``get_blocks_json(*blocks, size=size)``, whose block sizes are used instead of measuring the
+            blocks again.
+    Returns:
+        List[list]: The pages, each a list of blocks.
+    Raises:
+        AttributeError: If ``size`` does not have the size of each block.
+    """
+    if not max_bytes:
+        # only the number of blocks matters
+        blocks_bytes = [0] * len(blocks)
+    elif size is None:
+        measured = PayloadSize()
+        measured.add_blocks(blocks)
+        blocks_bytes = measured.block_bytes
+    elif size.blocks == len(blocks):
+        blocks_bytes = size.block_bytes
+    else:
+        raise AttributeError(
+            f"size has the sizes of {size.blocks} blocks, but got {len(blocks)} blocks"
+        )
+    if len(blocks) <= max_blocks and not (
+        max_bytes and base_bytes + get_list_size(blocks_bytes) > max_bytes
+    ):
+        # the blocks fit in one page as they are
+        return [list(blocks)] if blocks else []
+
+    pages: List[list] = []
+    page: List[Tuple[object, int]] = []
+    page_bytes = base_bytes + 2
+    for block, block_bytes in zip(blocks, blocks_bytes):
+        # the blocks carried over from a cut page can still leave no room for this block, so cut again
+        while page and (
+            len(page) >= max_blocks
+            or (max_bytes and page_bytes + block_bytes + 2 > max_bytes)
+        ):
+            # the page is full, so it ends at its last boundary, or before this block if that is a boundary
+            end = len(page) if is_page_boundary(block) else get_last_boundary(page)
+            end = end or len(page)
+            pages.append([item for item, _ in page[:end]])
+            page = page[end:]
+            if page and is_divider(page[0][0]):
+                page = page[1:]
+            page_bytes = get_page_bytes(page, base_bytes)
+
+        if not page and is_divider(block):
+            continue
+        page_bytes += block_bytes + (2 if page else 0)
+        page.append((block, block_bytes))
+
+    if page:
+        pages.append([item for item, _ in page])
+    # dividers at the end of a page separate it from nothing
+    for blocks_page in pages:
+        while len(blocks_page) > 1 and is_divider(blocks_page[-1]):
+            blocks_page.pop()
+    return pages
+
+
+def paginate_view(
+    view: ViewPayload, max_blocks: int = MAX_VIEW_BLOCKS, max_bytes: int = None
+) -> List[ViewPayload]:
+    """
+    Splits a view with too many blocks into pages, as by :func:`paginate_blocks`. Each page is a copy of the
+    view with part of its blocks, such as a modal to push with ``views.push`` as the next page. A view with
+    more blocks than Slack accepts fails validation, so build it with validation off or deferred (see
+    :func:`validation_mode`) to paginate it; the pages are not validated again.
+
+    Args:
+        view (ViewPayload): The view.
+        max_blocks (int): The most blocks in a page. Defaults to 100, the most Slack accepts in a view.
+        max_bytes (int): Optional; The largest size of each page's JSON, in bytes.
+    Returns:
+        List[ViewPayload]: The pages, which is the view itself if it fits in one.
+    """
+    blocks = view.get_fields()["blocks"]
+    base_bytes = 0
+    size = None
+    if max_bytes:
+        size = PayloadSize()
+        size.add_payload(view.get_render_fields())
+        # the size of the view without its list of blocks, whose "[]" each page adds back
+        base_bytes = size.bytes - get_list_size(size.block_bytes)
+
+    pages = paginate_blocks(blocks, max_blocks, max_bytes, base_bytes, size)
+    if len(pages) <= 1:
+        return [view]
+
+    views = []
+    for page in pages:
+        page_view = copy.copy(view)
+        page_view.blocks = page
+        views.append(page_view)
+    return views
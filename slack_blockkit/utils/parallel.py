@@ -0,0 +1,73 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Iterable, List, cast
+
+from .serialization import to_json
+
+# batches smaller than this are rendered in-process, since starting workers costs more than it saves
+MIN_PARALLEL_BATCH_SIZE = 2000
+DEFAULT_CHUNK_SIZE = 500
+
+
+def render_chunk(build: Callable[[Any], Any], rows: list) -> List[str]:
+    """
+    Builds and renders the payload for each row of a chunk. This runs in the worker processes.
+    """
+    return [cast(str, to_json(build(row))) for row in rows]
+
+
+def iter_chunks(rows: Iterable, chunk_size: int) -> Iterable[list]:
+    rows = iter(rows)
+    chunk = list(islice(rows, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(rows, chunk_size))
+
+
+def render_parallel(
+    build: Callable[[Any], Any],
+    rows: Iterable,
+    max_workers: int = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    min_batch_size: int = MIN_PARALLEL_BATCH_SIZE,
+    executor: Executor = None,
+) -> List[str]:
+    """
+    Builds and renders a payload for each row across a pool of worker processes. Each row is passed to
+    ``build``, which returns a :class:`ViewPayload`, a block, or a list of blocks for it. The payloads are
+    rendered to compact JSON by :func:`~slack_blockkit.utils.serialization.to_json` in the workers, so only
+    the rows and the JSON strings are sent between processes. Batches smaller than ``min_batch_size`` are
+    rendered in-process.
+
+    Example:
+        >>> def build_home(user):
+        ...     return HomeViewPayload(title=PlainTextObject(text="Home"), blocks=get_home_blocks(user))
+        >>> ...
+        >>> for user, view in zip(users, render_parallel(build_home, users)):
+        ...     client.views_publish(user_id=user.id, view=view)
+
+    Args:
+        build (Callable): Builds the payload for a row. It needs to be picklable, such as a function defined
+            at the top level of a module.
+        rows (Iterable): The rows to build payloads for. Rows need to be picklable.
+        max_workers (int): The number of worker processes, defaults to the number of CPUs. Ignored if an
+            ``executor`` is given.
+        chunk_size (int): The number of rows sent to a worker at a time, defaults to 500.
+        min_batch_size (int): The smallest number of rows rendered in parallel, defaults to 2000.
+        executor (Executor): Optional; A running executor to use instead of starting a new process pool.
+    Returns:
+        List[str]: The JSON for each payload, in the same order as ``rows``.
+    """
+    rows = list(rows)
+    if len(rows) < min_batch_size:
+        return render_chunk(build, rows)
+
+    render = partial(render_chunk, build)
+    chunks = iter_chunks(rows, chunk_size)
+    if executor is not None:
+        results = executor.map(render, chunks)
+        return [payload for chunk in results for payload in chunk]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return [payload for chunk in pool.map(render, chunks) for payload in chunk]
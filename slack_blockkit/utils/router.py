@@ -0,0 +1,246 @@
+import threading
+
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from slack_blockkit.block import SCALAR_TYPES, Block
+from slack_blockkit.layout_block import LayoutBlock
+
+# an element or block, as an object or its rendered dict
+Component = Union[Block, dict]
+
+# elements are indexed by their action_id, and by their block_id (None outside a block) and action_id
+ElementKey = Union[str, Tuple[Optional[str], str]]
+
+
+class Route:
+    """
+    An action of an interaction payload, resolved to the element it came from and the callback registered
+    for it by a :class:`Router`.
+
+    Args:
+        action (dict): The action, such as an item of the ``actions`` of a ``block_actions`` payload.
+        payload (dict): The interaction payload.
+        element (Component): The element with the ``action_id`` of the action, or ``None`` if it is not in
+            the blocks added to the router.
+        block (Component): The layout block with the ``block_id`` of the action, or ``None`` if it is not
+            in the blocks added to the router.
+        callback (Callable): The callback registered for the ``action_id``, or ``None`` if there is none.
+    """
+
+    __slots__ = ("action", "payload", "element", "block", "callback")
+
+    def __init__(
+        self,
+        action: dict,
+        payload: dict,
+        element: Optional[Component],
+        block: Optional[Component],
+        callback: Optional[Callable],
+    ):
+        self.action = action
+        self.payload = payload
+        self.element = element
+        self.block = block
+        self.callback = callback
+
+    def __repr__(self) -> str:
+        return f"Route({self.action.get('action_id')!r}, {self.element!r})"
+
+
+class Router:
+    """
+    Dispatches interaction payloads, such as ``block_actions``, to the callbacks registered for their
+    ``action_id``. The blocks sent to Slack are added to the router, which indexes every element by its
+    ``action_id`` and every layout block by its ``block_id``, so each action is resolved to the element it
+    came from with a dict lookup instead of a scan of the blocks.
+
+    Slack only requires an ``action_id`` to be unique within its block, so elements are indexed by their
+    ``block_id`` and ``action_id`` first, and by their ``action_id`` alone as a fallback.
+
+    Changes to the router replace its indexes as a whole under a lock, so dispatching never takes the lock
+    and is safe from any number of threads while blocks and callbacks are added.
+
+    Example:
+        >>> router = Router()
+        >>> @router.on("close-ticket")
+        ... def close_ticket(route):
+        ...     tickets.close(route.action["value"])
+        >>> router.add_blocks(view)
+        >>> client.views_publish(user_id=user_id, view=view.render())
+        >>> ...
+        >>> router.dispatch(json.loads(request.form["payload"]))
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._elements: Dict[ElementKey, Component] = {}
+        self._blocks: Dict[Optional[str], Component] = {}
+        self._callbacks: Dict[str, Callable] = {}
+
+    def add_callback(self, action_id: str, callback: Callable[[Route], object]):
+        """
+        Registers the callback for an ``action_id``, replacing any earlier one.
+
+        Args:
+            action_id (str): The action ID.
+            callback (Callable[[Route], object]): Called with the :class:`Route` of each action with the
+                ``action_id``.
+        """
+        with self._lock:
+            self._callbacks = {**self._callbacks, action_id: callback}
+
+    def on(self, action_id: str) -> Callable:
+        """
+        Returns a decorator registering a function as the callback for an ``action_id``. See
+        :meth:`add_callback`.
+        """
+
+        def register(callback: Callable[[Route], object]) -> Callable:
+            self.add_callback(action_id, callback)
+            return callback
+
+        return register
+
+    def add_blocks(self, *blocks):
+        """
+        Indexes the elements and layout blocks within blocks, views and their rendered dicts. Elements and
+        blocks with the same IDs as ones added earlier replace them.
+
+        Args:
+            *blocks: Blocks, views, or lists of them, as objects or rendered dicts.
+        """
+        elements: Dict[ElementKey, Component] = {}
+        layout_blocks: Dict[Optional[str], Component] = {}
+        for component, block in iter_elements(blocks):
+            action_id = get_id(component, "action_id")
+            if action_id is None:
+                layout_blocks[get_id(component, "block_id")] = component
+            else:
+                block_id = get_id(block, "block_id") if block is not None else None
+                elements[(block_id, action_id)] = component
+                elements[action_id] = component
+        layout_blocks.pop(None, None)
+
+        with self._lock:
+            self._elements = {**self._elements, **elements}
+            self._blocks = {**self._blocks, **layout_blocks}
+
+    def clear_blocks(self):
+        """
+        Removes every element and block added to the router. Callbacks stay registered.
+        """
+        with self._lock:
+            self._elements, self._blocks = {}, {}
+
+    def get_element(self, action_id: str, block_id: str = None) -> Optional[Component]:
+        """
+        Returns the element with an ``action_id``, preferring the one within the block with ``block_id``.
+
+        Args:
+            action_id (str): The action ID.
+            block_id (str): Optional; The block ID.
+        Returns:
+            Component: The element, or ``None`` if none was added.
+        """
+        elements = self._elements
+        element = elements.get((block_id, action_id))
+        return element if element is not None else elements.get(action_id)
+
+    def get_block(self, block_id: str) -> Optional[Component]:
+        """
+        Returns the layout block with a ``block_id``, or ``None`` if none was added.
+        """
+        return self._blocks.get(block_id)
+
+    def resolve(self, action: dict, payload: dict = None) -> Route:
+        """
+        Resolves an action to the element it came from and its callback.
+
+        Args:
+            action (dict): The action, with its ``action_id`` and ``block_id``.
+            payload (dict): Optional; The interaction payload the action is from.
+        Returns:
+            Route: The route of the action.
+        """
+        action_id, block_id = action.get("action_id", ""), action.get("block_id")
+        return Route(
+            action=action,
+            payload=payload if payload is not None else action,
+            element=self.get_element(action_id, block_id),
+            block=self._blocks.get(block_id),
+            callback=self._callbacks.get(action_id),
+        )
+
+    def dispatch(self, payload: dict) -> list:
+        """
+        Calls the callback of each action of an interaction payload: each of the ``actions`` of a
+        ``block_actions`` payload, or the payload itself if it has an ``action_id``, such as a
+        ``block_suggestion``. Actions without a callback are skipped.
+
+        Args:
+            payload (dict): The interaction payload.
+        Returns:
+            list: What each callback returned, in the order of the actions.
+        """
+        actions = payload.get("actions")
+        if actions is None:
+            actions = [payload] if "action_id" in payload else []
+
+        results = []
+        for action in actions:
+            route = self.resolve(action, payload)
+            if route.callback is not None:
+                results.append(route.callback(route))
+        return results
+
+
+def get_id(component: Component, name: str) -> Optional[str]:
+    if isinstance(component, dict):
+        return component.get(name)
+    return getattr(component, name, None)
+
+
+def iter_elements(value) -> Iterator[Tuple[Component, Optional[Component]]]:
+    """
+    Yields every layout block and element with an ``action_id`` within a value, each with the layout block
+    it is in (for layout blocks, their parent block, if any). The value is walked with an explicit stack, so
+    deep trees do not reach the recursion limit.
+
+    Args:
+        value: Blocks, views, their rendered dicts, or lists of them.
+    Returns:
+        Iterator[Tuple[Component, Optional[Component]]]: Each component and its layout block.
+    """
+    stack: List[Tuple[object, Optional[Component]]] = [(value, None)]
+    while stack:
+        value, block = stack.pop()
+        if isinstance(value, Block):
+            if isinstance(value, LayoutBlock):
+                yield value, block
+                block = value
+            elif getattr(value, "action_id", None) is not None:
+                yield value, block
+            children: Iterable[object] = [
+                getattr(value, name, None)
+                for name, _, nested in value.get_render_plan()
+                if nested
+            ]
+        elif isinstance(value, dict):
+            if "block_id" in value:
+                yield value, block
+                block = value
+            elif value.get("action_id") is not None:
+                yield value, block
+            children = value.values()
+        elif isinstance(value, (list, tuple)):
+            children = value
+        elif hasattr(value, "get_fields"):
+            # view payloads are not blocks, but hold blocks in their fields
+            children = value.get_fields().values()
+        else:
+            continue
+        stack.extend(
+            (child, block)
+            for child in reversed(list(children))
+            if child is not None and child.__class__ not in SCALAR_TYPES
+        )
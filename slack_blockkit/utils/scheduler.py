@@ -0,0 +1,226 @@
+import asyncio
+
+from typing import Dict, List, Optional, Set, Tuple
+
+from slack_blockkit.view_payload import ViewPayload
+
+from .sender import CHAT_UPDATE, VIEWS_PUBLISH, AsyncSender
+
+# what a scheduled payload replaces: the method with the user ID or the channel and ts it updates
+Target = Tuple[str, ...]
+
+
+class SchedulerStats:
+    """
+    Counts the payloads handled by a :class:`SendScheduler`.
+
+    Args:
+        scheduled (int): The payloads scheduled.
+        sent (int): The calls made that succeeded.
+        coalesced (int): The payloads dropped because a newer payload for the same target was scheduled
+            before they were sent.
+        failed (int): The calls made that failed.
+    """
+
+    __slots__ = ("scheduled", "sent", "coalesced", "failed")
+
+    def __init__(
+        self, scheduled: int = 0, sent: int = 0, coalesced: int = 0, failed: int = 0
+    ):
+        self.scheduled = scheduled
+        self.sent = sent
+        self.coalesced = coalesced
+        self.failed = failed
+
+    def __repr__(self) -> str:
+        return (
+            f"SchedulerStats(scheduled={self.scheduled}, sent={self.sent}, "
+            f"coalesced={self.coalesced}, failed={self.failed})"
+        )
+
+
+class PendingCall:
+    """
+    The latest payload scheduled for a target, and the futures of every payload it replaced.
+    """
+
+    __slots__ = ("method", "payload", "futures")
+
+    def __init__(self, method: str, payload: dict):
+        self.method = method
+        self.payload = payload
+        self.futures: List[asyncio.Future] = []
+
+
+class SendScheduler:
+    """
+    Queues ``views.publish`` and ``chat.update`` calls by their target, the user of a home tab or the
+    message being updated, and sends only the latest payload for each target. A payload scheduled while an
+    earlier one for the same target is still queued replaces it, so a home tab that changes several times a
+    second is published once per change that can actually be sent. Payloads stay queued while their method's
+    rate limit bucket (see :class:`TokenBucket`) is empty, which is when most of them are coalesced.
+
+    Calls for the same target are sent one at a time and in order. Each scheduled payload gets a future with
+    the response of the call that sent it, or of the newer payload that replaced it.
+
+    Example:
+        >>> async with SendScheduler(sender) as scheduler:
+        ...     for event in events:
+        ...         scheduler.publish_view(event.user_id, get_home_view(event.user_id))
+        >>> logger.info("published %d views, dropped %d", scheduler.stats.sent, scheduler.stats.coalesced)
+
+    Args:
+        sender (AsyncSender): The sender making the calls, whose rate limits are used.
+        workers (int): How many calls are made at a time. Defaults to 4.
+    """
+
+    def __init__(self, sender: AsyncSender, workers: int = 4):
+        self.sender = sender
+        self.workers = workers
+        self.stats = SchedulerStats()
+        # the calls not sent yet, by target, and the targets ready to be sent in order
+        self.pending: Dict[Target, PendingCall] = {}
+        self.in_flight: Set[Target] = set()
+        self.ready: Optional[asyncio.Queue] = None
+        self.tasks: List[asyncio.Task] = []
+
+    async def __aenter__(self) -> "SendScheduler":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def start(self):
+        """
+        Starts the workers sending the scheduled calls. This needs to be called from a running event loop.
+        """
+        self.get_ready()
+        self.tasks = [asyncio.ensure_future(self.work()) for _ in range(self.workers)]
+
+    async def flush(self):
+        """
+        Waits until every scheduled call has been sent.
+        """
+        await self.get_ready().join()
+
+    async def close(self):
+        """
+        Sends every scheduled call, then stops the workers.
+        """
+        await self.flush()
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+
+    def get_ready(self) -> asyncio.Queue:
+        # the queue is created within the running event loop, which it is bound to on Python 3.7 to 3.9
+        if self.ready is None:
+            self.ready = asyncio.Queue()
+        return self.ready
+
+    def get_queue_depth(self) -> int:
+        """
+        Returns the number of targets with a payload waiting to be sent.
+        """
+        return len(self.pending)
+
+    def schedule(self, target: Target, method: str, payload: dict) -> asyncio.Future:
+        """
+        Schedules a call, replacing the payload waiting to be sent for the same target, if any.
+
+        Args:
+            target (Target): What the payload replaces, such as ``("views.publish", user_id)``.
+            method (str): The API method.
+            payload (dict): The arguments of the method. Blocks and views within it are rendered when it is
+                sent.
+        Returns:
+            asyncio.Future: The response of the call.
+        """
+        ready = self.get_ready()
+        future = asyncio.get_running_loop().create_future()
+        self.stats.scheduled += 1
+
+        call = self.pending.get(target)
+        if call is not None:
+            call.method, call.payload = method, payload
+            self.stats.coalesced += 1
+        else:
+            call = self.pending[target] = PendingCall(method, payload)
+            if target not in self.in_flight:
+                ready.put_nowait(target)
+        call.futures.append(future)
+        return future
+
+    def publish_view(self, user_id: str, view: ViewPayload, **fields) -> asyncio.Future:
+        """
+        Schedules publishing a home tab with ``views.publish``, replacing any home tab waiting to be published
+        for the same user.
+
+        Args:
+            user_id (str): The ID of the user the home tab is for.
+            view (ViewPayload): The home tab view.
+            **fields: Other arguments of the method.
+        Returns:
+            asyncio.Future: The response of the call.
+        """
+        payload = {"user_id": user_id, "view": view, **fields}
+        return self.schedule((VIEWS_PUBLISH, user_id), VIEWS_PUBLISH, payload)
+
+    def update_message(
+        self, channel: str, ts: str, blocks: list, text: str = None, **fields
+    ) -> asyncio.Future:
+        """
+        Schedules updating a message with ``chat.update``, replacing any update waiting to be sent for the
+        same message.
+
+        Args:
+            channel (str): The channel ID.
+            ts (str): The timestamp of the message.
+            blocks (list): The new blocks, as :class:`Block` objects or dicts.
+            text (str): Optional; The new fallback text of the message.
+            **fields: Other arguments of the method.
+        Returns:
+            asyncio.Future: The response of the call.
+        """
+        payload = {"channel": channel, "ts": ts, "blocks": blocks, **fields}
+        if text is not None:
+            payload["text"] = text
+        return self.schedule((CHAT_UPDATE, channel, ts), CHAT_UPDATE, payload)
+
+    async def work(self):
+        ready = self.get_ready()
+        while True:
+            target = await ready.get()
+            try:
+                await self.send(target)
+            finally:
+                ready.task_done()
+
+    async def send(self, target: Target):
+        # the payload stays pending while waiting for the rate limit, so newer ones can replace it
+        call = self.pending[target]
+        buckets = self.sender.get_buckets(call.method, call.payload)
+        for bucket in buckets:
+            await bucket.acquire()
+
+        call = self.pending.pop(target)
+        self.in_flight.add(target)
+        try:
+            response = await self.sender.call(call.method, call.payload, acquired=True)
+        except Exception as e:
+            self.stats.failed += 1
+            for future in call.futures:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            self.stats.sent += 1
+            for future in call.futures:
+                if not future.done():
+                    future.set_result(response)
+        finally:
+            self.in_flight.discard(target)
+            # payloads scheduled while this one was being sent were not queued
+            if target in self.pending:
+                self.get_ready().put_nowait(target)
@@ -0,0 +1,496 @@
+import asyncio
+import ssl
+import time
+
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple, cast
+from urllib.parse import urlsplit
+
+from slack_blockkit.view_payload import ViewPayload
+
+from .serialization import get_json_backend, to_json
+
+SLACK_API_URL = "https://slack.com/api/"
+
+CHAT_POST_MESSAGE = "chat.postMessage"
+CHAT_UPDATE = "chat.update"
+VIEWS_OPEN = "views.open"
+VIEWS_PUBLISH = "views.publish"
+
+# the sustained calls per minute and burst allowed for each method, after Slack's rate limit tiers. Calls
+# to chat.postMessage are limited per channel as well
+RATE_LIMITS: Dict[str, Tuple[float, int]] = {
+    CHAT_POST_MESSAGE: (60, 10),
+    CHAT_UPDATE: (50, 10),
+    VIEWS_OPEN: (100, 20),
+    VIEWS_PUBLISH: (100, 20),
+}
+CHANNEL_RATE_LIMIT = (60, 5)
+# methods without a rate limit of their own are limited like Slack's tier 3
+DEFAULT_RATE_LIMIT = (50, 10)
+
+
+class SlackApiError(Exception):
+    """
+    Raised when a Slack Web API call fails: the response has an ``ok`` of ``false``, or the call was still
+    rate limited after every retry.
+
+    Args:
+        method (str): The API method, such as ``chat.postMessage``.
+        response (dict): The response, whose ``error`` is the reason the call failed.
+    """
+
+    def __init__(self, method: str, response: dict):
+        super().__init__(f"{method} failed: {response.get('error', 'unknown_error')}")
+        self.method = method
+        self.response = response
+
+
+class TokenBucket:
+    """
+    A token bucket limiting how often calls are made: it holds up to ``capacity`` tokens, refilled at
+    ``rate`` tokens per second, and each call takes a token. Callers that find the bucket empty reserve a
+    token anyway and wait until it is refilled, so they are served in order.
+
+    Args:
+        rate (float): The tokens added per second.
+        capacity (int): The most tokens the bucket holds, which is the burst allowed.
+        clock (Callable): Optional; Returns the current time in seconds. Defaults to ``time.monotonic``.
+    """
+
+    __slots__ = ("rate", "capacity", "tokens", "updated", "paused_until", "clock")
+
+    def __init__(self, rate: float, capacity: int, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.clock = clock
+        self.updated = clock()
+        self.paused_until = 0.0
+
+    def take(self) -> float:
+        """
+        Takes a token, and returns how many seconds the caller needs to wait before using it.
+        """
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.paused_until - now)
+
+    def pause(self, seconds: float):
+        """
+        Stops handing out tokens for a number of seconds, such as the ``Retry-After`` of a rate limited call.
+        """
+        self.paused_until = max(self.paused_until, self.clock() + seconds)
+
+    async def acquire(self):
+        """
+        Takes a token, waiting until it can be used.
+        """
+        wait = self.take()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class HttpResponse:
+    """
+    A response read from a :class:`ConnectionPool`.
+
+    Args:
+        status (int): The status code.
+        headers (Dict[str, str]): The headers, with lowercase names.
+        body (bytes): The body.
+    """
+
+    __slots__ = ("status", "headers", "body")
+
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+
+class ConnectionClosedError(ConnectionResetError):
+    """
+    Raised when a :class:`Connection` was closed before any of a request was sent, or by the server before
+    any of the response was received, which servers do to keep-alive connections that were idle too long.
+    """
+
+
+class Connection:
+    """
+    A keep-alive HTTP/1.1 connection of a :class:`ConnectionPool`.
+    """
+
+    __slots__ = ("reader", "writer", "reused")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.reused = False
+
+    def is_open(self) -> bool:
+        return not self.writer.is_closing() and not self.reader.at_eof()
+
+    def close(self):
+        self.writer.close()
+
+    async def request(self, head: bytes, body: bytes) -> Tuple[HttpResponse, bool]:
+        # returns the response, and whether the connection can be used again
+        if self.writer.is_closing():
+            raise ConnectionClosedError("connection closed before the request was sent")
+        self.writer.write(head + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionClosedError("connection closed by the server")
+        status = int(status_line.split(b" ", 2)[1])
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            body = await self.read_chunked()
+        elif "content-length" in headers:
+            body = await self.reader.readexactly(int(headers["content-length"]))
+        else:
+            # the end of the body is where the server closes the connection
+            return HttpResponse(status, headers, await self.reader.read()), False
+        keep_alive = headers.get("connection", "").lower() != "close"
+        return HttpResponse(status, headers, body), keep_alive
+
+    async def read_chunked(self) -> bytes:
+        chunks: List[bytes] = []
+        while True:
+            size = int((await self.reader.readline()).split(b";", 1)[0], 16)
+            if not size:
+                # the trailer, which ends with an empty line
+                while (await self.reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readexactly(2)
+
+
+class ConnectionPool:
+    """
+    A pool of keep-alive HTTP/1.1 connections to one host, built on asyncio streams. At most
+    ``max_connections`` requests are in flight at a time; further requests wait for a connection to be
+    released. Idle connections are kept and used again, so requests after the first do not pay for a new
+    TCP and TLS handshake.
+
+    Args:
+        url (str): The base URL, such as ``https://slack.com/api/``.
+        max_connections (int): The most connections open at a time. Defaults to 10.
+    """
+
+    def __init__(self, url: str, max_connections: int = 10):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self.port = parts.port or (443 if self.ssl else 80)
+        self.path = parts.path.rstrip("/") + "/"
+        self.max_connections = max_connections
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.idle: Deque[Connection] = deque()
+
+    async def connect(self) -> Connection:
+        reader, writer = await asyncio.open_connection(
+            self.host, self.port, ssl=self.ssl
+        )
+        return Connection(reader, writer)
+
+    def get_semaphore(self) -> asyncio.Semaphore:
+        # the semaphore is created within the running event loop, which it is bound to on Python 3.7 to 3.9
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.max_connections)
+        return self.semaphore
+
+    def get_idle(self) -> Optional[Connection]:
+        while self.idle:
+            connection = self.idle.pop()
+            if connection.is_open():
+                connection.reused = True
+                return connection
+            connection.close()
+        return None
+
+    async def post(
+        self, path: str, body: bytes, headers: Dict[str, str], timeout: float = None
+    ) -> HttpResponse:
+        """
+        Posts a body to a path under the base URL.
+
+        Args:
+            path (str): The path, such as ``chat.postMessage``.
+            body (bytes): The body.
+            headers (Dict[str, str]): Headers to send besides ``Host``, ``Content-Length`` and ``Connection``.
+            timeout (float): Optional; The seconds to wait for the response once the request is sent. The time
+                spent waiting for a connection is not included.
+        Returns:
+            HttpResponse: The response.
+        Raises:
+            asyncio.TimeoutError: If there was no response within ``timeout``.
+            ConnectionError: If the connection failed. The request is only sent again when the server closed
+                an idle connection before answering it.
+        """
+        lines = [
+            f"POST {self.path}{path} HTTP/1.1",
+            f"Host: {self.host}",
+            f"Content-Length: {len(body)}",
+            "Connection: keep-alive",
+            *(f"{name}: {value}" for name, value in headers.items()),
+        ]
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+        async with self.get_semaphore():
+            connection = self.get_idle() or await self.connect()
+            try:
+                response, keep_alive = await asyncio.wait_for(
+                    connection.request(head, body), timeout
+                )
+            except ConnectionClosedError:
+                connection.close()
+                if not connection.reused:
+                    raise
+                # the server closed the idle connection without answering, so the request was not handled.
+                # Any other failure is raised, as the request may have been handled and must not be sent twice
+                connection = await self.connect()
+                try:
+                    response, keep_alive = await asyncio.wait_for(
+                        connection.request(head, body), timeout
+                    )
+                except BaseException:
+                    connection.close()
+                    raise
+            except BaseException:
+                connection.close()
+                raise
+
+            if keep_alive:
+                self.idle.append(connection)
+            else:
+                connection.close()
+        return response
+
+    async def close(self):
+        """
+        Closes the idle connections.
+        """
+        while self.idle:
+            connection = self.idle.pop()
+            connection.close()
+            try:
+                await connection.writer.wait_closed()
+            except (ConnectionError, ssl.SSLError):
+                pass
+
+
+class AsyncSender:
+    """
+    Sends blocks and views to the Slack Web API from asyncio code. Requests go over a pool of keep-alive
+    connections (see :class:`ConnectionPool`), which also bounds how many are in flight at a time. Each method
+    has a rate limit :class:`TokenBucket` after Slack's rate limit tiers, and rate limited calls wait for
+    their ``Retry-After`` and are retried. Blocks and views are rendered as the payload is encoded to JSON.
+
+    Example:
+        >>> async with AsyncSender(token=os.environ["SLACK_BOT_TOKEN"]) as sender:
+        ...     await sender.post_message(channel, blocks=get_ticket_blocks(ticket), text=ticket.title)
+        ...     await sender.send_many(
+        ...         (VIEWS_PUBLISH, {"user_id": user.id, "view": get_home_view(user)}) for user in users
+        ...     )
+
+    Args:
+        token (str): The bot or user token.
+        url (str): Optional; The base URL of the API. Defaults to ``https://slack.com/api/``.
+        max_connections (int): The most requests in flight at a time. Defaults to 10.
+        rate_limits (Dict[str, Tuple[float, int]]): Optional; The calls per minute and burst of each method,
+            replacing the ones in ``RATE_LIMITS``.
+        retries (int): How many times rate limited calls are retried. Defaults to 3.
+        timeout (float): The seconds to wait for each response, not counting the wait for a connection from
+            the pool. Defaults to 30.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        url: str = SLACK_API_URL,
+        max_connections: int = 10,
+        rate_limits: Dict[str, Tuple[float, int]] = None,
+        retries: int = 3,
+        timeout: float = 30,
+    ):
+        self.pool = ConnectionPool(url, max_connections)
+        self.headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json; charset=utf-8",
+        }
+        self.rate_limits = {**RATE_LIMITS, **(rate_limits or {})}
+        self.buckets: Dict[Tuple[str, Optional[str]], TokenBucket] = {}
+        self.retries = retries
+        self.timeout = timeout
+
+    async def __aenter__(self) -> "AsyncSender":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes the idle connections of the sender.
+        """
+        await self.pool.close()
+
+    def get_buckets(self, method: str, payload: dict) -> List[TokenBucket]:
+        """
+        Returns the rate limit buckets a call takes a token from: the bucket of its method and, for
+        ``chat.postMessage``, the bucket of its channel.
+        """
+        keys = [(method, None)]
+        if method == CHAT_POST_MESSAGE and payload.get("channel"):
+            keys.append((method, payload["channel"]))
+
+        buckets = []
+        for key in keys:
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                if key[1] is None:
+                    per_minute, burst = self.rate_limits.get(method, DEFAULT_RATE_LIMIT)
+                else:
+                    per_minute, burst = CHANNEL_RATE_LIMIT
+                bucket = self.buckets[key] = TokenBucket(per_minute / 60, burst)
+            buckets.append(bucket)
+        return buckets
+
+    async def call(self, method: str, payload: dict, acquired: bool = False) -> dict:
+        """
+        Calls a Web API method with a JSON payload. Any blocks and views within the payload are rendered.
+
+        Args:
+            method (str): The API method, such as ``chat.postMessage``.
+            payload (dict): The arguments of the method.
+            acquired (bool): Whether the caller already took a token from each of the buckets returned by
+                :meth:`get_buckets` for this call, so the first attempt does not wait for them. Defaults to
+                ``False``.
+        Returns:
+            dict: The response.
+        Raises:
+            SlackApiError: If the call failed, or was still rate limited after every retry.
+        """
+        body = cast(bytes, to_json(payload, as_bytes=True))
+        buckets = self.get_buckets(method, payload)
+        for attempt in range(self.retries + 1):
+            if attempt or not acquired:
+                for bucket in buckets:
+                    await bucket.acquire()
+            response = await self.pool.post(method, body, self.headers, self.timeout)
+            if response.status != 429:
+                break
+            retry_after = float(response.headers.get("retry-after", 1))
+            for bucket in buckets:
+                bucket.pause(retry_after)
+
+        if response.status == 429:
+            raise SlackApiError(method, {"ok": False, "error": "ratelimited"})
+        try:
+            result = get_json_backend().loads(response.body)
+        except ValueError:
+            result = {"ok": False, "error": f"http_{response.status}"}
+        if not result.get("ok"):
+            raise SlackApiError(method, result)
+        return result
+
+    async def send_many(
+        self, calls: Iterable[Tuple[str, dict]], return_exceptions: bool = False
+    ) -> list:
+        """
+        Makes many calls concurrently, as many at a time as the connections and rate limits allow.
+
+        Args:
+            calls (Iterable[Tuple[str, dict]]): The method and payload of each call.
+            return_exceptions (bool): If ``True``, failed calls give their exception in the results instead
+                of raising it. Defaults to ``False``.
+        Returns:
+            list: The response of each call, in order.
+        """
+        return await asyncio.gather(
+            *(self.call(method, payload) for method, payload in calls),
+            return_exceptions=return_exceptions,
+        )
+
+    async def post_message(
+        self, channel: str, blocks: list, text: str = None, **fields
+    ) -> dict:
+        """
+        Posts a message with ``chat.postMessage``.
+
+        Args:
+            channel (str): The channel ID.
+            blocks (list): The blocks, as :class:`Block` objects or dicts.
+            text (str): Optional; The fallback text of the message, shown in notifications.
+            **fields: Other arguments of the method, such as ``thread_ts``.
+        Returns:
+            dict: The response, with the ``ts`` of the message.
+        """
+        payload = {"channel": channel, "blocks": blocks, **fields}
+        if text is not None:
+            payload["text"] = text
+        return await self.call(CHAT_POST_MESSAGE, payload)
+
+    async def update_message(
+        self, channel: str, ts: str, blocks: list, text: str = None, **fields
+    ) -> dict:
+        """
+        Updates a message with ``chat.update``.
+
+        Args:
+            channel (str): The channel ID.
+            ts (str): The timestamp of the message.
+            blocks (list): The new blocks, as :class:`Block` objects or dicts.
+            text (str): Optional; The new fallback text of the message.
+            **fields: Other arguments of the method.
+        Returns:
+            dict: The response.
+        """
+        payload = {"channel": channel, "ts": ts, "blocks": blocks, **fields}
+        if text is not None:
+            payload["text"] = text
+        return await self.call(CHAT_UPDATE, payload)
+
+    async def open_view(self, trigger_id: str, view: ViewPayload, **fields) -> dict:
+        """
+        Opens a modal with ``views.open``.
+
+        Args:
+            trigger_id (str): The trigger ID of the interaction opening the modal.
+            view (ViewPayload): The modal.
+            **fields: Other arguments of the method.
+        Returns:
+            dict: The response, with the opened ``view``.
+        """
+        return await self.call(
+            VIEWS_OPEN, {"trigger_id": trigger_id, "view": view, **fields}
+        )
+
+    async def publish_view(self, user_id: str, view: ViewPayload, **fields) -> dict:
+        """
+        Publishes a home tab with ``views.publish``.
+
+        Args:
+            user_id (str): The ID of the user the home tab is for.
+            view (ViewPayload): The home tab view.
+            **fields: Other arguments of the method, such as ``hash``.
+        Returns:
+            dict: The response, with the published ``view``.
+        """
+        return await self.call(
+            VIEWS_PUBLISH, {"user_id": user_id, "view": view, **fields}
+        )
@@ -0,0 +1,208 @@
+import json
+
+from typing import List, Optional, Type, Union, cast
+
+from slack_blockkit.block import Block
+from slack_blockkit.block_id import assign_content_ids
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+
+class JsonBackend:
+    """
+    Encodes rendered payloads as JSON, and decodes inbound payloads, with a JSON library. Every backend gives
+    the same compact output, without whitespace and with non-ASCII characters as UTF-8, which is how Slack's
+    own clients send them.
+    Blocks and views within the value are rendered as they are found.
+    """
+
+    # the name the backend is selected by with set_json_backend
+    name = ""
+
+    def dumps(self, value) -> str:
+        """
+        Encodes a value as a JSON string.
+
+        Args:
+            value: The value to encode.
+        Returns:
+            str: The JSON string.
+        """
+        return self.dumpb(value).decode()
+
+    def dumpb(self, value) -> bytes:
+        """
+        Encodes a value as UTF-8 JSON bytes.
+
+        Args:
+            value: The value to encode.
+        Returns:
+            bytes: The JSON bytes.
+        """
+        return self.dumps(value).encode()
+
+    def loads(self, text: Union[str, bytes]):
+        """
+        Decodes JSON text.
+
+        Args:
+            text (Union[str, bytes]): The JSON, as a ``str`` or UTF-8 ``bytes``.
+        Returns:
+            The decoded value.
+        """
+        return json.loads(text)
+
+
+class OrjsonBackend(JsonBackend):
+    """
+    Encodes JSON with `orjson <https://github.com/ijl/orjson>`_, which is the fastest backend and natively
+    gives ``bytes``.
+    """
+
+    name = "orjson"
+
+    def dumpb(self, value) -> bytes:
+        return orjson.dumps(value, default=render_payload)
+
+    def loads(self, text: Union[str, bytes]):
+        return orjson.loads(text)
+
+
+class UjsonBackend(JsonBackend):
+    """
+    Encodes JSON with `ujson <https://github.com/ultrajson/ultrajson>`_.
+    """
+
+    name = "ujson"
+
+    def dumps(self, value) -> str:
+        return ujson.dumps(
+            value,
+            ensure_ascii=False,
+            escape_forward_slashes=False,
+            default=render_payload,
+        )
+
+    def loads(self, text: Union[str, bytes]):
+        return ujson.loads(text)
+
+
+class StdlibBackend(JsonBackend):
+    """
+    Encodes JSON with the standard library ``json`` module, which is always available.
+    """
+
+    name = "json"
+
+    def __init__(self):
+        self.encoder = json.JSONEncoder(
+            ensure_ascii=False, separators=(",", ":"), default=render_payload
+        )
+
+    def dumps(self, value) -> str:
+        return self.encoder.encode(value)
+
+
+# the backends by name, in order of preference
+JSON_BACKENDS = {
+    OrjsonBackend.name: OrjsonBackend if orjson is not None else None,
+    UjsonBackend.name: UjsonBackend if ujson is not None else None,
+    StdlibBackend.name: StdlibBackend,
+}
+
+_backend: Optional[JsonBackend] = None
+
+
+def render_payload(value):
+    """
+    Renders the blocks and views found while encoding a value.
+    """
+    if isinstance(value, Block) or hasattr(value, "get_fields"):
+        return value.render()
+    raise TypeError(
+        f"Object of type {value.__class__.__name__} is not JSON serializable"
+    )
+
+
+def get_available_json_backends() -> List[str]:
+    """
+    Returns the names of the JSON backends that are installed, in order of preference. The standard library
+    backend, ``json``, is always available.
+
+    Returns:
+        List[str]: The backend names.
+    """
+    return [name for name, backend in JSON_BACKENDS.items() if backend is not None]
+
+
+def get_json_backend() -> JsonBackend:
+    """
+    Returns the JSON backend in use, which defaults to the fastest one installed: ``orjson``, ``ujson`` or
+    the standard library ``json``.
+
+    Returns:
+        JsonBackend: The backend.
+    """
+    global _backend
+    if _backend is None:
+        # the first available backend, which is never None
+        backend = JSON_BACKENDS[get_available_json_backends()[0]]
+        _backend = cast(Type[JsonBackend], backend)()
+    return _backend
+
+
+def set_json_backend(name: str):
+    """
+    Sets the JSON backend used by :func:`to_json` and the ``to_json()`` method of blocks and views.
+
+    Args:
+        name (str): One of ``orjson``, ``ujson`` or ``json``.
+    Raises:
+        AttributeError: If the backend is not known or not installed.
+    """
+    global _backend
+    if name not in JSON_BACKENDS:
+        raise AttributeError(
+            f"JSON backend must be one of the following values: {','.join(JSON_BACKENDS)}"
+        )
+    backend = JSON_BACKENDS[name]
+    if backend is None:
+        raise AttributeError(f"JSON backend {name} is not installed")
+    _backend = backend()
+
+
+def to_json(value, as_bytes: bool = False) -> Union[str, bytes]:
+    """
+    Encodes a payload as compact JSON with the JSON backend in use (see :func:`set_json_backend`). Blocks and
+    views, including the ones within lists and dicts such as a message payload, are rendered first.
+
+    Example:
+        >>> body = to_json({"channel": channel, "blocks": blocks}, as_bytes=True)
+        >>> session.post(CHAT_POST_MESSAGE_URL, data=body, headers=headers)
+
+    Args:
+        value: A block, a :class:`ViewPayload`, a list of blocks and dicts, or any JSON-serializable value.
+        as_bytes (bool): If ``True``, return UTF-8 ``bytes`` instead of a ``str``. Defaults to ``False``.
+    Returns:
+        Union[str, bytes]: The JSON.
+    """
+    backend = get_json_backend()
+    if isinstance(value, Block) or hasattr(value, "get_fields"):
+        value = value.render()
+    elif isinstance(value, (list, tuple)) and any(
+        isinstance(item, Block) for item in value
+    ):
+        # rendered like get_blocks does, adding content addressed block IDs
+        value = [
+            item.render() if isinstance(item, Block) else item
+            for item in assign_content_ids(value)
+        ]
+    return backend.dumpb(value) if as_bytes else backend.dumps(value)
@@ -0,0 +1,210 @@
+from string import Template
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from slack_blockkit.block import Block, copy_rendered
+from slack_blockkit.composition_object import TextObject
+from slack_blockkit.schema import get_max_length
+from slack_blockkit.utils import get_blocks
+from slack_blockkit.utils.utils import Blocks
+
+
+def has_placeholders(text: str) -> bool:
+    """
+    Returns whether a string has any named placeholders or escaped ``$$`` in it.
+    """
+    for match in Template.pattern.finditer(text):
+        if match.group("invalid") is None:
+            return True
+    return False
+
+
+class TemplateSlot:
+    """
+    A string within a rendered template that contains placeholders.
+
+    Args:
+        text (str): The string with placeholders.
+        max_length (int): The max length of the filled-in string, or ``None`` if there is no limit.
+        name (str): The name of the attribute holding the string, used in error messages.
+    """
+
+    __slots__ = ("template", "max_length", "name")
+
+    def __init__(self, text: str, max_length: Optional[int], name: str):
+        for match in Template.pattern.finditer(text):
+            if match.group("invalid") is not None:
+                raise AttributeError(
+                    f"invalid placeholder at position {match.start('invalid')} in {name}, "
+                    f"use $$ for a literal $"
+                )
+        self.template = Template(text)
+        self.max_length = max_length
+        self.name = name
+
+    def fill(self, values: dict) -> str:
+        try:
+            text = self.template.substitute(values)
+        except KeyError as error:
+            raise AttributeError(
+                f"no value for placeholder {error.args[0]} in {self.name}"
+            )
+        if self.max_length and len(text) > self.max_length:
+            raise AttributeError(
+                f"{self.name} cannot be greater than {self.max_length} characters, "
+                f"but is {len(text)}"
+            )
+        return text
+
+
+class BlockTemplate:
+    """
+    A list of blocks that is rendered once, with named placeholders that are filled in for each message.
+    Placeholders use the ``$name`` or ``${name}`` syntax of :class:`string.Template`, and ``$$`` is a literal
+    ``$`` in a string with placeholders, where any other ``$`` is an error. Filling in a template only copies
+    the dicts and lists on the way to the strings with placeholders, and only those strings are checked
+    against their max length. Everything else is shared between the messages and the template, so the
+    filled-in blocks must not be modified.
+
+    Example:
+        >>> from slack_blockkit.composition_object import MarkdownTextObject
+        >>> from slack_blockkit.layout_block import DividerBlock, SectionBlock
+        >>> from slack_blockkit.utils.template import BlockTemplate
+        >>> ...
+        >>> template = BlockTemplate(
+        ...     SectionBlock(text=MarkdownTextObject(text="Hi $user, ticket *${ticket}* is ready")),
+        ...     DividerBlock(),
+        ... )
+        >>> blocks = template.fill(user="Sandy", ticket="BK-12")
+
+    Args:
+        blocks: An argument list of Block or dict objects, as passed to ``get_blocks``.
+    Raises:
+        AttributeError: If one of more of the blocks is an invalid block format, or a string with placeholders
+            has a ``$`` that is neither a placeholder nor ``$$``.
+    """
+
+    def __init__(self, *blocks):
+        self.blocks = get_blocks(*blocks)
+
+        # slots are looked up by the path of keys and indices to them in the rendered blocks
+        self.slots: Dict[tuple, TemplateSlot] = {}
+        for index, block in enumerate(blocks):
+            self._find_slots(block, self.blocks[index], (index,), None, "block")
+
+        # paths to the slots, nested by key, so filling in only walks the containers holding slots
+        self.tree: dict = {}
+        for path, slot in self.slots.items():
+            node = self.tree
+            for key in path[:-1]:
+                node = node.setdefault(key, {})
+            node[path[-1]] = slot
+
+    def _find_slots(
+        self, value, rendered, path: tuple, max_length: Optional[int], name: str
+    ):
+        if isinstance(value, str):
+            if has_placeholders(value):
+                self.slots[path] = TemplateSlot(value, max_length, name)
+        elif isinstance(value, Block):
+            cls = type(value)
+            for attribute, key, _ in value.get_render_plan():
+                if key not in rendered:
+                    continue
+                if isinstance(value, TextObject) and attribute == "text":
+                    # the max length of text depends on what the text object is used for
+                    attribute_max_length = max_length
+                else:
+                    attribute_max_length = get_max_length(cls, attribute)
+                self._find_slots(
+                    getattr(value, attribute),
+                    rendered[key],
+                    path + (key,),
+                    attribute_max_length,
+                    attribute,
+                )
+        elif isinstance(value, (list, tuple)):
+            for index, item in enumerate(value):
+                self._find_slots(
+                    item, rendered[index], path + (index,), max_length, name
+                )
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                self._find_slots(item, rendered[key], path + (key,), None, key)
+
+    def get_placeholders(self) -> List[str]:
+        """
+        Returns the names of all placeholders in the template.
+
+        Returns:
+            List[str]: The sorted placeholder names.
+        """
+        names = set()
+        for slot in self.slots.values():
+            for match in Template.pattern.finditer(slot.template.template):
+                name = match.group("named") or match.group("braced")
+                if name:
+                    names.add(name)
+        return sorted(names)
+
+    def fill(self, values: dict = None, **kwargs) -> Blocks:
+        """
+        Fills in the placeholders of the template.
+
+        Args:
+            values (dict): The placeholder values, keyed by placeholder name.
+            kwargs: Placeholder values as keyword arguments, which take precedence over ``values``.
+        Returns:
+            Blocks: The list of rendered blocks. Dicts without placeholders are shared with the template.
+        Raises:
+            AttributeError: If a placeholder has no value, or a filled-in string exceeds its max length.
+        """
+        if kwargs:
+            values = {**values, **kwargs} if values else kwargs
+        return fill_tree(self.blocks, self.tree, values or {})
+
+    def render(self, values: dict = None, **kwargs) -> Blocks:
+        """
+        Like :meth:`fill`, but returns blocks that share nothing with the template and can be modified.
+        """
+        return copy_rendered(self.fill(values, **kwargs))
+
+
+def fill_tree(rendered, tree: dict, values: dict):
+    """
+    Copies the containers along the paths in ``tree`` and fills in the slots at their ends.
+    """
+    copied = rendered.copy()
+    for key, node in tree.items():
+        if isinstance(node, TemplateSlot):
+            copied[key] = node.fill(values)
+        else:
+            copied[key] = fill_tree(copied[key], node, values)
+    return copied
+
+
+def render_many(
+    template: Union[BlockTemplate, Iterable], rows: Iterable[dict]
+) -> Iterator[Blocks]:
+    """
+    Renders a message for each row of placeholder values. The template is compiled once and the messages
+    are rendered lazily, as the returned generator is consumed. Blocks and dicts without placeholders are
+    rendered once and shared by all of the messages, so the messages must not be modified.
+
+    Example:
+        >>> for user, blocks in zip(users, render_many(template, users)):
+        ...     client.chat_postMessage(channel=user["channel"], blocks=blocks)
+
+    Args:
+        template: A :class:`BlockTemplate`, or a list of Block or dict objects to compile into one.
+        rows (Iterable[dict]): The placeholder values for each message, keyed by placeholder name.
+    Returns:
+        Iterator[Blocks]: A generator of block lists, one for each row.
+    Raises:
+        AttributeError: If a placeholder has no value, or a filled-in string exceeds its max length.
+    """
+    if not isinstance(template, BlockTemplate):
+        template = BlockTemplate(*template)
+
+    blocks, tree = template.blocks, template.tree
+    for row in rows:
+        yield fill_tree(blocks, tree, row)
@@ -0,0 +1,155 @@
+import asyncio
+import json
+
+from collections import defaultdict, deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+
+class FakeRequest:
+    """
+    A request received by a :class:`FakeSlackServer`.
+
+    Args:
+        method (str): The API method, such as ``chat.postMessage``.
+        headers (Dict[str, str]): The headers, with lowercase names.
+        payload: The decoded JSON body.
+        connection (int): The number of the connection the request came in on, counting from 1.
+    """
+
+    __slots__ = ("method", "headers", "payload", "connection")
+
+    def __init__(self, method: str, headers: Dict[str, str], payload, connection: int):
+        self.method = method
+        self.headers = headers
+        self.payload = payload
+        self.connection = connection
+
+    def __repr__(self) -> str:
+        return f"FakeRequest({self.method!r}, connection={self.connection})"
+
+
+class FakeSlackServer:
+    """
+    A local HTTP/1.1 server standing in for the Slack Web API in tests, so code sending blocks and views can
+    be tested with no network. It records every request, answers each with ``{"ok": true}`` unless another
+    response was queued for its method, and keeps connections alive like Slack does.
+
+    Example:
+        >>> async with FakeSlackServer() as server:
+        ...     server.add_response("chat.update", {"ok": False, "error": "message_not_found"})
+        ...     async with AsyncSender(token="xoxb-test", url=server.url) as sender:
+        ...         await sender.post_message("C0123", blocks=blocks)
+        >>> assert server.requests[0].payload["blocks"] == get_blocks(*blocks)
+
+    Args:
+        delay (float): Optional; The seconds to wait before answering each request. Defaults to 0.
+    """
+
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.requests: List[FakeRequest] = []
+        self.responses: Dict[str, Deque[Tuple[int, dict, dict]]] = defaultdict(deque)
+        self.connections = 0
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.url = ""
+
+    async def __aenter__(self) -> "FakeSlackServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def start(self):
+        """
+        Starts the server on a free local port, and sets ``url`` to its base URL.
+        """
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/api/"
+
+    async def stop(self):
+        """
+        Stops the server.
+        """
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+    def add_response(
+        self, method: str, response: dict, status: int = 200, headers: dict = None
+    ):
+        """
+        Queues the response to the next request to an API method. Responses to the same method are used in
+        the order they were added.
+
+        Args:
+            method (str): The API method, such as ``chat.postMessage``.
+            response (dict): The JSON body of the response.
+            status (int): The status code. Defaults to 200.
+            headers (dict): Optional; Headers of the response, such as ``Retry-After``.
+        """
+        self.responses[method].append((status, response, headers or {}))
+
+    def add_rate_limit(self, method: str, retry_after: float = 0):
+        """
+        Queues a rate limited response to the next request to an API method.
+        """
+        self.add_response(
+            method,
+            {"ok": False, "error": "ratelimited"},
+            status=429,
+            headers={"Retry-After": retry_after},
+        )
+
+    def get_payloads(self, method: str) -> list:
+        """
+        Returns the payloads of the requests to an API method, in the order they were received.
+        """
+        return [
+            request.payload for request in self.requests if request.method == method
+        ]
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        connection = self.connections
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                path = request_line.decode("latin-1").split(" ")[1]
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                method = path.rstrip("/").rsplit("/", 1)[-1]
+                payload = json.loads(body) if body else None
+                self.requests.append(FakeRequest(method, headers, payload, connection))
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+
+                queued = self.responses.get(method)
+                status, response, response_headers = (
+                    queued.popleft() if queued else (200, {"ok": True}, {})
+                )
+                content = json.dumps(response).encode()
+                lines = [
+                    f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}",
+                    "Content-Type: application/json; charset=utf-8",
+                    f"Content-Length: {len(content)}",
+                    *(f"{name}: {value}" for name, value in response_headers.items()),
+                ]
+                writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + content)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
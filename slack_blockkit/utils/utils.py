@@ -1,8 +1,20 @@
-import json
+import hashlib
 
-from typing import List, Type
+from typing import IO, Iterator, List, Optional, Type, overload
 
-from slack_blockkit.block import Block
+from slack_blockkit.block import (
+    Block,
+    PayloadSize,
+    dump_json,
+    encode_json,
+    validate_pending,
+    write_blocks_json,
+)
+from slack_blockkit.block_id import assign_content_ids
+from slack_blockkit.schema import check_payload
+from slack_blockkit.validation import ValidationError, pending_validation
+
+from .serialization import to_json
 
 Blocks = List[dict]
 
@@ -65,7 +77,25 @@ def get_validated_input(
         return value
 
 
-def get_blocks(*blocks) -> Blocks:
+def check_blocks(blocks):
+    """
+    Checks that every block is either a ``Block`` or a ``dict``.
+
+    Args:
+        blocks: A list of Block or dict objects.
+    Raises:
+        AttributeError: If one of more of the blocks is an invalid block format.
+    """
+    for index, block in enumerate(blocks):
+        # want only blocks in the block builder. since the util class has other methods that return
+        # dicts, this will also allow dicts to be inserted
+        if not isinstance(block, (Block, dict)):
+            raise AttributeError(
+                "Block at argument {index} improperly formatted".format(index=index)
+            )
+
+
+def get_blocks(*blocks, size: PayloadSize = None) -> Blocks:
     """
     Takes arguments of `Block` objects and generates a list of blocks ready to be inserted into
     a message payload.
@@ -73,28 +103,144 @@ def get_blocks(*blocks) -> Blocks:
     Args:
         blocks: An argument list of Block objects. Objects will be inserted top to bottom as they
             appear in this list.
+        size (PayloadSize): Optional; Adds the size of the blocks as JSON, and of each block, to this. The
+            blocks are measured without encoding them, and memoized blocks by their memoized JSON (see
+            :meth:`PayloadSize.add_blocks`).
     Return:
         A list of the dict representations of block objects.
     Raises:
         AttributeError: If one of more of the blocks is an invalid block format.
     """
-    block_list = []
-    attribute_error_index = 0
+    check_blocks(blocks)
+    if pending_validation:
+        validate_pending(blocks, "blocks")
+    addressed = assign_content_ids(blocks)
+    rendered = [
+        block.render() if isinstance(block, Block) else block for block in addressed
+    ]
+    if size is not None:
+        size.add_blocks(addressed)
+    return rendered
 
-    for block in blocks:
-        # want only blocks in the block builder. since the util class has other methods that return
-        # dicts, this will also allow dicts to be inserted
-        if not isinstance(block, (Block, dict)):
-            raise AttributeError(
-                "Block at argument {index} improperly formatted".format(
-                    index=attribute_error_index
-                )
-            )
 
-        block_list.append(block.render() if isinstance(block, Block) else block)
-        attribute_error_index += 1
+@overload
+def get_blocks_json(*blocks, fp: None = None, size: PayloadSize = None) -> str:
+    ...
+
+
+@overload
+def get_blocks_json(*blocks, fp: IO, size: PayloadSize = None) -> None:
+    ...
+
+
+def get_blocks_json(*blocks, fp=None, size: PayloadSize = None) -> Optional[str]:
+    """
+    Takes arguments of `Block` objects and encodes them as a JSON list, the same as ``json.dumps`` of the
+    result of :func:`get_blocks`, without rendering the blocks into dicts first.
+
+    Example:
+        >>> size = PayloadSize()
+        >>> blocks_json = get_blocks_json(*blocks, size=size)
+        >>> if size.blocks > 50 or size.bytes > max_bytes:
+        ...     pages = paginate_blocks(blocks, max_bytes=max_bytes, size=size)
+
+    Args:
+        blocks: An argument list of Block objects. Objects will be inserted top to bottom as they
+            appear in this list.
+        fp: Optional; A text or binary file-like object to write the JSON to.
+        size (PayloadSize): Optional; Adds the size of the JSON, and of each block, to this as the JSON is
+            written.
+    Return:
+        The JSON string, or ``None`` if it was written to ``fp``.
+    Raises:
+        AttributeError: If one of more of the blocks is an invalid block format.
+    """
+    check_blocks(blocks)
+    if pending_validation:
+        validate_pending(blocks, "blocks")
+    addressed = assign_content_ids(blocks)
+    if size is None:
+        return dump_json(addressed, fp)
+    return encode_json(
+        addressed, fp, lambda value, write: write_blocks_json(value, write, size)
+    )
+
+
+def iter_blocks_json(*blocks) -> Iterator[str]:
+    """
+    Like :func:`get_blocks_json`, but yields the JSON list in chunks, one for each block.
+
+    Args:
+        blocks: An argument list of Block objects.
+    Return:
+        A generator of JSON text chunks.
+    Raises:
+        AttributeError: If one of more of the blocks is an invalid block format.
+    """
+    check_blocks(blocks)
+    if pending_validation:
+        validate_pending(blocks, "blocks")
+    addressed = assign_content_ids(blocks)
+    if not addressed:
+        yield "[]"
+        return
+    for index, block in enumerate(addressed):
+        yield ("[" if index == 0 else ", ") + dump_json(block)
+    yield "]"
+
 
-    return block_list
+def get_etag(payload) -> str:
+    """
+    Returns a hash of a payload's JSON, which only changes when the payload does. Use it to cache payloads,
+    as an HTTP ``ETag``, or to skip ``chat.update`` and ``views.update`` calls when nothing changed. Payloads
+    are only stable if their block IDs are, such as with the
+    :class:`~slack_blockkit.block_id.ContentAddressedGenerator`.
+
+    Example:
+        >>> etag = get_etag(view)
+        >>> if etag != sent_etags.get(user_id):
+        ...     client.views_publish(user_id=user_id, view=view.render_json())
+        ...     sent_etags[user_id] = etag
+
+    Args:
+        payload: A :class:`ViewPayload`, a block, a list of blocks and dicts, a ``dict``, or the payload's
+            JSON as ``str`` or ``bytes``.
+    Returns:
+        str: The hash as 32 hexadecimal characters.
+    """
+    if isinstance(payload, (list, tuple)):
+        payload = get_blocks_json(*payload)
+    elif hasattr(payload, "render_json"):
+        payload = payload.render_json()
+    elif not isinstance(payload, (str, bytes)):
+        payload = dump_json(payload)
+    if isinstance(payload, str):
+        payload = payload.encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def validate_blocks(*blocks):
+    """
+    Validates blocks, and every block within them, in one pass, reporting every error at once. Unlike
+    the validation done when blocks are constructed, this also validates rendered dicts, such as the ones
+    returned by the helpers in :mod:`slack_blockkit.utils.blocks`, against the constraints of the block
+    class matching their ``type``. Dicts of types this package does not define are not checked.
+
+    Example:
+        >>> validate_blocks(
+        ...     SectionBlock(text=PlainTextObject(text="Deploy finished")),
+        ...     get_information_block(link=docs_url, text="Read the release notes"),
+        ... )
+
+    Args:
+        blocks: An argument list of Block objects, dicts and :class:`ViewPayload` objects.
+    Raises:
+        ValidationError: With the errors of every invalid block, each prefixed with its path.
+    """
+    errors: List[str] = []
+    check_payload(blocks, ("blocks",), errors)
+    if errors:
+        raise ValidationError(errors)
 
 
 def test_blocks_online(*blocks):
@@ -120,7 +266,7 @@ def test_blocks_online(*blocks):
 
     block_list = get_blocks(*blocks)
     block_arg = {"blocks": block_list}
-    formatted_query = json.dumps(block_arg)
+    formatted_query = to_json(block_arg)
 
     url = base_url.format(formatted_query)
 
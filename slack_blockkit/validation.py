@@ -0,0 +1,126 @@
+import threading
+import weakref
+
+from contextlib import contextmanager
+from typing import Dict, List
+
+VALIDATION_EAGER = "eager"
+VALIDATION_DEFERRED = "deferred"
+VALIDATION_OFF = "off"
+VALIDATION_MODES = (VALIDATION_EAGER, VALIDATION_DEFERRED, VALIDATION_OFF)
+
+_default_mode = VALIDATION_EAGER
+# the mode set by validation_mode() in each thread
+_local = threading.local()
+
+# objects constructed in deferred mode that have not been validated yet, keyed by id
+pending_validation: Dict[int, weakref.ref] = {}
+PRUNE_MIN_SIZE = 1024
+_prune_at = PRUNE_MIN_SIZE
+
+
+class ValidationError(AttributeError):
+    """
+    Raised by deferred validation with every error found in a block tree.
+
+    Args:
+        errors (List[str]): The error messages, each prefixed with the path to the invalid object.
+    """
+
+    def __init__(self, errors: List[str]):
+        super().__init__(f"{len(errors)} validation error(s):\n" + "\n".join(errors))
+        self.errors = errors
+
+
+def check_mode(mode: str):
+    if mode not in VALIDATION_MODES:
+        raise AttributeError(
+            f"validation mode must be one of the following values: {','.join(VALIDATION_MODES)}"
+        )
+
+
+def get_validation_mode() -> str:
+    """
+    Returns the validation mode in effect, which is the mode set by :func:`validation_mode` if inside one
+    and the global mode otherwise.
+
+    Returns:
+        str: One of ``eager``, ``deferred`` or ``off``.
+    """
+    return getattr(_local, "mode", None) or _default_mode
+
+
+def set_validation_mode(mode: str):
+    """
+    Sets the global validation mode:
+
+    - ``eager`` (the default) validates every block as it is constructed.
+    - ``deferred`` validates blocks when they are first rendered, whether by ``render()``, ``get_blocks``
+      or a :class:`ViewPayload`, and raises a :class:`ValidationError` with every error in the tree.
+    - ``off`` does not validate blocks at all. Use it only for blocks built from trusted values.
+
+    Args:
+        mode (str): One of ``eager``, ``deferred`` or ``off``.
+    Raises:
+        AttributeError: If the mode is not valid.
+    """
+    global _default_mode
+    check_mode(mode)
+    _default_mode = mode
+
+
+@contextmanager
+def validation_mode(mode: str):
+    """
+    Sets the validation mode within a ``with`` block. The mode only applies to the current thread, which
+    asyncio tasks in the thread share, so do not await within the block. See :func:`set_validation_mode`
+    for the modes.
+
+    Example:
+        >>> with validation_mode(VALIDATION_OFF):
+        ...     blocks = [SectionBlock(text=PlainTextObject(text=line)) for line in TRUSTED_LINES]
+
+    Args:
+        mode (str): One of ``eager``, ``deferred`` or ``off``.
+    Raises:
+        AttributeError: If the mode is not valid.
+    """
+    check_mode(mode)
+    previous = getattr(_local, "mode", None)
+    _local.mode = mode
+    try:
+        yield
+    finally:
+        _local.mode = previous
+
+
+def validate_on_init(obj):
+    """
+    Validates a newly constructed object according to the validation mode in effect. In ``deferred`` mode,
+    the object is recorded to be validated when it is first rendered instead.
+
+    Args:
+        obj: An object with a ``validate()`` method.
+    Raises:
+        AttributeError: If the mode is ``eager`` and the object is not valid.
+    """
+    mode = getattr(_local, "mode", None) or _default_mode
+    if mode == VALIDATION_EAGER:
+        obj.validate()
+    elif mode == VALIDATION_DEFERRED:
+        # weak references without a callback are much cheaper to create, so entries for objects that were
+        # never rendered are pruned once the number of entries has doubled instead
+        pending_validation[id(obj)] = weakref.ref(obj)
+        if len(pending_validation) > _prune_at:
+            prune_pending()
+
+
+def prune_pending():
+    """
+    Removes the entries for objects that were garbage collected before they were validated.
+    """
+    global _prune_at
+    for key, ref in list(pending_validation.items()):
+        if ref() is None:
+            del pending_validation[key]
+    _prune_at = max(PRUNE_MIN_SIZE, 2 * len(pending_validation))
@@ -1,7 +1,22 @@
-from typing import List
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Union, overload
 
-from .block import Block
+from .block import (
+    SCALAR_TYPES,
+    Block,
+    MemoizedBlock,
+    PayloadSize,
+    dump_json,
+    encode_json,
+    iter_blocks,
+    validate_pending,
+    write_blocks_json,
+    write_json,
+)
+from .block_id import assign_content_ids
 from .composition_object import TextObject
+from .layout_block import LayoutBlock
+from .schema import FIELD_CHECKERS, Bool, Constraint, Items, Nested, Str, Text
+from .validation import ValidationError, pending_validation, validate_on_init
 
 
 class ViewPayload:
@@ -12,6 +27,22 @@ class ViewPayload:
     BTYPE_MODAL = "modal"
     BTYPE_HOME = "home"
 
+    CONSTRAINTS: Dict[str, Constraint] = {
+        "btype": Str(one_of=(BTYPE_HOME, BTYPE_MODAL), required=True),
+        "title": Text(max_length=24, plain_text=True),
+        "blocks": Items(Nested(LayoutBlock, TextObject), max_items=100, required=True),
+        "close": Text(max_length=24, plain_text=True),
+        "submit": Text(max_length=24, plain_text=True),
+        "private_metadata": Str(max_length=3000),
+        "callback_id": Str(max_length=255),
+        "clear_on_close": Bool(),
+        "notify_on_close": Bool(),
+        "external_id": Str(),
+    }
+
+    # whether render() returns the memoized dicts of the blocks, or None if the view is not memoized
+    memo_read_only: Optional[bool] = None
+
     def __init__(
         self,
         btype: str,
@@ -26,59 +57,9 @@ class ViewPayload:
         external_id: str = None,
     ):
 
-        # type validation
-        # type must be either home or modal
-        if btype != self.BTYPE_HOME and btype != self.BTYPE_MODAL:
-            raise AttributeError(
-                f"Invalid btype. Type must be {self.BTYPE_HOME} or {self.BTYPE_MODAL}: {btype}"
-            )
-
-        # title must be plain text and 24 characters or less
-        if not title.is_plain_text():
-            raise AttributeError("title must be plain text")
-        if title.get_text_length() > 24:
-            raise AttributeError(
-                f"title text must be 24 characters or less, but length "
-                f"is {close.get_text_length()}"
-            )
-
-        # close must be plain text and 24 characters or less
-        if close:
-            if not close.is_plain_text():
-                raise AttributeError("close must be plain text")
-            if close.get_text_length() > 24:
-                raise AttributeError(
-                    f"close text must be 24 characters or less, but length "
-                    f"is {close.get_text_length()}"
-                )
-
-        # submit must be plain text, 24 characters or less, and must exist if there is an input block within the blocks
-        # array
-        if submit:
-            if not submit.is_plain_text():
-                raise AttributeError("submit must be plain text")
-            if submit.get_text_length() > 24:
-                raise AttributeError(
-                    f"submit text must be 24 characters or less, but length "
-                    f"is {submit.get_text_length()}"
-                )
-
-        # private_metadata must be 3000 characters or less
-        if private_metadata and len(private_metadata) > 3000:
-            raise AttributeError(
-                f"private_metadata must be 3000 characters or less. Currently {len(private_metadata)}"
-            )
-
-        # callbacl_id must be 255 characters or less
-        if callback_id and len(callback_id) > 255:
-            raise AttributeError(
-                f"callback_id must be 3000 characters or less. Currently {len(callback_id)}"
-            )
-
         self.btype = btype
         # titles are used only for modals
-        if self.btype == self.BTYPE_MODAL:
-            self.title = title
+        self.title = title if self.btype == self.BTYPE_MODAL else None
         self.blocks = blocks
         self.close = close
         self.submit = submit
@@ -87,32 +68,222 @@ class ViewPayload:
         self.clear_on_close = clear_on_close
         self.notify_on_close = notify_on_close
         self.external_id = external_id
+        validate_on_init(self)
+
+    def validate(self):
+        """
+        Validates the fields of the view against ``CONSTRAINTS``. This is called when the view is constructed,
+        or when it is first rendered if the validation mode is ``deferred``.
+
+        :raises ValidationError: With every invalid field of the view.
+        """
+        errors: List[str] = []
+        FIELD_CHECKERS[self.__class__](self, (self.__class__.__name__,), errors)
+        if errors:
+            raise ValidationError(errors)
 
-    def render(self) -> dict:
+    def get_fields(self) -> dict:
+        """
+        Returns the fields of the view in payload order, before any of their blocks are rendered.
+
+        Returns:
+            dict: The view fields.
+        """
         # required parameters
-        block = {
-            "type": self.btype,
-            "title": self.title.render(),
-            "blocks": self.blocks,
-        }
+        fields: Dict[str, Any] = {"type": self.btype}
+        if self.title:
+            fields.update({"title": self.title})
+        fields.update({"blocks": self.blocks})
 
         # optional parameters
         if self.close:
-            block.update({"close": self.close.render()})
+            fields.update({"close": self.close})
         if self.submit:
-            block.update({"submit": self.submit.render()})
+            fields.update({"submit": self.submit})
         if self.private_metadata:
-            block.update({"private_metadata": self.private_metadata})
+            fields.update({"private_metadata": self.private_metadata})
         if self.callback_id:
-            block.update({"callback_id": self.callback_id})
+            fields.update({"callback_id": self.callback_id})
         if not self.clear_on_close:
-            block.update({"clear_on_close": self.clear_on_close})
+            fields.update({"clear_on_close": self.clear_on_close})
         if not self.notify_on_close:
-            block.update({"notify_on_close": self.notify_on_close})
+            fields.update({"notify_on_close": self.notify_on_close})
         if self.external_id:
-            block.update({"external_id": self.external_id})
+            fields.update({"external_id": self.external_id})
 
-        return block
+        return fields
+
+    def memoize(self, read_only: bool = False) -> "ViewPayload":
+        """
+        Makes rendering the view incremental: every block of the view is memoized (see :meth:`Block.memoize`),
+        so rendering the view reuses the ``dict`` and JSON rendered for each block until it, or a block within
+        it, is changed. Blocks added to the view later are memoized when it is next rendered.
+        Use :func:`render_stats` to measure how many blocks were rendered and reused.
+
+        Example:
+            >>> view = ModalViewPayload(title=title, blocks=get_ticket_blocks(tickets)).memoize()
+            >>> view.blocks[42].text = MarkdownTextObject(text="*BK-42* closed")
+            >>> payload = view.render_json()  # renders only the changed block
+
+        :param read_only: If ``True``, ``render()`` returns the memoized ``dict`` of each block instead of a
+            copy, which must then not be modified. Defaults to ``False``.
+        :return: This view.
+        """
+        self.memo_read_only = read_only
+        self.track_blocks()
+        return self
+
+    def is_memoized(self) -> bool:
+        return self.memo_read_only is not None
+
+    def track_blocks(self):
+        # blocks added or replaced since the view was memoized are memoized as well
+        read_only = bool(self.memo_read_only)
+        for value in self.get_fields().values():
+            for block in iter_blocks(value):
+                if not isinstance(block, MemoizedBlock):
+                    block.memoize(read_only)
+
+    def get_render_fields(self) -> dict:
+        """
+        Returns the fields of the view as they are rendered, which is :meth:`get_fields` with content
+        addressed block IDs added to the blocks that need them.
+
+        Returns:
+            dict: The view fields.
+        """
+        fields = self.get_fields()
+        fields["blocks"] = assign_content_ids(fields["blocks"])
+        return fields
+
+    def render(self, strict: bool = False, size: PayloadSize = None) -> dict:
+        """
+        Renders the view in a ``dict`` format, including any :class:`Block` objects within ``blocks``. The
+        blocks are rendered in the same pass as the fields of the view, so there is no need to render them
+        with ``get_blocks`` first; dicts within ``blocks`` are used as they are.
+
+        :param strict: If ``True``, raise an error instead of leaving values that cannot be rendered in the
+            output, such as blocks that are neither a :class:`Block` nor a ``dict``. Defaults to ``False``.
+        :param size: Optional; Adds the size of the view as JSON, and of each block, to this. The view is
+            measured without encoding it, and memoized blocks by their memoized JSON (see
+            :meth:`PayloadSize.add_payload`).
+        :return: The view as a dict.
+        :raises ValidationError: If the view, or a block within it, was constructed in ``deferred`` validation
+            mode and is not valid.
+        :raises AttributeError: If ``strict`` and a value of the view cannot be rendered.
+        """
+        if pending_validation:
+            validate_pending(self, "view")
+        if self.is_memoized():
+            self.track_blocks()
+
+        fields = self.get_render_fields()
+        rendered = {}
+        for key, value in fields.items():
+            if key == "blocks":
+                if strict:
+                    check_rendered(value)
+                value = [
+                    block.render() if isinstance(block, Block) else block
+                    for block in value
+                ]
+            elif isinstance(value, Block):
+                value = value.render()
+            elif strict and value.__class__ not in SCALAR_TYPES:
+                raise AttributeError(
+                    f"view {key} cannot be rendered, it is {type(value).__name__}"
+                )
+            rendered[key] = value
+        if size is not None:
+            size.add_payload(fields)
+        return rendered
+
+    @overload
+    def render_json(self, fp: None = None, size: PayloadSize = None) -> str:
+        ...
+
+    @overload
+    def render_json(self, fp: IO, size: PayloadSize = None) -> None:
+        ...
+
+    def render_json(self, fp=None, size: PayloadSize = None) -> Optional[str]:
+        """
+        Renders the view as a JSON string without building the rendered ``dict`` tree. Any :class:`Block`
+        objects within ``blocks`` are rendered as well.
+
+        :param fp: Optional; A text or binary file-like object to write the JSON to.
+        :param size: Optional; Adds the size of the JSON, and of each block, to this as the JSON is written.
+        :return: The view as JSON, or ``None`` if it was written to ``fp``.
+        """
+        if pending_validation:
+            validate_pending(self, "view")
+        if size is None:
+            return encode_json(self, fp)
+        return encode_json(self, fp, lambda view, write: view.write_json(write, size))
+
+    def to_json(self, as_bytes: bool = False) -> Union[str, bytes]:
+        """
+        Renders the view as compact JSON with the fastest JSON library installed. See
+        :func:`slack_blockkit.utils.to_json`.
+
+        :param as_bytes: If ``True``, return UTF-8 ``bytes`` instead of a ``str``. Defaults to ``False``.
+        :return: The view as JSON.
+        """
+        from slack_blockkit.utils.serialization import to_json
+
+        return to_json(self, as_bytes)
+
+    def write_json(self, write: Callable[[str], None], size: PayloadSize = None):
+        """
+        Writes the view as JSON using ``write``, streaming its blocks as by :meth:`Block.write_json`. The
+        blocks of a memoized view write their memoized JSON.
+
+        :param write: Called with each fragment of JSON text, in order.
+        :param size: Optional; Adds the size of the JSON, and of each block, to this as the JSON is written.
+        """
+        if self.is_memoized():
+            self.track_blocks()
+
+        counted = write if size is None else size.counting(write)
+        separator = "{"
+        for key, value in self.get_render_fields().items():
+            counted(f"{separator}{dump_json(key)}: ")
+            separator = ", "
+            if key == "blocks" and size is not None:
+                write_blocks_json(value, write, size)
+            else:
+                write_json(value, counted)
+        counted("}")
+
+    def iter_json(self) -> Iterator[str]:
+        """
+        Yields the view as chunks of JSON text, with a separate chunk for each of its blocks. Joined together,
+        the chunks are the same as the output of ``render_json()``.
+
+        :return: A generator of JSON text chunks.
+        """
+        if pending_validation:
+            validate_pending(self, "view")
+        if self.is_memoized():
+            self.track_blocks()
+
+        parts = []
+        separator = "{"
+        for key, value in self.get_render_fields().items():
+            parts.append(f"{separator}{dump_json(key)}: ")
+            separator = ", "
+            if key != "blocks":
+                write_json(value, parts.append)
+                continue
+
+            # flush everything before the blocks, then yield the blocks one at a time
+            yield "".join(parts) + "["
+            for index, block in enumerate(value):
+                yield (", " if index else "") + dump_json(block)
+            parts = ["]"]
+
+        parts.append("}")
+        yield "".join(parts)
 
     def get_payload(self) -> dict:
         """
@@ -123,12 +294,22 @@ class ViewPayload:
         return self.render()
 
 
+def check_rendered(blocks: list):
+    for index, block in enumerate(blocks):
+        if not isinstance(block, (Block, dict)):
+            raise AttributeError(
+                f"view blocks[{index}] cannot be rendered, it is {type(block).__name__}"
+            )
+
+
 class HomeViewPayload(ViewPayload):
     """
     Defines a home view payload. Syntactic sugar for the `ViewPayload` class where the `btype` is set to
     *home*.
     """
 
+    BTYPE = ViewPayload.BTYPE_HOME
+
     def __init__(
         self,
         title: TextObject,
@@ -161,6 +342,11 @@ class ModalViewPayload(ViewPayload):
     *modal*.
     """
 
+    BTYPE = ViewPayload.BTYPE_MODAL
+
+    # Slack rejects modals without a title
+    CONSTRAINTS = {"title": Text(max_length=24, plain_text=True, required=True)}
+
     def __init__(
         self,
         title: TextObject,
@@ -0,0 +1,352 @@
+"""
+Test the base block and render mixin.
+"""
+import io
+import json
+import pickle
+
+import pytest
+
+from slack_blockkit.block import (
+    RENDER_COPY_FREE,
+    RENDER_ITERATIVE,
+    RENDER_RECURSIVE,
+    Block,
+    BlockDict,
+    BlockList,
+    get_render_backend,
+    render_backend,
+    render_iterative,
+    set_render_backend,
+)
+from slack_blockkit.block_element import (
+    ButtonElement,
+    PrimaryButtonElement,
+    RadioButtonGroupElement,
+)
+from slack_blockkit.composition_object import PlainTextObject
+from slack_blockkit.layout_block import LayoutBlock, SectionBlock
+from slack_blockkit.utils import get_blocks, get_blocks_json
+
+
+class CustomBlock(LayoutBlock):
+    # a block defined outside the package, with neither RENDER_FIELDS nor __slots__
+    def __init__(self, foo: str, block_id: str = None):
+        self.foo = foo
+        super().__init__(btype="custom", block_id=block_id)
+
+
+class HelperBlock(Block):
+    # sets an attribute in a helper method rather than in __init__
+    def __init__(self, x: int, y: int = None):
+        self.x = x
+        self.set_y(y)
+        super().__init__(btype="helper")
+
+    def set_y(self, y: int):
+        self.y = y
+
+
+class FieldsBlock(Block):
+    # sets its attributes in a loop
+    def __init__(self, **fields):
+        for name, value in fields.items():
+            setattr(self, name, value)
+        super().__init__(btype="fields")
+
+
+class NoteBlock(SectionBlock):
+    # sets its own attribute after the section's
+    def __init__(self, note: str, **kwargs):
+        super().__init__(**kwargs)
+        self.note = note
+
+
+class UpperTextObject(PlainTextObject):
+    # a text object defined outside the package, which changes its rendered dict
+    def render(self) -> dict:
+        rendered = super().render()
+        rendered["text"] = rendered["text"].upper()
+        return rendered
+
+
+def test_render_plan():
+    plan = ButtonElement.get_render_plan()
+    assert [key for _, key, _ in plan] == [
+        "text",
+        "url",
+        "value",
+        "style",
+        "confirm",
+        "action_id",
+        "type",
+    ]
+    nested = {name for name, _, is_nested in plan if is_nested}
+    assert nested == {"text", "confirm"}
+
+    # plans are compiled once per class
+    assert ButtonElement.get_render_plan() is plan
+    assert PrimaryButtonElement.get_render_plan() == plan
+
+
+def test_render_key_order(primary_button_element: PrimaryButtonElement):
+    section = SectionBlock(
+        text=PlainTextObject(text="Section"),
+        block_id="section-1",
+        accessory=primary_button_element,
+    )
+    assert json.dumps(section.render()) == (
+        '{"block_id": "section-1", '
+        '"text": {"text": "Section", "emoji": false, "type": "plain_text"}, '
+        '"accessory": {"text": {"text": "Primary button", "emoji": false, "type": "plain_text"}, '
+        '"url": "https://codedevils.org/primary", "value": "Primary", "style": "primary", '
+        '"action_id": "primary-action-1002", "type": "button"}, '
+        '"type": "section"}'
+    )
+
+
+def test_render_user_defined_block():
+    block = CustomBlock("bar", block_id="custom-1")
+    rendered = {"foo": "bar", "block_id": "custom-1", "type": "custom"}
+    assert json.dumps(block.render()) == json.dumps(rendered)
+    assert block.render_json() == json.dumps(rendered)
+    assert block.memoize().render() == rendered
+
+    # every attribute is rendered, however and whenever it was set
+    assert HelperBlock(1, y=2).render() == {"x": 1, "y": 2, "type": "helper"}
+    assert FieldsBlock(foo="bar").render() == {"foo": "bar", "type": "fields"}
+    block = FieldsBlock(foo="bar")
+    block.baz = 1
+    rendered = {"foo": "bar", "baz": 1, "type": "fields"}
+    assert block.render_json() == json.dumps(rendered)
+
+    frozen = CustomBlock("bar", block_id="custom-1").freeze()
+    frozen_changed = frozen.with_changes(foo="baz")
+    assert frozen_changed.render() == {
+        "foo": "baz",
+        "block_id": "custom-1",
+        "type": "custom",
+    }
+    assert pickle.loads(pickle.dumps(frozen)).render() == frozen.render()
+
+
+def test_blocks_use_slots(
+    section_block: SectionBlock, option_group_object, radiobutton_group_element
+):
+    for block in (section_block, option_group_object, radiobutton_group_element):
+        assert not hasattr(block, "__dict__")
+
+    # blocks defined outside the package keep every attribute in their __dict__
+    block = NoteBlock("Deployed", text=PlainTextObject(text="Deploy"), block_id="s1")
+    assert set(vars(block)) >= {"note", "text", "block_id", "btype"}
+    # the attributes of the section are rendered in their usual order, as they always were
+    assert list(block.render()) == ["block_id", "text", "note", "type"]
+    assert block.memoize().render_json() == json.dumps(block.render())
+
+
+def test_render_json(section_block: SectionBlock, actions_block):
+    for block in (section_block, actions_block):
+        assert block.render_json() == json.dumps(block.render())
+
+
+def test_render_json_custom_render():
+    section = SectionBlock(text=UpperTextObject(text="hi"), block_id="section-1")
+    assert section.render()["text"]["text"] == "HI"
+    assert section.render_json() == json.dumps(section.render())
+    assert get_blocks_json(section) == json.dumps(get_blocks(section))
+
+
+def test_render_json_to_file(section_block: SectionBlock):
+    text_buffer = io.StringIO()
+    binary_buffer = io.BytesIO()
+    assert section_block.render_json(text_buffer) is None
+    section_block.render_json(binary_buffer)
+    assert text_buffer.getvalue() == json.dumps(section_block.render())
+    assert binary_buffer.getvalue() == text_buffer.getvalue().encode()
+
+
+def test_memoize(section_block: SectionBlock):
+    expected = section_block.render()
+    section_block.memoize()
+    assert section_block.is_memoized()
+    assert isinstance(section_block, SectionBlock)
+
+    rendered = section_block.render()
+    assert rendered == expected
+    assert section_block.render_json() == json.dumps(expected)
+
+    # the memoized dict is not exposed to callers
+    rendered["text"]["text"] = "Changed"
+    assert section_block.render() == expected
+
+
+def test_memoize_invalidates_on_change(section_block: SectionBlock):
+    section_block.memoize()
+    section_block.render()
+
+    # changes to nested blocks invalidate every memoized block containing them
+    section_block.accessory.title.text = "New title"
+    assert section_block.render()["accessory"]["title"]["text"] == "New title"
+
+    section_block.text = PlainTextObject(text="New text")
+    assert section_block.render()["text"]["text"] == "New text"
+    section_block.text.text = "Newer text"
+    assert section_block.render()["text"]["text"] == "Newer text"
+
+
+def test_memoize_read_only(section_block: SectionBlock):
+    section_block.memoize(read_only=True)
+    assert section_block.render() is section_block.render()
+
+
+def test_freeze_memoized_read_only(section_block: SectionBlock):
+    section_block.memoize()
+    assert section_block.render() is not section_block.render()
+    section_block.freeze(read_only=True)
+    assert section_block.render() is section_block.render()
+    assert section_block.text.render() is section_block.text.render()
+
+
+def test_freeze(section_block: SectionBlock):
+    section_block.freeze()
+    assert section_block.is_frozen()
+    with pytest.raises(AttributeError):
+        section_block.text = PlainTextObject(text="New text")
+    with pytest.raises(AttributeError):
+        section_block.accessory.alt_text = "New alt text"
+
+
+def test_pickle_memoized(section_block: SectionBlock):
+    expected = section_block.render()
+    section_block.freeze()
+    restored = pickle.loads(pickle.dumps(section_block))
+    assert restored.is_frozen()
+    assert restored.render() == expected
+
+
+def test_frozen_hash_and_equality(actions_block):
+    actions_block.freeze()
+    assert isinstance(actions_block.elements, tuple)
+    assert actions_block.render()["elements"] == [
+        element.render() for element in actions_block.elements
+    ]
+
+    copy = actions_block.with_changes()
+    assert copy is not actions_block
+    assert copy == actions_block
+    assert hash(copy) == hash(actions_block)
+    assert len({copy, actions_block}) == 1
+
+
+def test_with_changes(actions_block):
+    actions_block.freeze()
+    first, *rest = actions_block.elements
+    changed = actions_block.with_changes(
+        elements=(first.with_changes(action_id="changed"), *rest)
+    )
+
+    assert changed.is_frozen()
+    assert changed != actions_block
+    assert changed.render()["elements"][0]["action_id"] == "changed"
+    assert actions_block.render()["elements"][0]["action_id"] == "action-block"
+
+    # untouched blocks are shared rather than copied
+    assert changed.elements[1:] == actions_block.elements[1:]
+    assert all(a is b for a, b in zip(changed.elements[1:], actions_block.elements[1:]))
+    assert changed.elements[0].options is first.options
+
+    with pytest.raises(AttributeError):
+        actions_block.with_changes(color="red")
+
+
+@pytest.mark.parametrize(
+    "fixture",
+    [
+        "actions_block",
+        "context_block",
+        "input_block",
+        "section_block",
+        "option_group_object",
+        "radiobutton_group_element",
+    ],
+)
+def test_render_iterative(fixture, request):
+    block = request.getfixturevalue(fixture)
+    expected = block.render()
+    assert render_iterative(block) == expected
+    assert json.dumps(render_iterative(block)) == json.dumps(expected)
+
+    with render_backend(RENDER_ITERATIVE):
+        assert get_render_backend() == RENDER_ITERATIVE
+        assert block.render() == expected
+    assert get_render_backend() == RENDER_RECURSIVE
+
+
+def test_render_iterative_deep():
+    block = SectionBlock(text=PlainTextObject(text="0"))
+    for index in range(1, 5000):
+        block = SectionBlock(text=PlainTextObject(text=str(index)), accessory=block)
+
+    with pytest.raises(RecursionError):
+        block.render()
+    with render_backend(RENDER_ITERATIVE):
+        rendered = block.render()
+    for _ in range(4999):
+        rendered = rendered["accessory"]
+    assert rendered["text"]["text"] == "0"
+    assert "accessory" not in rendered
+
+
+def test_render_iterative_memoized(section_block: SectionBlock, actions_block):
+    actions_block.elements[0].memoize(read_only=True)
+    section = SectionBlock(text=section_block.text, accessory=actions_block)
+    rendered = render_iterative(section)
+    assert rendered == section.render()
+    assert rendered["accessory"]["elements"][0] is actions_block.elements[0].render()
+
+    with pytest.raises(AttributeError):
+        set_render_backend("threaded")
+
+
+def test_render_iterative_custom_render():
+    section = SectionBlock(
+        text=UpperTextObject(text="deploy"),
+        fields=[UpperTextObject(text="prod"), PlainTextObject(text="eu")],
+    )
+    expected = section.render()
+    assert expected["text"]["text"] == "DEPLOY"
+    assert render_iterative(section) == expected
+    with render_backend(RENDER_ITERATIVE):
+        assert section.render() == expected
+
+
+def test_render_does_not_change_dicts(section_block: SectionBlock):
+    value = {"note": PlainTextObject(text="Note"), "count": 1}
+    section_block.accessory = value
+    for backend in (RENDER_RECURSIVE, RENDER_ITERATIVE):
+        with render_backend(backend):
+            rendered = section_block.render()
+        assert rendered["accessory"] == {
+            "note": {"type": "plain_text", "text": "Note", "emoji": False},
+            "count": 1,
+        }
+        assert isinstance(value["note"], PlainTextObject)
+
+
+def test_render_copy_free(section_block: SectionBlock):
+    options = [{"text": {"type": "plain_text", "text": "Option"}, "value": "1"}]
+    radio = RadioButtonGroupElement(action_id="choice", options=options)
+    section_block.fields = BlockList([PlainTextObject(text="Field")])
+    section_block.accessory = radio
+
+    with render_backend(RENDER_COPY_FREE):
+        rendered = section_block.render()
+    assert rendered == section_block.render()
+    # plain lists are shared as they are, and marked lists are rendered into a new list
+    assert rendered["accessory"]["options"] is options
+    assert rendered["fields"] == [PlainTextObject(text="Field").render()]
+
+    section_block.accessory = BlockDict(note=PlainTextObject(text="Note"))
+    with render_backend(RENDER_COPY_FREE):
+        assert section_block.render()["accessory"]["note"]["text"] == "Note"
+    assert isinstance(section_block.accessory["note"], PlainTextObject)
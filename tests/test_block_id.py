@@ -0,0 +1,140 @@
+"""
+Test the block ID generators.
+"""
+import json
+import uuid
+
+import pytest
+
+from slack_blockkit.block_id import (
+    BatchedRandomGenerator,
+    BlockIdGenerator,
+    ContentAddressedGenerator,
+    ContentHashGenerator,
+    CounterGenerator,
+    UUIDGenerator,
+    block_id_generator,
+    get_block_id_generator,
+    set_block_id_generator,
+)
+from slack_blockkit.composition_object import MarkdownTextObject, PlainTextObject
+from slack_blockkit.layout_block import DividerBlock, SectionBlock
+from slack_blockkit.utils import get_blocks, get_blocks_json, get_etag, iter_blocks_json
+from slack_blockkit.view_payload import HomeViewPayload
+
+
+def _get_message_blocks() -> list:
+    return [
+        SectionBlock(text=MarkdownTextObject(text="*Deploy* finished")),
+        DividerBlock(),
+        SectionBlock(text=PlainTextObject(text="Deploy finished")),
+        DividerBlock(),
+    ]
+
+
+@pytest.mark.parametrize(
+    "generator_class",
+    [UUIDGenerator, CounterGenerator, BatchedRandomGenerator, ContentHashGenerator],
+)
+def test_generated_ids_are_unique(generator_class):
+    with block_id_generator(generator_class()):
+        block_ids = [
+            block.block_id for _ in range(1000) for block in _get_message_blocks()
+        ]
+    assert len(set(block_ids)) == len(block_ids)
+    assert all(len(block_id) <= 255 for block_id in block_ids)
+
+
+def test_generator_base_is_abstract():
+    with pytest.raises(TypeError):
+        BlockIdGenerator()
+
+    generator = BatchedRandomGenerator(batch_size=4)
+    block_ids = [generator(None) for _ in range(8)]
+    assert all(len(block_id) == 32 for block_id in block_ids)
+    int("".join(block_ids), 16)
+
+
+def test_generator_selection():
+    assert isinstance(get_block_id_generator(), UUIDGenerator)
+    uuid.UUID(DividerBlock().block_id)
+
+    counter = CounterGenerator()
+    with block_id_generator(counter):
+        assert get_block_id_generator() is counter
+        first, second = DividerBlock().block_id, DividerBlock().block_id
+    assert first.split("-")[0] == second.split("-")[0]
+    assert (first.split("-")[1], second.split("-")[1]) == ("0", "1")
+
+    set_block_id_generator(counter)
+    try:
+        assert DividerBlock().block_id.endswith("-2")
+    finally:
+        set_block_id_generator(UUIDGenerator())
+
+    # a generator, or an ID, passed to a block is used for that block only
+    assert DividerBlock(block_id=counter).block_id.endswith("-3")
+    assert DividerBlock(block_id="divider").block_id == "divider"
+
+    with pytest.raises(AttributeError):
+        set_block_id_generator(uuid.uuid4)
+
+
+def test_content_hash_ids_are_stable():
+    with block_id_generator(ContentHashGenerator()):
+        first = [block.block_id for block in _get_message_blocks()]
+    with block_id_generator(ContentHashGenerator()):
+        second = [block.block_id for block in _get_message_blocks()]
+    assert first == second
+
+    # the sections differ in their text type, while the dividers only differ by the suffix
+    assert first[0] != first[2]
+    assert first[3] == f"{first[1]}-2"
+
+
+def test_generator_reset():
+    counter, batched = CounterGenerator(), BatchedRandomGenerator(batch_size=4)
+    counter_id, batched_id = counter(None), batched(None)
+    counter.reset()
+    batched.reset()
+    assert counter(None) != counter_id
+    assert batched(None) != batched_id
+
+
+def _get_view() -> HomeViewPayload:
+    with block_id_generator(ContentAddressedGenerator()):
+        return HomeViewPayload(title=None, blocks=_get_message_blocks())
+
+
+def test_content_addressed_ids():
+    with block_id_generator(ContentAddressedGenerator()):
+        blocks = _get_message_blocks()
+    assert all(block.block_id is None for block in blocks)
+
+    rendered = get_blocks(*blocks)
+    block_ids = [block["block_id"] for block in rendered]
+    assert len(set(block_ids)) == len(block_ids)
+    assert list(rendered[0]) == ["block_id", "text", "type"]
+    assert rendered[0] == {"block_id": block_ids[0], **blocks[0].render()}
+
+    # the same blocks always render the same, and the ID depends on the position
+    assert get_blocks(*_get_view().blocks) == rendered
+    assert get_blocks_json(*blocks) == json.dumps(rendered)
+    assert "".join(iter_blocks_json(*blocks)) == json.dumps(rendered)
+    assert get_blocks(blocks[1], blocks[0])[1]["block_id"] != block_ids[0]
+
+    # blocks with IDs, and dicts, are left as they are
+    divider = DividerBlock(block_id="divider")
+    assert get_blocks(divider, rendered[0]) == [divider.render(), rendered[0]]
+
+
+def test_content_addressed_view():
+    view = _get_view()
+    assert view.render()["blocks"] == get_blocks(*view.blocks)
+    assert view.render_json() == _get_view().render_json()
+    assert "".join(view.iter_json()) == view.render_json()
+    assert get_etag(view) == get_etag(_get_view())
+    assert get_etag(view) == get_etag(view.render_json().encode())
+
+    view.blocks[0].text = MarkdownTextObject(text="*Deploy* failed")
+    assert get_etag(view) != get_etag(_get_view())
@@ -2,7 +2,9 @@
 Test block utils.
 """
 
-from slack_blockkit.utils import get_blocks
+import json
+
+from slack_blockkit.utils import get_blocks, get_blocks_json, iter_blocks_json
 from slack_blockkit.utils.blocks import (
     get_checkmark,
     get_information_block,
@@ -22,6 +24,15 @@ def test_get_blocks():
     assert blocks == [text1.render(), text2.render(), text3.render()]
 
 
+def test_get_blocks_json(section_block, divider_block):
+    info_block = get_information_block(link="https://codedevils.org", text="Info")
+    blocks = (section_block, info_block, divider_block)
+    expected = json.dumps(get_blocks(*blocks))
+    assert get_blocks_json(*blocks) == expected
+    assert "".join(iter_blocks_json(*blocks)) == expected
+    assert "".join(iter_blocks_json()) == get_blocks_json() == "[]"
+
+
 def test_get_checkmark():
     assert get_checkmark(task_completed=True) == ":white_check_mark:"
     assert get_checkmark(task_completed=False) == ":white_large_square:"
@@ -0,0 +1,94 @@
+"""
+Test the block and view diff engine.
+"""
+from slack_blockkit.composition_object import MarkdownTextObject, PlainTextObject
+from slack_blockkit.layout_block import DividerBlock, SectionBlock
+from slack_blockkit.utils import get_blocks
+from slack_blockkit.utils.blocks import get_information_block
+from slack_blockkit.utils.diff import diff_blocks, diff_views, get_stable_positions
+from slack_blockkit.view_payload import HomeViewPayload
+
+
+def _get_blocks(count: int) -> list:
+    return get_blocks(
+        *[
+            SectionBlock(
+                text=PlainTextObject(text=f"Task {index}"), block_id=str(index)
+            )
+            for index in range(count)
+        ]
+    )
+
+
+def _get_keys(changes) -> list:
+    return [change.key for change in changes]
+
+
+def test_get_stable_positions():
+    assert get_stable_positions([]) == set()
+    assert get_stable_positions([0, 1, 2]) == {0, 1, 2}
+    assert get_stable_positions([2, 0, 1, 3]) == {1, 2, 3}
+    assert len(get_stable_positions([3, 2, 1, 0])) == 1
+
+
+def test_diff_unchanged():
+    blocks = _get_blocks(5)
+    diff = diff_blocks(blocks, _get_blocks(5))
+    assert not diff and not diff.has_changes()
+    assert diff.apply(blocks) == blocks
+
+
+def test_diff_blocks():
+    old_blocks = _get_blocks(6)
+    new_blocks = [
+        old_blocks[0],
+        old_blocks[4],
+        old_blocks[1],
+        SectionBlock(text=PlainTextObject(text="Task 2, done"), block_id="2").render(),
+        {"type": "divider", "block_id": "new"},
+        old_blocks[3],
+    ]
+    diff = diff_blocks(old_blocks, new_blocks)
+    assert diff.has_changes()
+    assert _get_keys(diff.added) == ["new"]
+    assert _get_keys(diff.removed) == ["5"]
+    assert _get_keys(diff.moved) == ["4"]
+    assert (diff.moved[0].old_index, diff.moved[0].new_index) == (4, 1)
+    assert _get_keys(diff.changed) == ["2"]
+    assert diff.changed[0].new["text"]["text"] == "Task 2, done"
+    assert diff.apply(old_blocks) == new_blocks
+
+
+def test_diff_blocks_without_ids():
+    information = get_information_block(link="https://x.org", text="Docs")
+    old_blocks = [information, {"type": "divider"}, information]
+    new_blocks = [{"type": "divider"}, information, information, information]
+    diff = diff_blocks(old_blocks, new_blocks)
+    # dicts without IDs are matched by content, so identical ones are only added or removed
+    assert len(diff.added) == 1 and diff.added[0].new_index == 3
+    assert not diff.removed and not diff.changed
+    assert len(diff.moved) == 1
+    assert diff.apply(old_blocks) == new_blocks
+
+    # blocks are rendered before they are compared
+    divider = DividerBlock(block_id="divider")
+    assert not diff_blocks([divider], [divider.render()])
+
+
+def test_diff_views():
+    def get_view(title: str, text: str) -> HomeViewPayload:
+        return HomeViewPayload(
+            title=None,
+            blocks=[
+                SectionBlock(text=MarkdownTextObject(text=text), block_id="status"),
+                DividerBlock(block_id="divider"),
+            ],
+            callback_id=title,
+        )
+
+    assert not diff_views(get_view("home", "Idle"), get_view("home", "Idle"))
+
+    diff = diff_views(get_view("home", "Idle"), get_view("home-2", "*Busy*").render())
+    assert diff.fields == {"callback_id": ("home", "home-2")}
+    assert _get_keys(diff.changed) == ["status"]
+    assert not diff.added and not diff.removed and not diff.moved
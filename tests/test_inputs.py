@@ -0,0 +1,120 @@
+"""
+Test extracting input values from view submissions.
+"""
+from datetime import date
+
+import pytest
+
+from slack_blockkit.composition_object import PlainTextObject
+from slack_blockkit.layout_block import DividerBlock, InputBlock
+from slack_blockkit.utils.inputs import InputExtractor, InputValidationError
+from slack_blockkit.view_payload import ModalViewPayload
+
+
+@pytest.fixture
+def survey_view(
+    plaintext_input_element, datepicker_element, radiobutton_group_element
+) -> ModalViewPayload:
+    plaintext_input_element.min_length = 2
+    plaintext_input_element.max_length = 10
+    return ModalViewPayload(
+        title=PlainTextObject(text="Survey"),
+        blocks=[
+            InputBlock(
+                label=PlainTextObject(text="Name"),
+                element=plaintext_input_element,
+                block_id="name",
+            ),
+            DividerBlock(),
+            InputBlock(
+                label=PlainTextObject(text="Date"),
+                element=datepicker_element,
+                block_id="date",
+                optional=True,
+            ),
+            InputBlock(
+                label=PlainTextObject(text="Choice"),
+                element=radiobutton_group_element,
+                block_id="choice",
+            ),
+        ],
+    )
+
+
+def _get_payload(name: str = None, selected_date: str = None) -> dict:
+    return {
+        "type": "view_submission",
+        "view": {
+            "id": "V0123",
+            "state": {
+                "values": {
+                    "name": {"input-logo": {"type": "plain_text_input", "value": name}},
+                    "date": {
+                        "datepicker-vhs-event": {
+                            "type": "datepicker",
+                            "selected_date": selected_date,
+                        }
+                    },
+                    "choice": {
+                        "radiobutton-id": {
+                            "type": "radio_buttons",
+                            "selected_option": {
+                                "text": {"type": "plain_text", "text": "Option"},
+                                "value": "value-1",
+                            },
+                        }
+                    },
+                }
+            },
+        },
+    }
+
+
+def test_extract(survey_view):
+    extractor = InputExtractor(survey_view)
+    assert extractor.get_names() == [
+        "input-logo",
+        "datepicker-vhs-event",
+        "radiobutton-id",
+    ]
+
+    payload = _get_payload(name="Ada", selected_date="2020-09-01")
+    assert extractor.extract(payload) == {
+        "input-logo": "Ada",
+        "datepicker-vhs-event": date(2020, 9, 1),
+        "radiobutton-id": "value-1",
+    }
+    # the view or its state values give the same result
+    assert extractor.extract(payload["view"]) == extractor.extract(payload)
+    values = payload["view"]["state"]["values"]
+    assert extractor.extract(values)["datepicker-vhs-event"] == date(2020, 9, 1)
+
+    # optional inputs may be empty
+    assert extractor.extract(_get_payload(name="Ada"))["datepicker-vhs-event"] is None
+
+
+@pytest.mark.parametrize(
+    "name,error",
+    [
+        (None, "This field is required"),
+        ("A", "Must be at least 2 characters"),
+        ("Ada Lovelace", "Must be at most 10 characters"),
+    ],
+)
+def test_extract_errors(survey_view, name, error):
+    with pytest.raises(InputValidationError) as e:
+        InputExtractor(survey_view.blocks).extract(_get_payload(name=name))
+    assert e.value.block_errors == {"name": error}
+    assert e.value.get_response() == {
+        "response_action": "errors",
+        "errors": {"name": error},
+    }
+
+
+def test_extractor_duplicate_action_id(plaintext_input_element):
+    blocks = [
+        InputBlock(label=PlainTextObject(text="Name"), element=plaintext_input_element)
+        for _ in range(2)
+    ]
+    with pytest.raises(AttributeError):
+        InputExtractor(blocks)
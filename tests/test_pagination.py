@@ -0,0 +1,188 @@
+"""
+Test measuring the size of payloads and splitting them into pages.
+"""
+import json
+import random
+
+import pytest
+
+from slack_blockkit.block import PayloadSize, dump_json, get_json_size
+from slack_blockkit.composition_object import MarkdownTextObject, PlainTextObject
+from slack_blockkit.layout_block import ContextBlock, DividerBlock, SectionBlock
+from slack_blockkit.utils import get_blocks, get_blocks_json
+from slack_blockkit.utils.pagination import paginate_blocks, paginate_view
+from slack_blockkit.validation import VALIDATION_OFF, validation_mode
+from slack_blockkit.view_payload import ModalViewPayload
+
+
+def _get_results(count: int) -> list:
+    # each result is a section and the context below it, separated by dividers
+    blocks = []
+    for index in range(count):
+        blocks.append(SectionBlock(text=PlainTextObject(text=f"Result {index}")))
+        blocks.append(ContextBlock(elements=[PlainTextObject(text=f"#{index}")]))
+        blocks.append(DividerBlock())
+    return blocks
+
+
+def test_payload_size():
+    blocks = _get_results(3)
+    size = PayloadSize()
+    blocks_json = get_blocks_json(*blocks, size=size)
+    assert size.bytes == len(blocks_json)
+    assert size.blocks == len(blocks)
+    assert size.block_bytes == [
+        len(json.dumps(block)) for block in json.loads(blocks_json)
+    ]
+    assert size.bytes == sum(size.block_bytes) + 2 * (len(blocks) - 1) + 2
+
+    empty = PayloadSize()
+    assert get_blocks_json(size=empty) == "[]"
+    assert (empty.bytes, empty.blocks) == (2, 0)
+
+    # rendering into dicts measures the same sizes, without encoding the dicts
+    rendered = PayloadSize()
+    assert get_blocks(*blocks, size=rendered) == json.loads(blocks_json)
+    assert (rendered.bytes, rendered.block_bytes) == (size.bytes, size.block_bytes)
+
+
+def test_json_size():
+    text = MarkdownTextObject(text='"Caf\u00e9" \\ \U0001f600\n', verbatim=True)
+    section = SectionBlock(text=text, block_id="id", fields=[text])
+    memoized = SectionBlock(text=text, block_id="id").memoize()
+    view = ModalViewPayload(title=PlainTextObject(text="Results"), blocks=[section])
+    values = [
+        section,
+        section.render(),
+        memoized,
+        view,
+        {"n": 1.5, "m": [1, None], "o": None},
+    ]
+    for value in values:
+        assert get_json_size(value) == len(dump_json(value))
+
+
+def test_view_payload_size():
+    view = ModalViewPayload(
+        title=PlainTextObject(text="Results"), blocks=_get_results(2)
+    )
+    size = PayloadSize()
+    view_json = view.render_json(size=size)
+    assert view_json == view.render_json()
+    assert size.bytes == len(view_json)
+    assert size.blocks == 6
+
+    # memoized blocks are measured by their memoized JSON
+    view.memoize()
+    memoized = PayloadSize()
+    assert view.render_json(size=memoized) == view_json
+    assert (memoized.bytes, memoized.block_bytes) == (size.bytes, size.block_bytes)
+
+    rendered = PayloadSize()
+    assert view.render(size=rendered) == json.loads(view_json)
+    assert (rendered.bytes, rendered.block_bytes) == (size.bytes, size.block_bytes)
+
+
+def test_paginate_blocks():
+    blocks = _get_results(40)
+    pages = paginate_blocks(blocks)
+    # only the dividers between pages, and the one at the end, are dropped
+    paged = [block for page in pages for block in page]
+    assert len(blocks) - len(paged) == len(pages)
+    for page in pages:
+        assert len(page) <= 50
+        # results are kept together, with no dividers at the edges of a page
+        assert isinstance(page[0], SectionBlock)
+        assert isinstance(page[-1], ContextBlock)
+    # no result is lost
+    assert len([block for block in paged if isinstance(block, SectionBlock)]) == 40
+
+
+def test_paginate_blocks_by_size():
+    blocks = get_blocks(*_get_results(10))
+    max_bytes = len(json.dumps(blocks)) // 3
+    pages = paginate_blocks(blocks, max_blocks=100, max_bytes=max_bytes)
+    assert len(pages) >= 3
+    for page in pages:
+        assert len(json.dumps(page)) <= max_bytes
+        assert page[0]["type"] == "section"
+
+    # a block too large for a page gets a page of its own
+    assert paginate_blocks(blocks[:2], max_bytes=10) == [[blocks[0]], [blocks[1]]]
+
+
+def test_paginate_blocks_with_size():
+    blocks = _get_results(10)
+    size = PayloadSize()
+    rendered = get_blocks(*blocks, size=size)
+    max_bytes = size.bytes // 3
+    pages = paginate_blocks(blocks, max_blocks=100, max_bytes=max_bytes, size=size)
+    assert pages == paginate_blocks(blocks, max_blocks=100, max_bytes=max_bytes)
+    assert len(pages) >= 3
+
+    # the recorded sizes are used as they are, so the pages follow them
+    size.block_bytes = [max_bytes] * len(rendered)
+    pages = paginate_blocks(blocks, max_blocks=100, max_bytes=max_bytes, size=size)
+    assert all(len(page) == 1 for page in pages)
+
+    with pytest.raises(AttributeError):
+        paginate_blocks(blocks[:3], max_bytes=max_bytes, size=size)
+
+
+def test_paginate_blocks_by_size_random():
+    rng = random.Random(25)
+    for _ in range(200):
+        blocks = []
+        for index in range(rng.randint(1, 60)):
+            kind = rng.choice((SectionBlock, ContextBlock, DividerBlock))
+            # mostly small blocks, with a large one now and then
+            length = (
+                rng.randint(300, 900) if rng.random() < 0.15 else rng.randint(1, 30)
+            )
+            text = PlainTextObject(text="x" * length)
+            if kind is SectionBlock:
+                blocks.append(SectionBlock(text=text, block_id=str(index)))
+            elif kind is ContextBlock:
+                blocks.append(ContextBlock(elements=[text], block_id=str(index)))
+            else:
+                blocks.append(DividerBlock(block_id=str(index)))
+        rendered = get_blocks(*blocks)
+        max_bytes = rng.randint(200, 2000)
+        max_blocks = rng.randint(1, 20)
+
+        pages = paginate_blocks(rendered, max_blocks=max_blocks, max_bytes=max_bytes)
+        for page in pages:
+            assert len(page) <= max_blocks
+            # only a block too large for any page is on a page larger than max_bytes
+            assert len(json.dumps(page)) <= max_bytes or len(page) == 1
+        # only dividers are dropped, and the other blocks keep their order
+        paged = [block for page in pages for block in page]
+        assert [block for block in rendered if block["type"] != "divider"] == [
+            block for block in paged if block["type"] != "divider"
+        ]
+
+
+def test_paginate_view():
+    # a view with more than 100 blocks is not valid, so it is built without validation
+    with validation_mode(VALIDATION_OFF):
+        view = ModalViewPayload(
+            title=PlainTextObject(text="Results"), blocks=_get_results(50)
+        )
+    pages = paginate_view(view)
+    assert len(pages) == 2
+    for page in pages:
+        assert len(page.blocks) <= 100
+        assert page.render()["title"] == view.title.render()
+    assert view.blocks[0] is pages[0].blocks[0]
+    assert len(view.blocks) == 150
+
+    max_bytes = len(get_blocks_json(*view.blocks)) // 4
+    pages = paginate_view(view, max_bytes=max_bytes)
+    assert len(pages) > 4
+    for page in pages:
+        assert len(page.render_json()) <= max_bytes
+
+    small = ModalViewPayload(
+        title=PlainTextObject(text="Results"), blocks=_get_results(2)
+    )
+    assert paginate_view(small) == [small]
@@ -0,0 +1,44 @@
+"""
+Test parallel rendering.
+"""
+import json
+
+from concurrent.futures import ThreadPoolExecutor
+
+from slack_blockkit.composition_object import PlainTextObject
+from slack_blockkit.layout_block import DividerBlock, SectionBlock
+from slack_blockkit.utils.parallel import render_parallel
+from slack_blockkit.utils.serialization import to_json
+from slack_blockkit.view_payload import HomeViewPayload
+
+
+def build_home_view(index: int) -> HomeViewPayload:
+    return HomeViewPayload(
+        title=PlainTextObject(text="Home"),
+        blocks=[
+            SectionBlock(text=PlainTextObject(text=f"User {index}"), block_id="user"),
+            DividerBlock(block_id="divider"),
+        ],
+    )
+
+
+def test_render_parallel_in_process():
+    rendered = render_parallel(build_home_view, range(10))
+    assert rendered == [to_json(build_home_view(index)) for index in range(10)]
+
+
+def test_render_parallel():
+    rendered = render_parallel(
+        build_home_view, range(50), max_workers=2, chunk_size=7, min_batch_size=0
+    )
+    assert [json.loads(view)["blocks"][0]["text"]["text"] for view in rendered] == [
+        f"User {index}" for index in range(50)
+    ]
+
+
+def test_render_parallel_executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        rendered = render_parallel(
+            build_home_view, range(20), min_batch_size=0, executor=executor
+        )
+    assert rendered == [to_json(build_home_view(index)) for index in range(20)]
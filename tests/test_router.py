@@ -0,0 +1,118 @@
+"""
+Test routing interaction payloads to their elements and callbacks.
+"""
+import threading
+
+from slack_blockkit.block_element import ButtonElement
+from slack_blockkit.composition_object import PlainTextObject
+from slack_blockkit.layout_block import ActionsBlock, SectionBlock
+from slack_blockkit.loader import from_dict
+from slack_blockkit.utils.router import Router
+from slack_blockkit.view_payload import HomeViewPayload
+
+
+def _get_view(count: int) -> HomeViewPayload:
+    blocks = [
+        ActionsBlock(
+            elements=[
+                ButtonElement(
+                    text=PlainTextObject(text="Close"),
+                    action_id="close",
+                    value=str(index),
+                )
+            ],
+            block_id=f"ticket-{index}",
+        )
+        for index in range(count)
+    ]
+    return HomeViewPayload(title=None, blocks=blocks)
+
+
+def _get_payload(*actions) -> dict:
+    return {
+        "type": "block_actions",
+        "actions": [
+            {"action_id": action_id, "block_id": block_id, "type": "button"}
+            for action_id, block_id in actions
+        ],
+    }
+
+
+def test_router_dispatch(
+    overflow_element, radiobutton_group_element, datepicker_element
+):
+    router = Router()
+    view = _get_view(3)
+    section = SectionBlock(
+        text=PlainTextObject(text="Options"),
+        accessory=overflow_element,
+        block_id="options",
+    )
+    router.add_blocks(
+        view, section, [ActionsBlock(elements=[radiobutton_group_element])]
+    )
+    router.add_blocks(ActionsBlock(elements=[datepicker_element]).render())
+
+    @router.on("close")
+    def close(route):
+        return route.element.value, route.block.block_id
+
+    router.add_callback(overflow_element.action_id, lambda route: route.element)
+
+    payload = _get_payload(
+        ("close", "ticket-2"),
+        (overflow_element.action_id, "options"),
+        ("unknown", "options"),
+    )
+    assert router.dispatch(payload) == [("2", "ticket-2"), overflow_element]
+
+    # elements are found by action_id alone when their block is not known
+    assert router.get_element("close", "ticket-9") is view.blocks[-1].elements[0]
+    assert router.get_element("radiobutton-id") is radiobutton_group_element
+    assert router.get_element("datepicker-vhs-event")["type"] == "datepicker"
+    assert router.get_block("options") is section
+
+    route = router.resolve({"action_id": "radiobutton-id", "block_id": "x"})
+    assert route.element is radiobutton_group_element
+    assert route.block is None and route.callback is None
+
+    # payloads with a single action, such as block_suggestion, are dispatched as well
+    suggestion = {
+        "type": "block_suggestion",
+        "action_id": "close",
+        "block_id": "ticket-0",
+    }
+    assert router.dispatch(suggestion) == [("0", "ticket-0")]
+
+
+def test_router_lazy_view():
+    router = Router()
+    view = from_dict(_get_view(2).render(), lazy=True)
+    router.add_blocks(view)
+    assert router.get_element("close", "ticket-1")["value"] == "1"
+    # indexing the view does not load its blocks
+    assert all(block.__class__ is dict for block in view.blocks.items)
+
+    router.clear_blocks()
+    assert router.get_element("close") is None
+
+
+def test_router_concurrent_dispatch():
+    router = Router()
+    router.add_callback("close", lambda route: route.element is not None)
+    router.add_blocks(_get_view(1))
+    payload = _get_payload(("close", "ticket-0"))
+    results = []
+
+    def dispatch():
+        for _ in range(200):
+            results.extend(router.dispatch(payload))
+
+    threads = [threading.Thread(target=dispatch) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for index in range(50):
+        router.add_blocks(_get_view(index))
+    for thread in threads:
+        thread.join()
+    assert len(results) == 800 and all(results)
@@ -0,0 +1,82 @@
+"""
+Test scheduling and coalescing calls to a fake Slack Web API.
+"""
+import asyncio
+
+import pytest
+
+from slack_blockkit.composition_object import PlainTextObject
+from slack_blockkit.layout_block import SectionBlock
+from slack_blockkit.utils.scheduler import SendScheduler
+from slack_blockkit.utils.sender import (
+    CHAT_UPDATE,
+    VIEWS_PUBLISH,
+    AsyncSender,
+    SlackApiError,
+)
+from slack_blockkit.utils.testing import FakeSlackServer
+from slack_blockkit.view_payload import HomeViewPayload
+
+
+def _get_view(text: str) -> HomeViewPayload:
+    return HomeViewPayload(
+        title=None, blocks=[SectionBlock(text=PlainTextObject(text=text))]
+    )
+
+
+def _run(test):
+    async def run():
+        async with FakeSlackServer() as server:
+            # 20 calls a second, one at a time
+            rate_limits = {VIEWS_PUBLISH: (1200, 1), CHAT_UPDATE: (1200, 1)}
+            async with AsyncSender(
+                token="xoxb-test", url=server.url, rate_limits=rate_limits
+            ) as sender:
+                await test(server, sender)
+
+    asyncio.run(run())
+
+
+def test_scheduler_coalesces():
+    async def test(server: FakeSlackServer, sender: AsyncSender):
+        async with SendScheduler(sender, workers=2) as scheduler:
+            futures = [
+                scheduler.publish_view("U1", _get_view(f"Version {index}"))
+                for index in range(5)
+            ]
+            futures.append(scheduler.publish_view("U2", _get_view("Other user")))
+            assert scheduler.get_queue_depth() == 2
+            await scheduler.flush()
+            assert scheduler.get_queue_depth() == 0
+
+        published = [
+            (payload["user_id"], payload["view"]["blocks"][0]["text"]["text"])
+            for payload in server.get_payloads(VIEWS_PUBLISH)
+        ]
+        # every version of U1 was replaced by the last one before it was sent
+        assert published == [("U1", "Version 4"), ("U2", "Other user")]
+        assert all(future.result()["ok"] for future in futures)
+
+        stats = scheduler.stats
+        assert (stats.scheduled, stats.sent, stats.coalesced) == (6, 2, 4)
+
+    _run(test)
+
+
+def test_scheduler_updates_in_order():
+    async def test(server: FakeSlackServer, sender: AsyncSender):
+        server.add_response(CHAT_UPDATE, {"ok": False, "error": "message_not_found"})
+        async with SendScheduler(sender) as scheduler:
+            failed = scheduler.update_message("C1", "1.0", blocks=[], text="First")
+            await asyncio.sleep(0)
+            # scheduled while the first update is being sent, so it is sent after it
+            second = scheduler.update_message("C1", "1.0", blocks=[], text="Second")
+            with pytest.raises(SlackApiError):
+                await failed
+            assert (await second)["ok"]
+
+        texts = [payload["text"] for payload in server.get_payloads(CHAT_UPDATE)]
+        assert texts == ["First", "Second"]
+        assert (scheduler.stats.sent, scheduler.stats.failed) == (1, 1)
+
+    _run(test)
@@ -0,0 +1,150 @@
+"""
+Test the constraint tables and the validators compiled from them.
+"""
+import pytest
+
+from slack_blockkit.block import Block
+from slack_blockkit.block_element import (
+    ButtonElement,
+    ImageElement,
+    PlainTextInputElement,
+)
+from slack_blockkit.composition_object import (
+    MarkdownTextObject,
+    OptionObject,
+    PlainTextObject,
+)
+from slack_blockkit.layout_block import ActionsBlock, ContextBlock, SectionBlock
+from slack_blockkit.schema import get_constraints, get_max_length
+from slack_blockkit.utils import validate_blocks
+from slack_blockkit.utils.blocks import get_information_block, get_task_block
+from slack_blockkit.validation import (
+    VALIDATION_OFF,
+    ValidationError,
+    validation_mode,
+)
+from slack_blockkit.view_payload import ModalViewPayload, ViewPayload
+
+
+def _get_subclasses(cls) -> list:
+    subclasses = []
+    for subclass in cls.__subclasses__():
+        subclasses.append(subclass)
+        subclasses.extend(_get_subclasses(subclass))
+    return subclasses
+
+
+def _get_invalid_section_block() -> SectionBlock:
+    with validation_mode(VALIDATION_OFF):
+        return SectionBlock(
+            text=MarkdownTextObject(text="x" * 3001),
+            fields=[PlainTextObject(text="Field")] * 11,
+            accessory=ButtonElement(
+                text=MarkdownTextObject(text="Go"), action_id="go", style="green"
+            ),
+        )
+
+
+def test_constraints_cover_every_field():
+    for cls in _get_subclasses(Block):
+        # skip memoized variants, and blocks defined by other tests
+        if getattr(cls, "BLOCK_CLASS", cls) is not cls:
+            continue
+        if not cls.__module__.startswith("slack_blockkit."):
+            continue
+        missing = set(cls.RENDER_FIELDS) - set(get_constraints(cls)) - {"btype"}
+        assert not missing, f"{cls.__name__} has no constraints for {missing}"
+
+
+def test_eager_validation_reports_every_error():
+    with pytest.raises(ValidationError) as error:
+        ButtonElement(
+            text=MarkdownTextObject(text="x" * 76), action_id="go", style="green"
+        )
+    assert error.value.errors == [
+        "ButtonElement.text: must be plain_text, but is mrkdwn",
+        "ButtonElement.style: must be one of the following values: danger,default,primary, but is 'green'",
+    ]
+
+    with pytest.raises(ValidationError) as error:
+        PlainTextInputElement(action_id="input", min_length=10, max_length=5)
+    assert error.value.errors == [
+        "PlainTextInputElement.min_length: cannot be greater than max_length (5), but is 10"
+    ]
+
+
+def test_validate_blocks():
+    section = _get_invalid_section_block()
+    expected_errors = [
+        "blocks[0].text: text cannot be greater than 3000 characters, but is 3001",
+        "blocks[0].fields: cannot have more than 10 items, but has 11",
+        "blocks[0].accessory.text: must be plain_text, but is mrkdwn",
+        "blocks[0].accessory.style: must be one of the following values: danger,default,primary, "
+        "but is 'green'",
+    ]
+
+    # blocks and their rendered dicts are validated the same way
+    for block in (section, section.render()):
+        with pytest.raises(ValidationError) as error:
+            validate_blocks(
+                block, get_information_block(link="https://x.org", text="x")
+            )
+        assert error.value.errors == expected_errors
+
+    validate_blocks(
+        *get_task_block(text="Task", info_link="https://x.org", info_text="Info"),
+        ContextBlock(elements=[ImageElement(image_url="https://x.org", alt_text="x")]),
+        {"type": "header", "text": {"type": "plain_text", "text": "Unknown types"}},
+    )
+
+
+def test_validate_dicts():
+    button = {"type": "button", "text": {"type": "plain_text", "text": "Go"}}
+    actions = {"type": "actions", "elements": [button] * 6, "block_id": 1}
+    option = {"text": {"type": "plain_text", "text": "x" * 76}, "value": "x"}
+    overflow = {"type": "overflow", "options": [option]}
+    with pytest.raises(ValidationError) as error:
+        validate_blocks(
+            actions,
+            {"type": "section", "text": {"type": "mrkdwn"}, "accessory": overflow},
+        )
+    assert error.value.errors == [
+        "blocks[0].block_id: must be a string, but is int",
+        "blocks[0].elements: cannot have more than 5 items, but has 6",
+        "blocks[1].text.text: is required",
+        "blocks[1].accessory.options: cannot have fewer than 2 items, but has 1",
+        "blocks[1].accessory.options[0].text: text cannot be greater than 75 characters, but is 76",
+    ]
+
+
+def test_validate_view():
+    with validation_mode(VALIDATION_OFF):
+        view = ModalViewPayload(
+            title=PlainTextObject(text="Title"),
+            blocks=[_get_invalid_section_block().render()],
+            callback_id="x" * 256,
+        )
+    with pytest.raises(ValidationError) as error:
+        validate_blocks(view.render())
+    assert error.value.errors[0].startswith("blocks[0].blocks[0].text: ")
+    assert error.value.errors[4:] == [
+        "blocks[0].callback_id: cannot be greater than 255 characters, but is 256"
+    ]
+
+
+def test_with_changes_validates():
+    actions = ActionsBlock(
+        elements=[ButtonElement(text=PlainTextObject(text="Go"), action_id="go")]
+    ).freeze()
+    with pytest.raises(ValidationError):
+        actions.with_changes(elements=actions.elements * 6)
+    assert len(actions.with_changes(elements=actions.elements * 5).elements) == 5
+
+
+def test_get_max_length():
+    assert get_max_length(SectionBlock, "text") == 3000
+    assert get_max_length(SectionBlock, "fields") == 2000
+    assert get_max_length(SectionBlock, "block_id") == 255
+    assert get_max_length(OptionObject, "value") == OptionObject.VALUE_MAX_LENGTH
+    assert get_max_length(ViewPayload, "title") == 24
+    assert get_max_length(ActionsBlock, "elements") is None
@@ -0,0 +1,207 @@
+"""
+Test sending blocks and views to a fake Slack Web API.
+"""
+import asyncio
+
+import pytest
+
+from slack_blockkit.composition_object import PlainTextObject
+from slack_blockkit.layout_block import DividerBlock, SectionBlock
+from slack_blockkit.utils import get_blocks
+from slack_blockkit.utils.sender import (
+    CHAT_POST_MESSAGE,
+    VIEWS_PUBLISH,
+    AsyncSender,
+    ConnectionPool,
+    SlackApiError,
+    TokenBucket,
+)
+from slack_blockkit.utils.testing import FakeSlackServer
+from slack_blockkit.view_payload import HomeViewPayload
+
+
+def _run(test, **server_options):
+    async def run():
+        async with FakeSlackServer(**server_options) as server:
+            await test(server)
+
+    asyncio.run(run())
+
+
+def test_post_message():
+    blocks = [
+        SectionBlock(text=PlainTextObject(text="Hello"), block_id="hello"),
+        DividerBlock(block_id="divider"),
+    ]
+
+    async def test(server: FakeSlackServer):
+        server.add_response(CHAT_POST_MESSAGE, {"ok": True, "ts": "1.0001"})
+        async with AsyncSender(token="xoxb-test", url=server.url) as sender:
+            response = await sender.post_message("C0123", blocks=blocks, text="Hi")
+            await sender.update_message("C0123", "1.0001", blocks=blocks[:1])
+        assert response["ts"] == "1.0001"
+
+        request = server.requests[0]
+        assert request.headers["authorization"] == "Bearer xoxb-test"
+        assert request.payload == {
+            "channel": "C0123",
+            "blocks": get_blocks(*blocks),
+            "text": "Hi",
+        }
+        assert server.get_payloads("chat.update")[0]["ts"] == "1.0001"
+        # both requests went over the same keep-alive connection
+        assert server.connections == 1
+
+    _run(test)
+
+
+def test_send_many():
+    views = [
+        HomeViewPayload(
+            title=None,
+            blocks=[SectionBlock(text=PlainTextObject(text=f"User {index}"))],
+        )
+        for index in range(12)
+    ]
+
+    async def test(server: FakeSlackServer):
+        sender = AsyncSender(token="xoxb-test", url=server.url, max_connections=3)
+        responses = await sender.send_many(
+            (VIEWS_PUBLISH, {"user_id": f"U{index}", "view": view})
+            for index, view in enumerate(views)
+        )
+        await sender.close()
+        assert len(responses) == 12 and all(response["ok"] for response in responses)
+        # no more connections than the pool allows
+        assert server.connections == 3
+        payloads = server.get_payloads(VIEWS_PUBLISH)
+        assert sorted(payload["user_id"] for payload in payloads) == sorted(
+            f"U{index}" for index in range(12)
+        )
+        assert payloads[0]["view"]["type"] == "home"
+
+    _run(test, delay=0.01)
+
+
+def test_rate_limit_and_errors():
+    async def test(server: FakeSlackServer):
+        server.add_rate_limit(CHAT_POST_MESSAGE, retry_after=0.05)
+        server.add_response(CHAT_POST_MESSAGE, {"ok": False, "error": "not_in_channel"})
+        async with AsyncSender(token="xoxb-test", url=server.url, retries=1) as sender:
+            start = asyncio.get_running_loop().time()
+            with pytest.raises(SlackApiError) as e:
+                await sender.post_message("C0123", blocks=[])
+            # the call waited for the Retry-After before it was retried
+            assert asyncio.get_running_loop().time() - start >= 0.05
+            assert e.value.response["error"] == "not_in_channel"
+            assert len(server.requests) == 2
+
+            for _ in range(2):
+                server.add_rate_limit(CHAT_POST_MESSAGE)
+            with pytest.raises(SlackApiError, match="ratelimited"):
+                await sender.post_message("C0123", blocks=[])
+
+    _run(test)
+
+
+def test_timeout():
+    async def test(server: FakeSlackServer):
+        sender = AsyncSender(
+            token="xoxb-test", url=server.url, max_connections=1, timeout=0.15
+        )
+        # each response takes 0.1s, so the last call waits longer than the timeout for the connection
+        responses = await sender.send_many(
+            (CHAT_POST_MESSAGE, {"channel": "C0123", "text": str(index)})
+            for index in range(3)
+        )
+        assert all(response["ok"] for response in responses)
+
+        sender.timeout = 0.05
+        with pytest.raises(asyncio.TimeoutError):
+            await sender.post_message("C0123", blocks=[])
+        await sender.close()
+
+    _run(test, delay=0.1)
+
+
+OK = b'HTTP/1.1 200 OK\r\nContent-Length: 12\r\n\r\n{"ok": true}'
+
+
+def _run_pool(test, answers):
+    # serves each request with the next of the answers, a response and whether to close the connection after it
+    connections = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connections.append(writer)
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except asyncio.IncompleteReadError:
+                return
+            length = int(head.lower().split(b"content-length:")[1].split(b"\r\n")[0])
+            await reader.readexactly(length)
+            response, close = answers.pop(0)
+            writer.write(response)
+            await writer.drain()
+            if close:
+                writer.close()
+                return
+
+    async def run():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        pool = ConnectionPool(f"http://127.0.0.1:{port}/api/")
+        try:
+            await test(pool)
+        finally:
+            await pool.close()
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(run())
+    return len(connections)
+
+
+def test_pool_retries_closed_idle_connection():
+    async def test(pool: ConnectionPool):
+        for _ in range(2):
+            response = await pool.post("chat.postMessage", b"{}", {})
+            assert response.body == b'{"ok": true}'
+
+    # the second request is closed without an answer on the idle connection, and sent again on a new one
+    assert _run_pool(test, [(OK, False), (b"", True), (OK, False)]) == 2
+
+
+def test_pool_does_not_retry_answered_request():
+    async def test(pool: ConnectionPool):
+        await pool.post("chat.postMessage", b"{}", {})
+        with pytest.raises(asyncio.IncompleteReadError):
+            await pool.post("chat.postMessage", b"{}", {})
+
+    partial = b'HTTP/1.1 200 OK\r\nContent-Length: 12\r\n\r\n{"ok"'
+    assert _run_pool(test, [(OK, False), (partial, True)]) == 1
+
+
+def test_pool_reads_body_until_close():
+    async def test(pool: ConnectionPool):
+        response = await pool.post("chat.postMessage", b"{}", {})
+        assert response.body == b'{"ok": true}'
+        assert not pool.idle
+        response = await pool.post("chat.postMessage", b"{}", {})
+        assert response.status == 200
+
+    unframed = b'HTTP/1.1 200 OK\r\n\r\n{"ok": true}'
+    assert _run_pool(test, [(unframed, True), (OK, False)]) == 2
+
+
+def test_token_bucket():
+    now = [0.0]
+    bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0])
+    assert bucket.take() == 0 and bucket.take() == 0
+    # the third call waits for a token to be refilled, and the fourth behind it
+    assert bucket.take() == 0.5
+    assert bucket.take() == 1.0
+    now[0] = 10.0
+    assert bucket.take() == 0
+    bucket.pause(3)
+    assert bucket.take() == 3
@@ -0,0 +1,60 @@
+"""
+Test the JSON serialization backends.
+"""
+import json
+
+import pytest
+
+from slack_blockkit.composition_object import PlainTextObject
+from slack_blockkit.utils import (
+    get_available_json_backends,
+    get_blocks,
+    get_json_backend,
+    set_json_backend,
+    to_json,
+)
+from slack_blockkit.view_payload import ModalViewPayload
+
+
+@pytest.fixture
+def json_backend(request):
+    previous = get_json_backend().name
+    set_json_backend(request.param)
+    yield request.param
+    set_json_backend(previous)
+
+
+def _get_compact_json(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+@pytest.mark.parametrize("json_backend", get_available_json_backends(), indirect=True)
+def test_to_json(json_backend, section_block, actions_block, divider_block):
+    assert get_json_backend().name == json_backend
+    section_block.text = PlainTextObject(text="Café / 日本")
+
+    assert section_block.to_json() == _get_compact_json(section_block.render())
+    assert section_block.to_json(as_bytes=True) == section_block.to_json().encode()
+
+    blocks = [section_block, actions_block, divider_block.render()]
+    assert to_json(blocks) == _get_compact_json(get_blocks(*blocks))
+
+    # blocks and views within other values are rendered as well
+    view = ModalViewPayload(title=PlainTextObject(text="Modal"), blocks=blocks)
+    assert view.to_json() == _get_compact_json(view.render())
+    message = {"channel": "C1", "blocks": [section_block], "view": view}
+    assert json.loads(to_json(message, as_bytes=True)) == {
+        "channel": "C1",
+        "blocks": [section_block.render()],
+        "view": view.render(),
+    }
+
+
+def test_json_backends():
+    assert get_available_json_backends()[-1] == "json"
+    assert get_json_backend().name == get_available_json_backends()[0]
+
+    with pytest.raises(AttributeError):
+        set_json_backend("simplejson")
+    with pytest.raises(TypeError):
+        to_json({"value": object()})
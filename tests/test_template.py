@@ -0,0 +1,110 @@
+"""
+Test block templates.
+"""
+import pytest
+
+from slack_blockkit.block_element import ButtonElement
+from slack_blockkit.composition_object import (
+    MarkdownTextObject,
+    OptionObject,
+    PlainTextObject,
+)
+from slack_blockkit.layout_block import ActionsBlock, DividerBlock, SectionBlock
+from slack_blockkit.utils import get_blocks, render_many
+from slack_blockkit.utils.template import BlockTemplate
+
+
+@pytest.fixture
+def template() -> BlockTemplate:
+    return BlockTemplate(
+        SectionBlock(
+            text=MarkdownTextObject(text="Hi $user, ticket *${ticket}* costs $$5"),
+            block_id="intro",
+        ),
+        DividerBlock(block_id="divider"),
+        ActionsBlock(
+            elements=[
+                ButtonElement(
+                    text=PlainTextObject(text="Open"),
+                    action_id="open-ticket",
+                    url="https://codedevils.org/tickets/$ticket",
+                )
+            ],
+            block_id="actions",
+        ),
+    )
+
+
+def test_fill(template: BlockTemplate):
+    assert template.get_placeholders() == ["ticket", "user"]
+    blocks = template.fill(user="Sandy", ticket="BK-12")
+    assert blocks == get_blocks(
+        SectionBlock(
+            text=MarkdownTextObject(text="Hi Sandy, ticket *BK-12* costs $5"),
+            block_id="intro",
+        ),
+        DividerBlock(block_id="divider"),
+        ActionsBlock(
+            elements=[
+                ButtonElement(
+                    text=PlainTextObject(text="Open"),
+                    action_id="open-ticket",
+                    url="https://codedevils.org/tickets/BK-12",
+                )
+            ],
+            block_id="actions",
+        ),
+    )
+
+    # blocks without placeholders are shared, and the template is left as it was
+    assert blocks[1] is template.blocks[1]
+    assert blocks[2]["elements"][0]["text"] is template.blocks[2]["elements"][0]["text"]
+    assert (
+        template.blocks[0]["text"]["text"] == "Hi $user, ticket *${ticket}* costs $$5"
+    )
+
+
+def test_render_copies(template: BlockTemplate):
+    blocks = template.render({"user": "Sandy", "ticket": "BK-12"})
+    assert blocks == template.fill(user="Sandy", ticket="BK-12")
+    assert blocks[1] is not template.blocks[1]
+
+
+def test_fill_validates_substituted_fields():
+    template = BlockTemplate(
+        OptionObject(text=PlainTextObject(text="$label"), value="option-$value")
+    )
+    assert template.fill(label="Option", value="1")[0]["value"] == "option-1"
+    with pytest.raises(AttributeError):
+        template.fill(label="Option", value="1" * OptionObject.VALUE_MAX_LENGTH)
+    with pytest.raises(AttributeError):
+        template.fill(label="Option" * 20, value="1")
+    with pytest.raises(AttributeError):
+        template.fill(label="Option")
+
+
+def test_invalid_placeholder():
+    with pytest.raises(AttributeError, match="invalid placeholder at position 16"):
+        BlockTemplate(SectionBlock(text=PlainTextObject(text="Hi $user costs $5")))
+    # strings without placeholders keep their $ as it is
+    blocks = BlockTemplate(SectionBlock(text=PlainTextObject(text="Costs $5"))).fill()
+    assert blocks[0]["text"]["text"] == "Costs $5"
+
+
+def test_render_many(template: BlockTemplate):
+    rows = ({"user": f"User {index}", "ticket": f"BK-{index}"} for index in range(3))
+    messages = render_many(template, rows)
+    assert not isinstance(messages, list)
+
+    messages = list(messages)
+    assert messages == [
+        template.fill(user=f"User {index}", ticket=f"BK-{index}") for index in range(3)
+    ]
+    # constant blocks are shared across the batch
+    assert messages[0][1] is messages[2][1]
+
+
+def test_render_many_blocks():
+    blocks = [DividerBlock(block_id="divider"), {"type": "divider", "block_id": "$id"}]
+    messages = list(render_many(blocks, [{"id": "first"}, {"id": "second"}]))
+    assert [message[1]["block_id"] for message in messages] == ["first", "second"]
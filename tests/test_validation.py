@@ -0,0 +1,116 @@
+"""
+Test the validation modes.
+"""
+import threading
+
+import pytest
+
+from slack_blockkit.block_element import ButtonElement
+from slack_blockkit.composition_object import MarkdownTextObject, PlainTextObject
+from slack_blockkit.layout_block import ActionsBlock, SectionBlock
+from slack_blockkit.utils import get_blocks, get_blocks_json
+from slack_blockkit.validation import (
+    VALIDATION_DEFERRED,
+    VALIDATION_EAGER,
+    VALIDATION_OFF,
+    ValidationError,
+    get_validation_mode,
+    set_validation_mode,
+    validation_mode,
+)
+from slack_blockkit.view_payload import ModalViewPayload
+
+
+def _get_invalid_actions_block() -> ActionsBlock:
+    # a markdown button text, and more than 5 elements
+    button = ButtonElement(text=MarkdownTextObject(text="Go"), action_id="go")
+    stop_buttons = [
+        ButtonElement(text=PlainTextObject(text="Stop"), action_id=f"stop-{index}")
+        for index in range(5)
+    ]
+    return ActionsBlock(elements=[button] + stop_buttons)
+
+
+def test_validation_mode():
+    assert get_validation_mode() == VALIDATION_EAGER
+    with validation_mode(VALIDATION_OFF):
+        assert get_validation_mode() == VALIDATION_OFF
+        with validation_mode(VALIDATION_DEFERRED):
+            assert get_validation_mode() == VALIDATION_DEFERRED
+        assert get_validation_mode() == VALIDATION_OFF
+    assert get_validation_mode() == VALIDATION_EAGER
+
+    set_validation_mode(VALIDATION_OFF)
+    try:
+        assert get_validation_mode() == VALIDATION_OFF
+    finally:
+        set_validation_mode(VALIDATION_EAGER)
+
+    with pytest.raises(AttributeError):
+        set_validation_mode("lazy")
+
+
+def test_validation_mode_per_thread():
+    modes = []
+    thread = threading.Thread(target=lambda: modes.append(get_validation_mode()))
+    with validation_mode(VALIDATION_OFF):
+        thread.start()
+        thread.join()
+    # other threads use the global mode
+    assert modes == [VALIDATION_EAGER]
+
+
+def test_eager_validation():
+    with pytest.raises(AttributeError):
+        SectionBlock(text=PlainTextObject(text="x" * 3001))
+    with pytest.raises(AttributeError):
+        _get_invalid_actions_block()
+
+
+def test_validation_off():
+    with validation_mode(VALIDATION_OFF):
+        section = SectionBlock(text=PlainTextObject(text="x" * 3001))
+    assert section.render()["text"]["text"] == "x" * 3001
+    assert get_blocks(section)[0]["type"] == "section"
+
+
+def test_deferred_validation():
+    with validation_mode(VALIDATION_DEFERRED):
+        actions = _get_invalid_actions_block()
+        section = SectionBlock(text=PlainTextObject(text="x" * 3001))
+        valid = SectionBlock(text=PlainTextObject(text="Valid"))
+
+    # every error in the blocks is reported at once
+    with pytest.raises(ValidationError) as error:
+        get_blocks(valid, actions, section)
+    assert error.value.errors == [
+        "blocks[1].elements: cannot have more than 5 items, but has 6",
+        "blocks[1].elements[0].text: must be plain_text, but is mrkdwn",
+        "blocks[2].text: text cannot be greater than 3000 characters, but is 3001",
+    ]
+
+    # invalid blocks stay invalid, while valid blocks are not validated again
+    with pytest.raises(ValidationError):
+        section.render()
+    with pytest.raises(ValidationError):
+        get_blocks_json(actions)
+    assert valid.render()["text"]["text"] == "Valid"
+
+
+def test_deferred_view_validation(section_block: SectionBlock):
+    with validation_mode(VALIDATION_DEFERRED):
+        view = ModalViewPayload(
+            title=PlainTextObject(text="A title that is far too long"),
+            blocks=[
+                section_block,
+                SectionBlock(text=MarkdownTextObject(text="x" * 3001)),
+            ],
+        )
+
+    for render in (view.render, view.render_json, lambda: list(view.iter_json())):
+        with pytest.raises(ValidationError) as error:
+            render()
+        assert error.value.errors == [
+            "view.title: text cannot be greater than 24 characters, but is 28",
+            "view.blocks[1].text: text cannot be greater than 3000 characters, but is 3001",
+        ]
@@ -0,0 +1,111 @@
+"""
+Test view payloads.
+"""
+import json
+
+import pytest
+
+from slack_blockkit.block import RenderStats, render_stats
+from slack_blockkit.composition_object import MarkdownTextObject, PlainTextObject
+from slack_blockkit.layout_block import DividerBlock, SectionBlock
+from slack_blockkit.utils import get_blocks, validate_blocks
+from slack_blockkit.view_payload import ModalViewPayload, ViewPayload
+
+
+def test_view_payload(view_payload: ViewPayload):
+    assert view_payload.render() == {
+        "type": ViewPayload.BTYPE_HOME,
+        "blocks": view_payload.blocks,
+        "close": view_payload.close.render(),
+        "clear_on_close": False,
+        "notify_on_close": False,
+    }
+
+
+def test_view_payload_json(section_block, divider_block):
+    view = ModalViewPayload(
+        title=PlainTextObject(text="Modal"),
+        blocks=[section_block, divider_block],
+        submit=PlainTextObject(text="Submit"),
+        private_metadata="metadata",
+    )
+    rendered = view.render()
+    assert rendered["blocks"] == get_blocks(*view.blocks)
+    assert view.render_json() == json.dumps(rendered)
+    assert "".join(view.iter_json()) == view.render_json()
+
+
+def test_modal_requires_title():
+    with pytest.raises(AttributeError, match="ModalViewPayload.title: is required"):
+        ModalViewPayload(title=None, blocks=[])
+    with pytest.raises(AttributeError, match=r"blocks\[0\].title: is required"):
+        validate_blocks({"type": "modal", "blocks": []})
+
+
+def test_view_payload_strict(section_block, divider_block):
+    view = ModalViewPayload(
+        title=PlainTextObject(text="Modal"), blocks=[section_block, divider_block]
+    )
+    assert view.render(strict=True) == view.render()
+
+    view.blocks.append("divider")
+    assert view.render()["blocks"][-1] == "divider"
+    with pytest.raises(AttributeError, match=r"view blocks\[2\] cannot be rendered"):
+        view.render(strict=True)
+
+    view.blocks.pop()
+    view.private_metadata = {"ticket": "BK-1"}
+    with pytest.raises(
+        AttributeError, match="view private_metadata cannot be rendered"
+    ):
+        view.render(strict=True)
+
+
+def _get_ticket_view() -> ModalViewPayload:
+    return ModalViewPayload(
+        title=PlainTextObject(text="Tickets"),
+        blocks=[
+            SectionBlock(text=MarkdownTextObject(text=f"*BK-{index}*"))
+            for index in range(10)
+        ],
+    )
+
+
+def test_memoized_view():
+    view = _get_ticket_view().memoize()
+    assert view.is_memoized() and view.blocks[0].is_memoized()
+    expected = view.render()
+    assert expected["blocks"] == get_blocks(*view.blocks)
+    assert view.render_json() == json.dumps(expected)
+
+    # only the changed block, and the text within it, are rendered again
+    view.blocks[3].text = MarkdownTextObject(text="*BK-3* closed")
+    with render_stats() as stats:
+        rendered = view.render()
+    assert (stats.rendered, stats.reused) == (2, 10)
+    assert rendered["blocks"][3]["text"]["text"] == "*BK-3* closed"
+    assert rendered["blocks"][4] == expected["blocks"][4]
+
+    # the JSON of unchanged blocks is reused as well, and blocks added later are memoized
+    view.blocks.append(DividerBlock())
+    with render_stats() as stats:
+        rendered_json = view.render_json()
+    assert (stats.rendered, stats.reused) == (1, 11)
+    assert rendered_json == json.dumps(view.render())
+    assert view.blocks[-1].is_memoized()
+
+    # as are blocks added before the view is next streamed
+    view.blocks.append(DividerBlock())
+    chunks = list(view.iter_json())
+    assert view.blocks[-1].is_memoized()
+    assert "".join(chunks) == json.dumps(view.render())
+
+
+def test_render_stats_accumulate():
+    view = _get_ticket_view().memoize(read_only=True)
+    totals = RenderStats()
+    for _ in range(3):
+        with render_stats(totals):
+            view.render_json()
+    assert (totals.rendered, totals.reused) == (21, 22)
+    assert view.render()["blocks"][0] is view.render()["blocks"][0]